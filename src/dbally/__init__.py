@@ -19,7 +19,7 @@ from .embeddings.exceptions import (
     EmbeddingResponseError,
     EmbeddingStatusError,
 )
-from .exceptions import DbAllyError
+from .exceptions import DbAllyError, RequestTimeoutError
 from .llms.clients.exceptions import LLMConnectionError, LLMError, LLMResponseError, LLMStatusError
 
 if TYPE_CHECKING:
@@ -48,6 +48,7 @@ __all__ = [
     "NotGiven",
     "NOT_GIVEN",
     "NoViewFoundError",
+    "RequestTimeoutError",
     "SqlAlchemyBaseView",
 ]
 
@@ -7,7 +7,7 @@ from dbally.view_selection import LLMViewSelector
 from dbally.view_selection.base import ViewSelector
 
 if TYPE_CHECKING:
-    from dbally.collection import Collection
+    from dbally.collection import Collection, CollectionConfig
 
 
 def create_collection(
@@ -16,6 +16,7 @@ def create_collection(
     event_handlers: Optional[List[EventHandler]] = None,
     view_selector: Optional[ViewSelector] = None,
     nl_responder: Optional[NLResponder] = None,
+    config: Optional["CollectionConfig"] = None,
 ) -> "Collection":
     """
     Create a new [Collection](collection.md) that is a container for registering views and the\
@@ -47,6 +48,8 @@ def create_collection(
         will be used.
         nl_responder: NL responder used by the collection to respond to natural language queries. If None,\
         a new instance of [NLResponder][dbally.nl_responder.nl_responder.NLResponder] will be used.
+        config: Optional features of the collection, see [CollectionConfig][dbally.collection.config.CollectionConfig].\
+        If None, all of them are disabled.
 
     Returns:
         New instance of db-ally Collection.
@@ -65,4 +68,5 @@ def create_collection(
         view_selector=view_selector,
         llm=llm,
         event_handlers=event_handlers,
+        config=config,
     )
@@ -14,6 +14,7 @@ except ImportError:
 
 from dbally.audit.event_handlers.base import EventHandler
 from dbally.audit.events import Event, FallbackEvent, LLMEvent, RequestEnd, RequestStart, SimilarityEvent
+from dbally.collection.results import RowStream
 
 _RICH_FORMATING_KEYWORD_SET = {"green", "orange", "grey", "bold", "cyan"}
 _RICH_FORMATING_PATTERN = rf"\[.*({'|'.join(_RICH_FORMATING_KEYWORD_SET)}).*\]"
@@ -137,7 +138,10 @@ class CLIEventHandler(EventHandler):
         """
         if output.result:
             self._print_syntax("[green bold]REQUEST OUTPUT:")
-            self._print_syntax(f"Number of rows: {len(output.result.results)}")
+            if isinstance(output.result.results, RowStream):
+                self._print_syntax("Rows are streamed")
+            else:
+                self._print_syntax(f"Number of rows: {len(output.result.results)}")
 
             if "sql" in output.result.context:
                 self._print_syntax(f"{output.result.context['sql']}", "psql")
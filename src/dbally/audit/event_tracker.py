@@ -1,9 +1,15 @@
-from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, List, Optional
+import asyncio
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Awaitable, Dict, Iterator, List, Optional, TypeVar
 
 from dbally.audit.event_handlers.base import EventHandler
 from dbally.audit.events import Event, RequestEnd, RequestStart
 from dbally.audit.spans import EventSpan
+from dbally.collection.results import TimingBreakdown
+from dbally.exceptions import RequestTimeoutError
+
+T = TypeVar("T")
 
 
 class EventTracker:
@@ -13,17 +19,28 @@ class EventTracker:
     _handlers: List[EventHandler]
     _request_contexts: Dict[EventHandler, Optional[dict]]
 
-    def __init__(self) -> None:
+    def __init__(self, timings: Optional[TimingBreakdown] = None, deadline: Optional[float] = None) -> None:
+        """
+        Args:
+            timings: Breakdown recording the latency of the pipeline stages. If None, the stages are not timed.
+            deadline: Point in time, as returned by `time.monotonic`, by which the request has to be answered.\
+                If None, the request has no deadline.
+        """
         self._handlers = []
         self._request_contexts = {}
+        self.timings = timings
+        self.deadline = deadline
 
     @classmethod
-    def initialize_with_handlers(cls, event_handlers: List[EventHandler]) -> "EventTracker":
+    def initialize_with_handlers(
+        cls, event_handlers: List[EventHandler], timings: Optional[TimingBreakdown] = None
+    ) -> "EventTracker":
         """
         Initialize the event store with a list of event handlers.
 
         Args:
             event_handlers: List of event handlers.
+            timings: Breakdown recording the latency of the pipeline stages. If None, the stages are not timed.
 
         Returns:
             The initialized event store.
@@ -32,7 +49,7 @@ class EventTracker:
             ValueError: if invalid event handler object is passed as argument.
         """
 
-        instance = cls()
+        instance = cls(timings)
 
         for handler in event_handlers:
             if not isinstance(handler, EventHandler):
@@ -73,6 +90,88 @@ class EventTracker:
 
         self._handlers.append(event_handler)
 
+    def set_timeout(self, timeout: float) -> None:
+        """
+        Sets the deadline of the request to `timeout` seconds from now, unless it already has an earlier deadline.
+
+        Args:
+            timeout: Time budget of the request, in seconds.
+        """
+        deadline = time.monotonic() + timeout
+        if self.deadline is None or deadline < self.deadline:
+            self.deadline = deadline
+
+    def remaining_time(self) -> Optional[float]:
+        """
+        Computes the time budget left before the deadline of the request.
+
+        Returns:
+            Remaining time in seconds, or None if the request has no deadline.
+        """
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def check_deadline(self) -> None:
+        """
+        Checks that the deadline of the request has not passed yet.
+
+        Raises:
+            RequestTimeoutError: if the deadline has passed.
+        """
+        remaining_time = self.remaining_time()
+        if remaining_time is not None and remaining_time <= 0:
+            raise RequestTimeoutError()
+
+    async def within_deadline(self, awaitable: Awaitable[T]) -> T:
+        """
+        Awaits the given awaitable, cancelling it if the deadline of the request passes first.
+
+        Args:
+            awaitable: The awaitable to be run within the remaining time budget.
+
+        Returns:
+            The result of the awaitable.
+
+        Raises:
+            RequestTimeoutError: if the deadline passed before the awaitable completed.
+        """
+        remaining_time = self.remaining_time()
+        if remaining_time is None:
+            return await awaitable
+
+        try:
+            self.check_deadline()
+            return await asyncio.wait_for(awaitable, timeout=remaining_time)
+        except asyncio.TimeoutError as exc:
+            raise RequestTimeoutError() from exc
+        finally:
+            # an awaitable skipped because of the passed deadline is never awaited
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+
+    @contextmanager
+    def measure(self, stage: str, attempt: int = 0) -> Iterator[None]:
+        """
+        Context manager timing a pipeline stage, if the tracker records the timings.
+
+        Args:
+            stage: Name of the pipeline stage.
+            attempt: Number of the attempt, 0 for the first one and greater for the retries.
+
+        Yields:
+            Nothing, the duration is recorded when the context exits.
+        """
+        if self.timings is None:
+            yield
+            return
+
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings.record(stage, time.perf_counter() - start_time, attempt)
+
     @asynccontextmanager
     async def track_event(self, event: Event) -> AsyncIterator[EventSpan]:
         """
@@ -0,0 +1,11 @@
+from .base import Cache
+from .memory import InMemoryCache
+from .semantic import SemanticCache
+from .sqlite import SQLiteCache
+
+__all__ = [
+    "Cache",
+    "InMemoryCache",
+    "SemanticCache",
+    "SQLiteCache",
+]
@@ -0,0 +1,104 @@
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalizes the text to be used as a part of the cache key, so that questions differing only in letter case
+    or whitespace share the same cache entry.
+
+    Args:
+        text: Text to normalize.
+
+    Returns:
+        Lowercased text with whitespace sequences replaced by a single space.
+    """
+    return " ".join(text.lower().split())
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Creates a stable cache key from the given parts.
+
+    Args:
+        parts: JSON-serializable parts of the key. Other objects are represented by their `repr`.
+
+    Returns:
+        Hex digest identifying the given parts.
+    """
+    serialized = json.dumps(parts, sort_keys=True, default=repr)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class Cache(ABC):
+    """
+    Base class for all cache backends used by db-ally to store results of expensive operations.
+    """
+
+    def __init__(self, ttl: Optional[float] = None) -> None:
+        """
+        Args:
+            ttl: Default time to live of the cache entries in seconds. If None, entries never expire.
+        """
+        self.ttl = ttl
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieves the value stored under the given key.
+
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            The stored value or None if there is no entry for the key or it has expired.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores the value under the given key, replacing the previous entry.
+
+        Args:
+            key: Key of the entry.
+            value: Value to store.
+            ttl: Time to live of the entry in seconds, overriding the default one.
+        """
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Removes the entry stored under the given key, if any.
+
+        Args:
+            key: Key of the entry.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+
+    def _resolve_ttl(self, ttl: Optional[float]) -> Optional[float]:
+        """
+        Returns the time to live of the new entry.
+
+        Args:
+            ttl: Time to live requested for the entry.
+
+        Returns:
+            The requested time to live or the default one if not requested.
+        """
+        return ttl if ttl is not None else self.ttl
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the cache.
+
+        Returns:
+            str: The string representation of the cache.
+        """
+        return f"{self.__class__.__name__}(ttl={self.ttl})"
@@ -0,0 +1,91 @@
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from dbally.cache.base import Cache
+
+
+class InMemoryCache(Cache):
+    """
+    Cache keeping the entries in the process memory, evicting the least recently used ones when full.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None) -> None:
+        """
+        Args:
+            max_size: Maximum number of entries kept in the cache.
+            ttl: Default time to live of the cache entries in seconds. If None, entries never expire.
+
+        Raises:
+            ValueError: If `max_size` is lower than 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer")
+
+        super().__init__(ttl)
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieves the value stored under the given key and marks it as recently used.
+
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            The stored value or None if there is no entry for the key or it has expired.
+        """
+        if key not in self._entries:
+            return None
+
+        value, expires_at = self._entries[key]
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores the value under the given key, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key: Key of the entry.
+            value: Value to store.
+            ttl: Time to live of the entry in seconds, overriding the default one.
+        """
+        ttl = self._resolve_ttl(ttl)
+        self._entries[key] = (value, time.monotonic() + ttl if ttl is not None else None)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        """
+        Removes the entry stored under the given key, if any.
+
+        Args:
+            key: Key of the entry.
+        """
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+        self._entries.clear()
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the InMemoryCache.
+
+        Returns:
+            str: The string representation of the InMemoryCache.
+        """
+        return f"{self.__class__.__name__}(max_size={self.max_size}, ttl={self.ttl})"
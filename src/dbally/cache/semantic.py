@@ -0,0 +1,238 @@
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+from dbally.audit.event_tracker import EventTracker
+from dbally.cache.base import make_cache_key, normalize_text
+from dbally.embeddings.base import EmbeddingClient
+from dbally.embeddings.exceptions import EmbeddingError
+from dbally.embeddings.utils import normalize_embedding
+
+_LITERAL_PATTERN = re.compile(r"\"[^\"]*\"|'[^']*'|\d+(?:[.,]\d+)*|\w*[A-Z]\w*")
+
+
+def extract_literals(question: str) -> FrozenSet[str]:
+    """
+    Extracts the literal values of the question, like numbers, quoted strings and capitalized names.\
+    The first word of the question is skipped, as it is capitalized regardless of its meaning.
+
+    Args:
+        question: Question asked in the natural language.
+
+    Returns:
+        Lowercased literal values found in the question.
+    """
+    words = question.strip().split(maxsplit=1)
+    text = words[1] if len(words) > 1 else ""
+    first_word_literals = re.findall(r"\d+(?:[.,]\d+)*", words[0]) if words else []
+    literals = [*first_word_literals, *_LITERAL_PATTERN.findall(text)]
+    return frozenset(literal.strip("\"'").lower() for literal in literals)
+
+
+@dataclass
+class _SemanticEntry:
+    namespace: str
+    embedding: np.ndarray
+    literals: FrozenSet[str]
+    value: Any
+    expires_at: Optional[float]
+
+
+class SemanticCache:
+    """
+    Cache matching the questions by meaning instead of the exact text, so that paraphrases like "show devs in Berlin"\
+    and "developers located in Berlin" share the same entry.
+
+    Questions are embedded, and an entry is reused when the cosine similarity of its question to the asked one\
+    reaches `threshold` and both questions mention the same literal values, like names and numbers. Entries are kept\
+    in the process memory, evicting the least recently used ones when full.
+    """
+
+    def __init__(
+        self,
+        embedding_client: EmbeddingClient,
+        threshold: float = 0.9,
+        max_size: int = 1024,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            embedding_client: Client used to embed the questions.
+            threshold: Minimal cosine similarity of the questions sharing an entry.
+            max_size: Maximum number of entries kept in the cache.
+            ttl: Default time to live of the cache entries in seconds. If None, entries never expire.
+
+        Raises:
+            ValueError: If `max_size` is lower than 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer")
+
+        self.embedding_client = embedding_client
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, _SemanticEntry]" = OrderedDict()
+        self._embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(
+        self,
+        question: str,
+        namespace: str = "",
+        event_tracker: Optional[EventTracker] = None,
+    ) -> Optional[Any]:
+        """
+        Retrieves the value stored for the most similar question and marks it as recently used.
+
+        Args:
+            question: Question asked in the natural language.
+            namespace: Namespace of the entry, e.g. identifying the views able to answer the question.\
+            Only entries from the same namespace are matched.
+            event_tracker: Event tracker bounding the embedding call by the request deadline.
+
+        Returns:
+            The value stored for the most similar question, or None if no stored question is similar enough\
+            or the question cannot be embedded.
+        """
+        candidates = self._candidates(namespace, extract_literals(question))
+        if not candidates:
+            return None
+
+        try:
+            embedding = await self._embed(question, event_tracker)
+        except EmbeddingError as exc:
+            logging.warning("Failed to embed the question, skipping the semantic cache lookup: %s", exc)
+            return None
+
+        similarities = np.stack([entry.embedding for _, entry in candidates]) @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+
+        key, entry = candidates[best]
+        self._entries.move_to_end(key)
+        return entry.value
+
+    async def set(
+        self,
+        question: str,
+        value: Any,
+        namespace: str = "",
+        ttl: Optional[float] = None,
+        event_tracker: Optional[EventTracker] = None,
+    ) -> None:
+        """
+        Stores the value for the question, evicting the least recently used entry if the cache is full.\
+        The value is not stored if the question cannot be embedded.
+
+        Args:
+            question: Question asked in the natural language.
+            value: Value to store.
+            namespace: Namespace of the entry.
+            ttl: Time to live of the entry in seconds, overriding the default one.
+            event_tracker: Event tracker bounding the embedding call by the request deadline.
+        """
+        try:
+            embedding = await self._embed(question, event_tracker)
+        except EmbeddingError as exc:
+            logging.warning("Failed to embed the question, skipping the semantic cache update: %s", exc)
+            return
+
+        ttl = ttl if ttl is not None else self.ttl
+        key = make_cache_key(namespace, normalize_text(question))
+        self._entries[key] = _SemanticEntry(
+            namespace=namespace,
+            embedding=embedding,
+            literals=extract_literals(question),
+            value=value,
+            expires_at=time.monotonic() + ttl if ttl is not None else None,
+        )
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, question: str, namespace: str = "") -> None:
+        """
+        Removes the entry stored for the question, along with its memoized embedding, so that the question no longer\
+        matches it.
+
+        Args:
+            question: Question asked in the natural language.
+            namespace: Namespace of the entry.
+        """
+        self._entries.pop(make_cache_key(namespace, normalize_text(question)), None)
+        self._embeddings.pop(normalize_text(question), None)
+
+    async def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+        self._entries.clear()
+        self._embeddings.clear()
+
+    def _candidates(self, namespace: str, literals: FrozenSet[str]) -> List[Tuple[str, _SemanticEntry]]:
+        """
+        Lists the live entries of the namespace mentioning the same literal values, removing the expired ones.
+
+        Args:
+            namespace: Namespace of the entries.
+            literals: Literal values of the question.
+
+        Returns:
+            Keys and entries that may be reused for the question.
+        """
+        now = time.monotonic()
+        expired = [
+            key for key, entry in self._entries.items() if entry.expires_at is not None and entry.expires_at <= now
+        ]
+        for key in expired:
+            del self._entries[key]
+
+        return [
+            (key, entry)
+            for key, entry in self._entries.items()
+            if entry.namespace == namespace and entry.literals == literals
+        ]
+
+    async def _embed(self, question: str, event_tracker: Optional[EventTracker]) -> np.ndarray:
+        """
+        Embeds the question, reusing the embeddings of the recently seen questions.
+
+        Args:
+            question: Question asked in the natural language.
+            event_tracker: Event tracker bounding the embedding call by the request deadline.
+
+        Returns:
+            Embedding of the question scaled to unit length.
+        """
+        normalized_question = normalize_text(question)
+        if normalized_question in self._embeddings:
+            self._embeddings.move_to_end(normalized_question)
+            return self._embeddings[normalized_question]
+
+        event_tracker = event_tracker or EventTracker()
+        embeddings = await event_tracker.within_deadline(self.embedding_client.get_embeddings([question]))
+        embedding = normalize_embedding(embeddings[0])
+
+        self._embeddings[normalized_question] = embedding
+        while len(self._embeddings) > self.max_size:
+            self._embeddings.popitem(last=False)
+        return embedding
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the cache.
+
+        Returns:
+            str: The string representation of the cache.
+        """
+        return f"{self.__class__.__name__}(threshold={self.threshold}, ttl={self.ttl})"
@@ -0,0 +1,142 @@
+import asyncio
+import pickle  # nosec
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar, Union
+
+from dbally.cache.base import Cache
+
+T = TypeVar("T")
+
+
+class SQLiteCache(Cache):
+    """
+    Cache persisting the entries in a SQLite database on disk, so that they survive process restarts and can be\
+    shared between processes running on the same machine.
+
+    Values are serialized with `pickle`, so the database file should be writable only by trusted processes.
+    The database is accessed in the default executor of the event loop, so that the disk I/O does not block it.
+    """
+
+    def __init__(self, path: Union[str, Path], ttl: Optional[float] = None, table_name: str = "dbally_cache") -> None:
+        """
+        Args:
+            path: Path to the SQLite database file. It will be created if it does not exist.
+            ttl: Default time to live of the cache entries in seconds. If None, entries never expire.
+            table_name: Name of the table storing the entries.
+
+        Raises:
+            ValueError: If `table_name` is not a valid identifier.
+        """
+        if not table_name.isidentifier():
+            raise ValueError(f"Invalid table name: {table_name}")
+
+        super().__init__(ttl)
+        self.path = Path(path)
+        self.table_name = table_name
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} "  # nosec
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+            )
+
+    def _connect(self) -> "closing[sqlite3.Connection]":
+        return closing(sqlite3.connect(self.path, isolation_level=None))
+
+    @staticmethod
+    async def _run(function: Callable[..., T], *args: Any) -> T:
+        """
+        Runs the blocking database operation in the default executor.
+
+        Args:
+            function: Operation to run.
+            *args: Arguments of the operation.
+
+        Returns:
+            The result of the operation.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieves the value stored under the given key.
+
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            The stored value or None if there is no entry for the key or it has expired.
+        """
+        return await self._run(self._get, key)
+
+    def _get(self, key: str) -> Optional[Any]:
+        with self._connect() as connection:
+            row = connection.execute(
+                f"SELECT value, expires_at FROM {self.table_name} WHERE key = ?", (key,)  # nosec
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))  # nosec
+                return None
+
+        return pickle.loads(value)  # nosec
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores the value under the given key, replacing the previous entry.
+
+        Args:
+            key: Key of the entry.
+            value: Value to store, it has to be picklable.
+            ttl: Time to live of the entry in seconds, overriding the default one.
+        """
+        ttl = self._resolve_ttl(ttl)
+        expires_at = time.time() + ttl if ttl is not None else None
+        await self._run(self._set, key, pickle.dumps(value), expires_at)
+
+    def _set(self, key: str, value: bytes, expires_at: Optional[float]) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, value, expires_at) VALUES (?, ?, ?)",  # nosec
+                (key, value, expires_at),
+            )
+
+    async def delete(self, key: str) -> None:
+        """
+        Removes the entry stored under the given key, if any.
+
+        Args:
+            key: Key of the entry.
+        """
+        await self._run(self._delete, key)
+
+    def _delete(self, key: str) -> None:
+        with self._connect() as connection:
+            connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))  # nosec
+
+    async def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+        await self._run(self._clear)
+
+    def _clear(self) -> None:
+        with self._connect() as connection:
+            connection.execute(f"DELETE FROM {self.table_name}")  # nosec
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the SQLiteCache.
+
+        Returns:
+            str: The string representation of the SQLiteCache.
+        """
+        return f"{self.__class__.__name__}(path={self.path}, ttl={self.ttl})"
@@ -1,11 +1,32 @@
 from dbally.collection.collection import Collection
-from dbally.collection.exceptions import IndexUpdateError, NoViewFoundError
+from dbally.collection.config import (
+    AdmissionConfig,
+    AnswerCacheConfig,
+    CollectionConfig,
+    HedgingConfig,
+    NegativeCacheConfig,
+    ViewSelectionConfig,
+)
+from dbally.collection.exceptions import (
+    CollectionOverloadedError,
+    IndexUpdateError,
+    KnownFailureError,
+    NoViewFoundError,
+)
 from dbally.collection.results import ExecutionResult, ViewExecutionResult
 
 __all__ = [
     "Collection",
+    "CollectionConfig",
+    "AdmissionConfig",
+    "AnswerCacheConfig",
+    "HedgingConfig",
+    "NegativeCacheConfig",
+    "ViewSelectionConfig",
     "ExecutionResult",
     "ViewExecutionResult",
     "NoViewFoundError",
     "IndexUpdateError",
+    "CollectionOverloadedError",
+    "KnownFailureError",
 ]
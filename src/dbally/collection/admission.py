@@ -0,0 +1,181 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Tuple
+
+from dbally.collection.exceptions import CollectionOverloadedError
+
+
+@dataclass
+class AdmissionStats:
+    """
+    Metrics of the admission control of a collection.
+
+    Args:
+        in_flight: Number of requests being processed at the moment.
+        queue_depth: Number of requests waiting for a free slot at the moment.
+        max_queue_depth: Highest number of requests that waited for a free slot at the same time.
+        admitted: Total number of admitted requests.
+        rejected: Total number of requests rejected because the wait queue was full.
+        total_wait_time: Total time the admitted requests spent in the wait queue, in seconds.
+        max_wait_time: Longest time a request spent in the wait queue, in seconds.
+    """
+
+    in_flight: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    admitted: int = 0
+    rejected: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+
+@dataclass
+class _Waiter:
+    priority: int
+    enqueued_at: float
+    future: asyncio.Future
+
+
+class AdmissionController:
+    """
+    Limits the number of requests processed by a collection at the same time.
+
+    Requests exceeding the limit wait in a bounded queue for a free slot. Once the queue is full, new requests
+    are rejected immediately, so that the overflow fails fast instead of slowing down all the requests.
+
+    Free slots are given to the waiting request with the highest priority. The priority of a waiting request
+    grows by one every `priority_aging` seconds, so that requests with low priority are not starved.
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        max_concurrency: int,
+        max_queue_size: int = 0,
+        priority_aging: float = 10.0,
+    ) -> None:
+        """
+        Args:
+            collection_name: Name of the collection, reported in the errors.
+            max_concurrency: Maximum number of requests processed at the same time.
+            max_queue_size: Maximum number of requests waiting for a free slot.
+            priority_aging: Time in seconds after which the priority of a waiting request grows by one.
+
+        Raises:
+            ValueError: if `max_concurrency` is lower than 1, `max_queue_size` is negative or `priority_aging`\
+            is not positive.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+        if max_queue_size < 0:
+            raise ValueError("max_queue_size must be a non-negative integer")
+        if priority_aging <= 0:
+            raise ValueError("priority_aging must be positive")
+
+        self.collection_name = collection_name
+        self.max_concurrency = max_concurrency
+        self.max_queue_size = max_queue_size
+        self.priority_aging = priority_aging
+        self._waiters: List[_Waiter] = []
+        self._stats = AdmissionStats()
+
+    @property
+    def stats(self) -> AdmissionStats:
+        """
+        Returns a snapshot of the admission metrics.
+
+        Returns:
+            Current admission metrics.
+        """
+        return AdmissionStats(**vars(self._stats))
+
+    @asynccontextmanager
+    async def admit(self, priority: int = 0) -> AsyncIterator[float]:
+        """
+        Context manager holding a request slot, waiting in the queue for a free one if needed.
+
+        Args:
+            priority: Priority of the request. Requests with higher priority get free slots first.
+
+        Yields:
+            Time the request spent in the wait queue, in seconds.
+
+        Raises:
+            CollectionOverloadedError: if there is no free slot and the wait queue is full.
+        """
+        stats = self._stats
+        wait_time = 0.0
+
+        if stats.in_flight < self.max_concurrency and not self._waiters:
+            stats.in_flight += 1
+        else:
+            if len(self._waiters) >= self.max_queue_size:
+                stats.rejected += 1
+                raise CollectionOverloadedError(self.collection_name)
+            wait_time = await self._wait(priority)
+
+        stats.admitted += 1
+        stats.total_wait_time += wait_time
+        stats.max_wait_time = max(stats.max_wait_time, wait_time)
+        try:
+            yield wait_time
+        finally:
+            self._release()
+
+    async def _wait(self, priority: int) -> float:
+        """
+        Waits in the queue until a slot is handed over to the request.
+
+        Args:
+            priority: Priority of the request.
+
+        Returns:
+            Time the request spent in the wait queue, in seconds.
+        """
+        waiter = _Waiter(priority, time.perf_counter(), asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        self._stats.queue_depth = len(self._waiters)
+        self._stats.max_queue_depth = max(self._stats.max_queue_depth, self._stats.queue_depth)
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self._stats.queue_depth = len(self._waiters)
+            elif waiter.future.done() and not waiter.future.cancelled():
+                # the slot was handed over right before the cancellation
+                self._release()
+            raise
+
+        return time.perf_counter() - waiter.enqueued_at
+
+    def _release(self) -> None:
+        """
+        Hands the slot over to the most urgent waiting request or frees it if no request is waiting.
+        """
+        while self._waiters:
+            now = time.perf_counter()
+            waiter = max(self._waiters, key=lambda waiter: self._urgency(waiter, now))
+            self._waiters.remove(waiter)
+            self._stats.queue_depth = len(self._waiters)
+            # the future of a request cancelled while waiting is already done
+            if not waiter.future.done():
+                waiter.future.set_result(None)
+                return
+        self._stats.in_flight -= 1
+
+    def _urgency(self, waiter: _Waiter, now: float) -> Tuple[float, float]:
+        """
+        Computes the urgency of the waiting request, taking into account its priority and the time it waited.
+
+        Args:
+            waiter: The waiting request.
+            now: Current time, as returned by `time.perf_counter`.
+
+        Returns:
+            Aged priority of the request and the negated time of its enqueueing, which breaks ties in FIFO order.
+        """
+        return waiter.priority + (now - waiter.enqueued_at) / self.priority_aging, -waiter.enqueued_at
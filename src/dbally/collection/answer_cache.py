@@ -0,0 +1,150 @@
+import logging
+from typing import Any, Dict, Optional
+
+from dbally.audit.event_tracker import EventTracker
+from dbally.cache.base import make_cache_key, normalize_text
+from dbally.collection.config import AnswerCacheConfig
+from dbally.collection.results import CachedExecutionResult, ExecutionResult
+from dbally.exceptions import RequestTimeoutError
+
+# context entries needed to replay the query: the IQL of the structured views, the SQL of the text2sql views
+REPLAY_CONTEXT_KEYS = ("iql", "sql", "parameters")
+
+
+class AnswerCache:
+    """
+    Stores the answers to the questions asked to a collection, looked up by the normalized question or, with\
+    a semantic cache, by a previously answered question similar in meaning.
+
+    Failures of the caches, like an unavailable backend or embedding API, are logged and treated as cache misses,\
+    so they never fail the question. Only the generated query is kept from the context of the answer, so large\
+    entries like the filter masks of the DataFrame views are not stored.
+    """
+
+    def __init__(self, collection_name: str, config: AnswerCacheConfig) -> None:
+        """
+        Args:
+            collection_name: Name of the collection, reported in the logs.
+            config: Settings of the answer cache.
+        """
+        self.collection_name = collection_name
+        self.config = config
+
+    @staticmethod
+    def _key(question: str, namespace: str) -> str:
+        """
+        Creates the key of the cached answer to the question.
+
+        Args:
+            question: The question to be answered.
+            namespace: Namespace of the cached answers.
+
+        Returns:
+            The cache key.
+        """
+        return make_cache_key(normalize_text(question), namespace)
+
+    @staticmethod
+    def _replay_context(result: ExecutionResult) -> Dict[str, Any]:
+        """
+        Extracts the part of the context of the answer needed to replay its query.
+
+        Args:
+            result: The answer to store.
+
+        Returns:
+            The context entries listed in `REPLAY_CONTEXT_KEYS`.
+        """
+        return {key: result.context[key] for key in REPLAY_CONTEXT_KEYS if key in result.context}
+
+    async def get(self, question: str, namespace: str, event_tracker: EventTracker) -> Optional[CachedExecutionResult]:
+        """
+        Looks the answer to the question up in the cache and, if not found, in the semantic cache.
+
+        Args:
+            question: The question to be answered.
+            namespace: Namespace of the cached answers.
+            event_tracker: The event tracker bounding the embedding call by the request deadline.
+
+        Returns:
+            The cached answer, or None if the question was not answered before.
+
+        Raises:
+            RequestTimeoutError: If the deadline of the request passed during the lookup.
+        """
+        cache, semantic_cache = self.config.cache, self.config.semantic_cache
+        try:
+            cached_result = await cache.get(self._key(question, namespace)) if cache is not None else None
+            if cached_result is None and semantic_cache is not None:
+                cached_result = await semantic_cache.get(question, namespace, event_tracker)
+        except RequestTimeoutError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.warning("Failed to look up the answer cache of collection %s: %s", self.collection_name, exc)
+            return None
+        return cached_result
+
+    async def set(
+        self, question: str, namespace: str, result: ExecutionResult, dry_run: bool, event_tracker: EventTracker
+    ) -> None:
+        """
+        Stores the answer to the question in the caches.
+
+        Args:
+            question: The question to be answered.
+            namespace: Namespace of the cached answers.
+            result: The answer to store.
+            dry_run: If True, the query was only generated, so its results are not cached.
+            event_tracker: The event tracker bounding the embedding call by the request deadline.
+
+        Raises:
+            RequestTimeoutError: If the deadline of the request passed while storing the answer.
+        """
+        cache, semantic_cache = self.config.cache, self.config.semantic_cache
+        try:
+            if semantic_cache is not None:
+                await semantic_cache.set(
+                    question,
+                    CachedExecutionResult(view_name=result.view_name, context=self._replay_context(result)),
+                    namespace=namespace,
+                    event_tracker=event_tracker,
+                )
+
+            if cache is not None:
+                cache_results = self.config.cache_results and not dry_run and isinstance(result.results, list)
+                await cache.set(
+                    self._key(question, namespace),
+                    CachedExecutionResult(
+                        view_name=result.view_name,
+                        context=self._replay_context(result),
+                        results=list(result.results) if cache_results else None,
+                        textual_response=result.textual_response if cache_results else None,
+                    ),
+                    ttl=self.config.ttl,
+                )
+        except RequestTimeoutError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.warning("Failed to update the answer cache of collection %s: %s", self.collection_name, exc)
+
+    async def delete(self, question: str, namespace: str) -> None:
+        """
+        Removes the cached answer to the question.
+
+        Args:
+            question: The question which answer should be removed.
+            namespace: Namespace of the cached answers.
+        """
+        if self.config.semantic_cache is not None:
+            await self.config.semantic_cache.delete(question, namespace)
+        if self.config.cache is not None:
+            await self.config.cache.delete(self._key(question, namespace))
+
+    async def clear(self) -> None:
+        """
+        Removes all cached answers.
+        """
+        if self.config.semantic_cache is not None:
+            await self.config.semantic_cache.clear()
+        if self.config.cache is not None:
+            await self.config.cache.clear()
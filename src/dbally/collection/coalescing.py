@@ -0,0 +1,33 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class RequestCoalescer:
+    """
+    Runs concurrent identical requests of a collection once, so that all callers receive the same result.
+    """
+
+    def __init__(self) -> None:
+        self.in_flight: Dict[str, asyncio.Future] = {}
+
+    async def run(self, key: str, ask: Callable[[], Awaitable[T]]) -> T:
+        """
+        Joins the identical request that is already in flight, or starts a new one.
+
+        Args:
+            key: Key identifying identical requests.
+            ask: Function starting the request.
+
+        Returns:
+            The result of the request.
+        """
+        in_flight = self.in_flight.get(key)
+        if in_flight is None:
+            in_flight = asyncio.ensure_future(ask())
+            self.in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda _: self.in_flight.pop(key, None))
+
+        # shielded, so that a cancelled caller does not cancel the request awaited by the others
+        return await asyncio.shield(in_flight)
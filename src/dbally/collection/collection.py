@@ -1,26 +1,62 @@
 import asyncio
 import inspect
 import logging
-import textwrap
 import time
 from collections import defaultdict
-from typing import Callable, Dict, List, Optional, Type, TypeVar
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Awaitable, Callable, ContextManager, Dict, List, Mapping, Optional, Tuple, Type, TypeVar, Union
 
 import dbally
 from dbally.audit.event_handlers.base import EventHandler
 from dbally.audit.event_tracker import EventTracker
 from dbally.audit.events import FallbackEvent, RequestEnd, RequestStart
-from dbally.collection.exceptions import IndexUpdateError, NoViewFoundError
-from dbally.collection.results import ExecutionResult, ViewExecutionResult
+from dbally.cache.base import make_cache_key, normalize_text
+from dbally.collection.admission import AdmissionController, AdmissionStats
+from dbally.collection.answer_cache import AnswerCache
+from dbally.collection.coalescing import RequestCoalescer
+from dbally.collection.config import CollectionConfig, ViewSelectionConfig
+from dbally.collection.exceptions import IndexUpdateError, KnownFailureError, NoViewFoundError
+from dbally.collection.hedging import HedgingController
+from dbally.collection.negative_cache import NegativeCache
+from dbally.collection.results import (
+    CachedExecutionResult,
+    ExecutionResult,
+    RowStream,
+    TimingBreakdown,
+    ViewExecutionResult,
+)
+from dbally.collection.speculative import ask_speculatively
+from dbally.collection.view_pool import ViewPool
+from dbally.collection.view_selection_cache import ViewSelectionCache
+from dbally.iql import IQLError
 from dbally.iql_generator.prompt import UnsupportedQueryError
 from dbally.llms.base import LLM
 from dbally.llms.clients.base import LLMOptions
 from dbally.nl_responder.nl_responder import NLResponder
 from dbally.similarity.index import AbstractSimilarityIndex
 from dbally.view_selection.base import ViewSelector
+from dbally.view_selection.catalog import ViewCatalog
+from dbally.view_selection.lexical import LexicalViewIndex
 from dbally.views.base import BaseView, IndexLocation
+from dbally.views.exceptions import ViewExecutionError
 
-HANDLED_EXCEPTION_TYPES = (NoViewFoundError, UnsupportedQueryError, IndexUpdateError)
+HANDLED_EXCEPTION_TYPES = (NoViewFoundError, UnsupportedQueryError, IndexUpdateError, KnownFailureError)
+SPECULATIVE_EXCEPTION_TYPES = (*HANDLED_EXCEPTION_TYPES, ViewExecutionError)
+
+
+@dataclass
+class _Request:
+    """
+    Question asked to the collection, along with the options of the request passed down the pipeline.
+    """
+
+    question: str
+    dry_run: bool = False
+    return_natural_response: bool = False
+    llm_options: Optional[LLMOptions] = None
+    stream: bool = False
+    priority: int = 0
 
 
 class Collection:
@@ -32,7 +68,7 @@ class Collection:
         function instead of instantiating this class directly.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         name: str,
         view_selector: ViewSelector,
@@ -41,6 +77,7 @@ class Collection:
         event_handlers: Optional[List[EventHandler]] = None,
         n_retries: int = 3,
         fallback_collection: Optional["Collection"] = None,
+        config: Optional[CollectionConfig] = None,
     ) -> None:
         """
         Args:
@@ -60,20 +97,52 @@ class Collection:
             appended to the chat history to guide next generations.
             fallback_collection: collection to be asked when the ask function could not find answer in views registered
             to this collection
+            config: optional features of the collection, like the speculative execution of the views, answer cache,\
+            admission control, hedged requests or negative cache. If None, all of them are disabled.
+
+        Raises:
+            ValueError: if the maximum number of concurrent requests is lower than 1, the maximum number of queued\
+            requests is negative or the priority aging is not positive
         """
         self.name = name
         self.n_retries = n_retries
+        self.config = config or CollectionConfig()
         self._views: Dict[str, Callable[[], BaseView]] = {}
         self._builders: Dict[str, Callable[[], BaseView]] = {}
+        self._catalog = ViewCatalog()
+        self._view_selection = self.config.view_selection or ViewSelectionConfig()
+        self._lexical_index = LexicalViewIndex() if self._view_selection.prefilter_views is not None else None
+        self._view_selection_cache = (
+            ViewSelectionCache(name, self._catalog, self._view_selection.cache, self._view_selection)
+            if self._view_selection.cache is not None
+            else None
+        )
         self._view_selector = view_selector
         self._nl_responder = nl_responder
         self._llm = llm
         self._fallback_collection: Optional[Collection] = fallback_collection
         self._event_handlers = event_handlers or dbally.event_handlers
+        self._answer_cache = AnswerCache(name, self.config.answer_cache) if self.config.answer_cache else None
+        self._coalescer = RequestCoalescer() if self.config.coalesce_requests else None
+        self._negative_cache = (
+            NegativeCache(name, self._catalog, self.config.negative_cache) if self.config.negative_cache else None
+        )
+        self._view_pool = ViewPool() if self.config.pool_views else None
+        self._hedging = HedgingController(self.config.hedging)
+        admission = self.config.admission
+        self._admission = (
+            AdmissionController(
+                name, admission.max_concurrent_requests, admission.max_queued_requests, admission.priority_aging
+            )
+            if admission is not None
+            else None
+        )
 
     T = TypeVar("T", bound=BaseView)
 
-    def add(self, view: Type[T], builder: Optional[Callable[[], T]] = None, name: Optional[str] = None) -> None:
+    def add(
+        self, view: Type[T], builder: Optional[Callable[[], T]] = None, name: Optional[str] = None, lazy: bool = False
+    ) -> None:
         """
         Register new [View](views/index.md) that will be available to query via the collection.
 
@@ -84,6 +153,8 @@ class Collection:
             builder: Optional factory function that will be used to create the View instance. Use it when you\
             need to pass outcome of API call or database connection to the view, and it can change over time.
             name: Custom name of the view (defaults to the name of the class).
+            lazy: If True, the builder is not called until the view is needed for the first time, which defers\
+            its validation as well. Use it for views expensive to build.
 
         Raises:
             ValueError: if view with the given name is already registered or views class possess some non-default\
@@ -113,13 +184,16 @@ class Collection:
 
         builder = builder or view
 
-        # instantiate view to check if the builder is correct
-        view_instance = builder()
-        if not isinstance(view_instance, view):
-            raise ValueError(f"The builder function for view {name} must return an instance of {view.__name__}")
+        if not lazy:
+            # instantiate view to check if the builder is correct
+            self._validate_view(name, view, builder())
 
         self._views[name] = view
         self._builders[name] = builder
+        description = ViewCatalog.render_description(view.__doc__)
+        self._catalog.add(name=name, description=description, source=f"{view.__module__}.{view.__qualname__}")
+        if self._lexical_index is not None:
+            self._lexical_index.add(name, description)
 
     def set_fallback(self, fallback_collection: "Collection") -> "Collection":
         """
@@ -169,7 +243,40 @@ class Collection:
         if name not in self._views:
             raise NoViewFoundError(name)
 
-        return self._builders[name]()
+        view_instance = self._builders[name]()
+        self._validate_view(name, self._views[name], view_instance)
+        return view_instance
+
+    @staticmethod
+    def _validate_view(name: str, view: Type[BaseView], view_instance: BaseView) -> None:
+        """
+        Checks that the builder of the view returned an instance of the registered view class.
+
+        Args:
+            name: Name of the view.
+            view: Registered class of the view.
+            view_instance: Instance returned by the builder.
+
+        Raises:
+            ValueError: if the instance is not of the registered class.
+        """
+        if not isinstance(view_instance, view):
+            raise ValueError(f"The builder function for view {name} must return an instance of {view.__name__}")
+
+    def _borrow_view(self, name: str) -> ContextManager[BaseView]:
+        """
+        Provides an instance of the view for a single request, taken from the pool of views if view pooling\
+        is enabled.
+
+        Args:
+            name: Name of the view.
+
+        Returns:
+            Context manager yielding the view instance.
+        """
+        if self._view_pool is None:
+            return nullcontext(self.get(name))
+        return self._view_pool.borrow(name, lambda: self.get(name))
 
     def list(self) -> Dict[str, str]:
         """
@@ -178,21 +285,30 @@ class Collection:
         Returns:
             Dictionary of view names and descriptions
         """
-        return {
-            name: (textwrap.dedent(view.__doc__).strip() if view.__doc__ else "") for name, view in self._views.items()
-        }
+        return dict(self._catalog)
+
+    @property
+    def catalog(self) -> ViewCatalog:
+        """
+        Returns the catalog of the registered views, with their descriptions rendered once at registration.
+
+        Returns:
+            Read-only mapping of view names to descriptions, versioned as the views are registered.
+        """
+        return self._catalog
 
-    async def _select_view(
+    async def _select_views(
         self,
         question: str,
         event_tracker: EventTracker,
         llm_options: Optional[LLMOptions],
-    ) -> str:
+    ) -> List[str]:
         """
-        Select a view based on the provided question and options.
+        Select candidate views based on the provided question and options.
 
         If there is only one view available, it selects that view directly. Otherwise, it
-        uses the view selector to choose the most appropriate view.
+        uses the view selector to choose up to `CollectionConfig.speculative_views` most appropriate views,
+        out of the `ViewSelectionConfig.prefilter_views` views best matching the keywords of the question if set.
 
         Args:
             question: The question to be answered.
@@ -200,58 +316,94 @@ class Collection:
             llm_options: Options for the LLM client.
 
         Returns:
-            str: The name of the selected view.
+            Names of the selected views, ordered from the most relevant one.
 
         Raises:
             ValueError: If the collection of views is empty.
         """
 
-        views = self.list()
+        views: Mapping[str, str] = self._catalog
         if len(views) == 0:
             raise ValueError("Empty collection")
         if len(views) == 1:
-            selected_view_name = next(iter(views))
-        else:
-            selected_view_name = await self._view_selector.select_view(
-                question=question,
-                views=views,
-                event_tracker=event_tracker,
-                llm_options=llm_options,
-            )
-        return selected_view_name
+            return [next(iter(views))]
+
+        cache = self._view_selection_cache
+        top_k = self.config.speculative_views
+        ranked_views = await cache.get(question, top_k, llm_options) if cache is not None else None
+        if ranked_views is None:
+            if self._lexical_index is not None:
+                views = self._lexical_index.shortlist(question, views, self._view_selection.prefilter_views)
+            if len(views) == 1:
+                return [next(iter(views))]
+
+            with event_tracker.measure("view_selection"):
+                ranked_views = await self._view_selector.rank_views(
+                    question=question,
+                    views=views,
+                    event_tracker=event_tracker,
+                    llm_options=llm_options,
+                    top_k=top_k,
+                )
+            if cache is not None:
+                await cache.set(question, top_k, llm_options, ranked_views)
 
-    async def _ask_view(
-        self,
-        selected_view_name: str,
-        question: str,
-        event_tracker: EventTracker,
-        llm_options: Optional[LLMOptions],
-        dry_run: bool,
-    ):
+        if not ranked_views:
+            raise NoViewFoundError("")
+        return [view.name for view in ranked_views[:top_k]]
+
+    async def _ask_view(self, selected_view_name: str, request: _Request, event_tracker: EventTracker):
         """
         Ask the selected view to provide an answer to the question.
 
         Args:
             selected_view_name: The name of the selected view.
-            question: The question to be answered.
+            request: The question and the options of the request.
             event_tracker: The event tracker for logging and tracking events.
-            llm_options: Options for the LLM client.
-            dry_run: If True, only generate the query without executing it.
 
         Returns:
             Any: The result from the selected view.
         """
-        selected_view = self.get(selected_view_name)
-        view_result = await selected_view.ask(
-            query=question,
-            llm=self._llm,
-            event_tracker=event_tracker,
-            n_retries=self.n_retries,
-            dry_run=dry_run,
-            llm_options=llm_options,
-        )
+        # `stream` is passed only on demand, so views implementing the former `ask` signature keep working
+        stream_kwargs = {"stream": True} if request.stream else {}
+        try:
+            with self._borrow_view(selected_view_name) as selected_view:
+                view_result = await selected_view.ask(
+                    query=request.question,
+                    llm=self._llm,
+                    event_tracker=event_tracker,
+                    n_retries=self.n_retries,
+                    dry_run=request.dry_run,
+                    llm_options=request.llm_options,
+                    **stream_kwargs,
+                )
+        except SPECULATIVE_EXCEPTION_TYPES as exc:
+            if self._negative_cache is not None:
+                await self._negative_cache.remember(request.question, exc, selected_view_name)
+            raise
         return view_result
 
+    async def _ask_views(
+        self, selected_view_names: List[str], request: _Request, event_tracker: EventTracker
+    ) -> Tuple[str, ViewExecutionResult]:
+        """
+        Ask the selected views concurrently and return the answer of the highest-ranked view that succeeded.
+
+        Args:
+            selected_view_names: Names of the selected views, ordered from the most relevant one.
+            request: The question and the options of the request.
+            event_tracker: The event tracker for logging and tracking events.
+
+        Returns:
+            Name of the view that answered the question and its result.
+
+        Raises:
+            Exception: the error raised by the highest-ranked view, if none of the views succeeded.
+        """
+        return await ask_speculatively(
+            selected_view_names, lambda view_name: self._ask_view(view_name, request, event_tracker)
+        )
+
     async def _generate_textual_response(
         self,
         view_result: ViewExecutionResult,
@@ -271,12 +423,13 @@ class Collection:
         Returns:
             The generated textual response.
         """
-        textual_response = await self._nl_responder.generate_response(
-            result=view_result,
-            question=question,
-            event_tracker=event_tracker,
-            llm_options=llm_options,
-        )
+        with event_tracker.measure("nl_response"):
+            textual_response = await self._nl_responder.generate_response(
+                result=view_result,
+                question=question,
+                event_tracker=event_tracker,
+                llm_options=llm_options,
+            )
         return textual_response
 
     def get_all_event_handlers(self) -> List[EventHandler]:
@@ -297,25 +450,21 @@ class Collection:
 
     async def _handle_fallback(
         self,
-        question: str,
-        dry_run: bool,
-        return_natural_response: bool,
-        llm_options: Optional[LLMOptions],
-        selected_view_name: str,
+        request: _Request,
         event_tracker: EventTracker,
-        caught_exception: Exception,
+        selected_view_name: str,
+        caught_exception: Optional[Exception],
+        error_description: Optional[str] = None,
     ) -> ExecutionResult:
         """
         Handle fallback if the main query fails.
 
         Args:
-            question: The question to be answered.
-            dry_run: If True, only generate the query without executing it.
-            return_natural_response: If True, return the natural language response.
-            llm_options: Options for the LLM client.
-            selected_view_name: The name of the selected view.
+            request: The question and the options of the request.
             event_tracker: The event tracker for logging and tracking events.
-            caught_exception: The exception that was caught.
+            selected_view_name: The name of the selected view.
+            caught_exception: The exception that was caught, or None if the fallback is started without one.
+            error_description: Reason of the fallback reported to the event handlers if no exception was caught.
 
         Returns:
             The result from the fallback collection.
@@ -328,27 +477,33 @@ class Collection:
             triggering_collection_name=self.name,
             triggering_view_name=selected_view_name,
             fallback_collection_name=self._fallback_collection.name,
-            error_description=repr(caught_exception),
+            error_description=repr(caught_exception) if caught_exception else error_description,
         )
 
         async with event_tracker.track_event(fallback_event) as span:
-            result = await self._fallback_collection.ask(
-                question=question,
-                dry_run=dry_run,
-                return_natural_response=return_natural_response,
-                llm_options=llm_options,
-                event_tracker=event_tracker,
-            )
+            with event_tracker.measure("fallback"):
+                result = await self._fallback_collection.ask(
+                    question=request.question,
+                    dry_run=request.dry_run,
+                    return_natural_response=request.return_natural_response,
+                    llm_options=request.llm_options,
+                    event_tracker=event_tracker,
+                    stream=request.stream,
+                    priority=request.priority,
+                )
             span(fallback_event)
         return result
 
-    async def ask(
+    async def ask(  # pylint: disable=too-many-arguments
         self,
         question: str,
         dry_run: bool = False,
         return_natural_response: bool = False,
         llm_options: Optional[LLMOptions] = None,
         event_tracker: Optional[EventTracker] = None,
+        stream: bool = False,
+        timeout: Optional[float] = None,
+        priority: int = 0,
     ) -> ExecutionResult:
         """
         Ask question in a text form and retrieve the answer based on the available views.
@@ -369,78 +524,438 @@ class Collection:
             llm_options: options to use for the LLM client. If provided, these options will be merged with the default
                 options provided to the LLM client, prioritizing option values other than NOT_GIVEN
             event_tracker: Event tracker object for given ask.
+            stream: if True, the rows are fetched lazily and `results` is a `RowStream`, which can be consumed\
+                with `async for`. Streaming cannot be combined with `return_natural_response`.
+            timeout: time budget of the request in seconds. The remaining budget bounds every LLM call and\
+                similarity lookup, and once it is exhausted the outstanding work is cancelled and no further\
+                retries or queries are started.
+            priority: priority of the request. When the collection limits the number of concurrent requests,\
+                waiting requests with higher priority are admitted first, e.g. interactive questions can be given\
+                a higher priority than batch jobs.
 
         Returns:
             ExecutionResult object representing the result of the query execution.
 
         Raises:
-            ValueError: if collection is empty
+            ValueError: if collection is empty or both `stream` and `return_natural_response` are requested
             IQLError: if incorrect IQL was generated `n_retries` amount of times.
             ValueError: if incorrect IQL was generated `n_retries` amount of times.
             NoViewFoundError: if question does not match to any registered view,
             UnsupportedQueryError: if the question could not be answered
             IndexUpdateError: if index update failed
+            RequestTimeoutError: if the question was not answered within `timeout`
+        """
+        if stream and return_natural_response:
+            raise ValueError("Natural response cannot be generated for streamed results")
+
+        request = _Request(
+            question=question,
+            dry_run=dry_run,
+            return_natural_response=return_natural_response,
+            llm_options=llm_options,
+            stream=stream,
+            priority=priority,
+        )
+
+        if event_tracker:
+            if timeout is not None:
+                event_tracker.set_timeout(timeout)
+            return await event_tracker.within_deadline(self._ask(request, event_tracker))
+
+        return await self._ask_with_tracking(request, self.get_all_event_handlers(), timeout)
+
+    async def ask_many(
+        self,
+        questions: List[str],
+        max_concurrency: int = 8,
+        dry_run: bool = False,
+        return_natural_response: bool = False,
+        llm_options: Optional[LLMOptions] = None,
+        priority: int = 0,
+    ) -> List[Union[ExecutionResult, Exception]]:
+        """
+        Ask multiple questions concurrently, running at most `max_concurrency` of them at the same time.
+
+        Each question goes through the same steps as in [`ask`][dbally.Collection.ask] and is reported to the
+        event handlers as a separate request. Errors are not propagated, instead they are returned in place
+        of the result for the question that caused them.
+
+        Args:
+            questions: questions posed using natural language representation.
+            max_concurrency: maximum number of questions processed at the same time.
+            dry_run: if True, only generate the queries without executing them
+            return_natural_response: if True (and dry_run is False as natural response requires query results),
+                the natural response will be included in the answers
+            llm_options: options to use for the LLM client. If provided, these options will be merged with the default
+                options provided to the LLM client, prioritizing option values other than NOT_GIVEN
+            priority: priority of the questions, see [`ask`][dbally.Collection.ask]. Batch questions are usually\
+                given a lower priority than the interactive ones.
+
+        Returns:
+            List of ExecutionResult objects or exceptions, in the same order as the questions.
+
+        Raises:
+            ValueError: if `max_concurrency` is lower than 1
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        event_handlers = self.get_all_event_handlers()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def ask_with_limit(question: str) -> ExecutionResult:
+            """
+            Asks the question once fewer than `max_concurrency` questions are processed.
+
+            Args:
+                question: The question to be answered.
+
+            Returns:
+                ExecutionResult object representing the result of the query execution.
+            """
+            async with semaphore:
+                request = _Request(
+                    question=question,
+                    dry_run=dry_run,
+                    return_natural_response=return_natural_response,
+                    llm_options=llm_options,
+                    priority=priority,
+                )
+                return await self._ask_with_tracking(request, event_handlers)
+
+        return await asyncio.gather(*[ask_with_limit(question) for question in questions], return_exceptions=True)
+
+    async def _ask_with_tracking(
+        self, request: _Request, event_handlers: List[EventHandler], timeout: Optional[float] = None
+    ) -> ExecutionResult:
+        """
+        Ask question as a new request, reporting its start and end to the given event handlers.
+
+        Args:
+            request: The question and the options of the request.
+            event_handlers: Event handlers to report the request to.
+            timeout: Time budget of the request in seconds, or None if the request has no deadline.
+
+        Returns:
+            ExecutionResult object representing the result of the query execution.
+        """
+        event_tracker = EventTracker.initialize_with_handlers(event_handlers, TimingBreakdown())
+        if timeout is not None:
+            event_tracker.set_timeout(timeout)
+        await event_tracker.request_start(RequestStart(question=request.question, collection_name=self.name))
+
+        result = await event_tracker.within_deadline(self._ask(request, event_tracker))
+
+        await event_tracker.request_end(RequestEnd(result=result))
+        return result
+
+    async def _ask(self, request: _Request, event_tracker: EventTracker) -> ExecutionResult:
+        """
+        Answer the question, joining an identical question that is already in flight if coalescing is enabled.
+
+        Streamed questions are never coalesced, as a `RowStream` can be consumed only once.
+
+        Args:
+            request: The question and the options of the request.
+            event_tracker: The event tracker for logging and tracking events.
+
+        Returns:
+            ExecutionResult object representing the result of the query execution.
+        """
+        if self._coalescer is None or request.stream:
+            return await self._ask_admitted(request, event_tracker)
+
+        key = make_cache_key(
+            normalize_text(request.question), request.dry_run, request.return_natural_response, request.llm_options
+        )
+        return await self._coalescer.run(key, lambda: self._ask_admitted(request, event_tracker))
+
+    async def _ask_admitted(self, request: _Request, event_tracker: EventTracker) -> ExecutionResult:
+        """
+        Answer the question once the admission control of the collection lets the request in.
+
+        Args:
+            request: The question and the options of the request.
+            event_tracker: The event tracker for logging and tracking events.
+
+        Returns:
+            ExecutionResult object representing the result of the query execution.
+
+        Raises:
+            CollectionOverloadedError: if the collection is processing the maximum number of concurrent requests\
+            and the maximum number of queued requests are already waiting.
+        """
+        if self._admission is None:
+            return await self._ask_with_cache(request, event_tracker)
+
+        async with self._admission.admit(request.priority) as wait_time:
+            if event_tracker.timings is not None:
+                event_tracker.timings.record("admission", wait_time)
+            return await self._ask_with_cache(request, event_tracker)
+
+    def admission_stats(self) -> Optional[AdmissionStats]:
+        """
+        Returns the metrics of the admission control, like the current queue depth and the time spent waiting.
+
+        Returns:
+            Snapshot of the admission metrics, or None if the number of requests is not limited.
+        """
+        return self._admission.stats if self._admission else None
+
+    async def _ask_with_cache(self, request: _Request, event_tracker: EventTracker) -> ExecutionResult:
+        """
+        Answer the question using the cache if possible, running the question answering pipeline otherwise.
+
+        Args:
+            request: The question and the options of the request.
+            event_tracker: The event tracker for logging and tracking events.
+
+        Returns:
+            ExecutionResult object representing the result of the query execution.
+        """
+        if self._answer_cache is None:
+            return await self._ask_pipeline(request, event_tracker)
+
+        namespace = self._cache_namespace(request.llm_options)
+        cached_result = await self._answer_cache.get(request.question, namespace, event_tracker)
+
+        if cached_result is not None:
+            result = await self._ask_cached(cached_result, request, event_tracker)
+            if result:
+                return result
+
+        result = await self._ask_pipeline(request, event_tracker)
+        await self._answer_cache.set(request.question, namespace, result, request.dry_run, event_tracker)
+        return result
+
+    async def _ask_cached(
+        self, cached_result: CachedExecutionResult, request: _Request, event_tracker: EventTracker
+    ) -> Optional[ExecutionResult]:
+        """
+        Answer the question based on the cached answer, replaying the cached query if the rows are not cached.
+
+        Args:
+            cached_result: The cached answer to the question.
+            request: The question and the options of the request.
+            event_tracker: The event tracker for logging and tracking events.
+
+        Returns:
+            ExecutionResult object or None if the cached answer could not be used.
+        """
+        start_time = time.monotonic()
+        dry_run = request.dry_run
+
+        if cached_result.results is not None or dry_run:
+            results = [] if dry_run else list(cached_result.results)
+            view_result = ViewExecutionResult(
+                results=RowStream([results]) if request.stream else results,
+                context=dict(cached_result.context),
+            )
+        else:
+            collection = self._find_collection_with_view(cached_result.view_name)
+            if not collection:
+                return None
+            try:
+                # pylint: disable=protected-access
+                with collection._borrow_view(cached_result.view_name) as view:
+                    if not view.supports_replay:
+                        return None
+                    view_result = await view.replay(
+                        context=cached_result.context,
+                        event_tracker=event_tracker,
+                        dry_run=dry_run,
+                        stream=request.stream,
+                    )
+            except IQLError:
+                return None
+        end_time_view = time.monotonic()
+
+        natural_response = ""
+        if not dry_run and request.return_natural_response:
+            natural_response = cached_result.textual_response or await self._generate_textual_response(
+                view_result, request.question, event_tracker, request.llm_options
+            )
+
+        return ExecutionResult(
+            results=view_result.results,
+            context=view_result.context,
+            execution_time=time.monotonic() - start_time,
+            execution_time_view=end_time_view - start_time,
+            view_name=cached_result.view_name,
+            textual_response=natural_response,
+            timings=event_tracker.timings,
+        )
+
+    def _find_collection_with_view(self, view_name: str) -> Optional["Collection"]:
+        """
+        Finds the collection registering the view with the given name, following the chain of fallback collections.
+
+        Args:
+            view_name: Name of the view.
+
+        Returns:
+            The first collection in the chain registering the view or None if there is no such collection.
+        """
+        collection: Optional[Collection] = self
+        while collection and view_name not in collection._views:  # pylint: disable=protected-access
+            collection = collection._fallback_collection  # pylint: disable=protected-access
+        return collection
+
+    def _cache_namespace(self, llm_options: Optional[LLMOptions]) -> str:
+        """
+        Creates the namespace of the cached answers, shared by the questions asked with the same views and options.
+
+        Args:
+            llm_options: Options for the LLM client.
+
+        Returns:
+            The namespace, changing whenever the views registered in the collection or its fallbacks change.
+        """
+        views_fingerprints = []
+        collection: Optional[Collection] = self
+        while collection:
+            views_fingerprints.append((collection.name, collection._catalog.fingerprint))  # pylint: disable=W0212
+            collection = collection._fallback_collection  # pylint: disable=protected-access
+
+        return make_cache_key(views_fingerprints, self._llm.model_name, llm_options)
+
+    async def invalidate_cache(self, question: Optional[str] = None, llm_options: Optional[LLMOptions] = None) -> None:
         """
-        if not event_tracker:
-            is_fallback_call = False
-            event_handlers = self.get_all_event_handlers()
-            event_tracker = EventTracker.initialize_with_handlers(event_handlers)
-            await event_tracker.request_start(RequestStart(question=question, collection_name=self.name))
+        Removes cached answers. Answers are also invalidated automatically when new views are registered.
+
+        Args:
+            question: The question which answer should be removed. If None, all cached answers are removed.
+            llm_options: Options for the LLM client used when asking the question.
+        """
+        if self._answer_cache is None:
+            return
+
+        if question is None:
+            await self._answer_cache.clear()
         else:
-            is_fallback_call = True
+            await self._answer_cache.delete(question, self._cache_namespace(llm_options))
 
+    async def _ask_pipeline(self, request: _Request, event_tracker: EventTracker) -> ExecutionResult:
+        """
+        Run the question answering pipeline, falling back to the fallback collection in case of failure.
+
+        Args:
+            request: The question and the options of the request.
+            event_tracker: The event tracker for logging and tracking events.
+
+        Returns:
+            ExecutionResult object representing the result of the query execution.
+        """
+        question = request.question
         selected_view_name = ""
 
-        try:
+        async def ask_views() -> ExecutionResult:
+            """
+            Selects the views best matching the question and asks them.
+
+            Returns:
+                ExecutionResult of the highest-ranked view that answered the question.
+            """
+            nonlocal selected_view_name
+
             start_time = time.monotonic()
-            selected_view_name = await self._select_view(
-                question=question, event_tracker=event_tracker, llm_options=llm_options
+            selected_view_names = await self._select_views(
+                question=question, event_tracker=event_tracker, llm_options=request.llm_options
             )
+            selected_view_name = selected_view_names[0]
+            if self._negative_cache is not None:
+                selected_view_names = await self._negative_cache.skip_known_failures(
+                    question, selected_view_names, has_fallback=self._fallback_collection is not None
+                )
+                selected_view_name = selected_view_names[0]
 
             start_time_view = time.monotonic()
-            view_result = await self._ask_view(
-                selected_view_name=selected_view_name,
-                question=question,
-                event_tracker=event_tracker,
-                llm_options=llm_options,
-                dry_run=dry_run,
-            )
+            selected_view_name, view_result = await self._ask_views(selected_view_names, request, event_tracker)
             end_time_view = time.monotonic()
 
             natural_response = (
-                await self._generate_textual_response(view_result, question, event_tracker, llm_options)
-                if not dry_run and return_natural_response
+                await self._generate_textual_response(view_result, question, event_tracker, request.llm_options)
+                if not request.dry_run and request.return_natural_response
                 else ""
             )
 
-            result = ExecutionResult(
+            return ExecutionResult(
                 results=view_result.results,
                 context=view_result.context,
                 execution_time=time.monotonic() - start_time,
                 execution_time_view=end_time_view - start_time_view,
                 view_name=selected_view_name,
                 textual_response=natural_response,
+                timings=event_tracker.timings,
             )
 
+        def ask_fallback(
+            caught_exception: Optional[Exception], error_description: Optional[str] = None
+        ) -> Awaitable[ExecutionResult]:
+            """
+            Asks the fallback collection, reporting the view selected by the collection as the triggering one.
+
+            Args:
+                caught_exception: The exception that was caught, or None if the fallback is started without one.
+                error_description: Reason of the fallback reported to the event handlers if no exception was caught.
+
+            Returns:
+                The result from the fallback collection.
+            """
+            return self._handle_fallback(
+                request, event_tracker, selected_view_name, caught_exception, error_description
+            )
+
+        if self._fallback_collection and self._negative_cache is not None:
+            known_failure = await self._negative_cache.get(question)
+            if known_failure is not None:
+                return await ask_fallback(None, f"Known failure: {known_failure}")
+
+        hedge_delay = self._hedging.get_delay() if self._fallback_collection else None
+        if hedge_delay is not None:
+            return await self._hedging.ask(
+                ask_views(),
+                ask_fallback,
+                hedge_delay,
+                handled_exceptions=HANDLED_EXCEPTION_TYPES,
+                on_failure=lambda caught_exception: self._record_failure(question, caught_exception),
+            )
+
+        try:
+            result = await ask_views()
         except HANDLED_EXCEPTION_TYPES as caught_exception:
+            await self._record_failure(question, caught_exception)
             if self._fallback_collection:
-                result = await self._handle_fallback(
-                    question=question,
-                    dry_run=dry_run,
-                    return_natural_response=return_natural_response,
-                    llm_options=llm_options,
-                    selected_view_name=selected_view_name,
-                    event_tracker=event_tracker,
-                    caught_exception=caught_exception,
-                )
-            else:
-                raise caught_exception
-
-        if not is_fallback_call:
-            await event_tracker.request_end(RequestEnd(result=result))
+                return await ask_fallback(caught_exception)
+            raise caught_exception
 
+        self._hedging.record(failed=False)
         return result
 
+    async def _record_failure(self, question: str, caught_exception: Exception) -> None:
+        """
+        Records the failure of the collection in the failure rate statistics and the negative cache.
+
+        Args:
+            question: The question that could not be answered.
+            caught_exception: The exception that was caught.
+        """
+        self._hedging.record(failed=True)
+        if self._negative_cache is not None:
+            await self._negative_cache.remember(question, caught_exception)
+
+    @property
+    def failure_rate(self) -> float:
+        """
+        Returns the fraction of recent requests the views of the collection failed to answer,\
+        which made the collection fall back to the fallback collection.
+
+        Returns:
+            Failure rate of the last `HedgingController.FAILURE_RATE_WINDOW` requests, or 0 if there were\
+            no requests yet.
+        """
+        return self._hedging.failure_rate
+
     def get_similarity_indexes(self) -> Dict[AbstractSimilarityIndex, List[IndexLocation]]:
         """
         List all similarity indexes from all views in the collection.
@@ -452,9 +967,11 @@ class Collection:
                 - structured views, the format is (view_name, filter_name, argument_name)
         """
         indexes = defaultdict(list)
-        for view_name in self._views:
-            view = self.get(view_name)
-            view_indexes = view.list_similarity_indexes()
+        for view_name, view in self._views.items():
+            view_indexes = view.list_class_similarity_indexes()
+            if view_indexes is None:
+                with self._borrow_view(view_name) as view_instance:
+                    view_indexes = view_instance.list_similarity_indexes()
             for index, location in view_indexes.items():
                 indexes[index].extend(location)
         return indexes
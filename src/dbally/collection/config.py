@@ -0,0 +1,143 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from dbally.cache.base import Cache
+from dbally.cache.semantic import SemanticCache
+
+
+@dataclass
+class AnswerCacheConfig:
+    """
+    Settings of the cache storing the answers to the questions, keyed by the normalized question, the registered\
+    views and the LLM options. Cached answers skip view selection and query generation.
+
+    Args:
+        cache: Cache storing the answers.
+        ttl: Time to live of the cached answers in seconds. If None, the default TTL of the cache is used.
+        cache_results: If True, the rows are cached as well, so repeated questions do not query the datasource.\
+        Otherwise, the cached query is executed again by the view.
+        semantic_cache: Cache reusing the query generated for a previously answered question similar in meaning\
+        to the asked one, e.g. a paraphrase mentioning the same names and numbers. The reused query is executed\
+        again by the same view, so only the view selection and query generation are skipped.
+    """
+
+    cache: Optional[Cache] = None
+    ttl: Optional[float] = None
+    cache_results: bool = False
+    semantic_cache: Optional[SemanticCache] = None
+
+
+@dataclass
+class AdmissionConfig:
+    """
+    Settings of the admission control, which limits the number of requests processed by a collection at the same time.
+
+    Args:
+        max_concurrent_requests: Maximum number of requests processed by the collection at the same time.
+        max_queued_requests: Maximum number of requests waiting for a free slot when `max_concurrent_requests`\
+        are already processed. Requests exceeding it are rejected with `CollectionOverloadedError`.
+        priority_aging: Time in seconds after which the priority of a waiting request grows by one, so that\
+        requests with low priority are not starved.
+    """
+
+    max_concurrent_requests: int
+    max_queued_requests: int = 0
+    priority_aging: float = 10.0
+
+
+@dataclass
+class HedgingConfig:
+    """
+    Settings of the hedged requests, which start the fallback collection in parallel with the collection instead\
+    of waiting for the collection to fail.
+
+    Args:
+        delay: If set, the fallback collection is started when the views of the collection do not answer within\
+        `delay` seconds. If None, the fallback collection is started only after the collection fails.
+        failure_rate: If set, the fallback collection is started right away when the collection failed on at least\
+        this fraction of the recent requests, see `Collection.failure_rate`.
+    """
+
+    delay: Optional[float] = None
+    failure_rate: Optional[float] = None
+
+
+@dataclass
+class NegativeCacheConfig:
+    """
+    Settings of the negative cache, which stores the questions that views of the collection recently failed\
+    to answer. Such questions skip the failed views and go straight to the next candidate view or to the fallback\
+    collection. The entries are invalidated when new views are registered.
+
+    Args:
+        cache: Cache storing the failures.
+        ttl: Time to live of the entries in seconds. If None, the default TTL of the cache is used.
+    """
+
+    cache: Cache
+    ttl: Optional[float] = None
+
+
+@dataclass
+class ViewSelectionConfig:
+    """
+    Settings of the view selection.
+
+    Args:
+        prefilter_views: If set, only this many views best matching the keywords of the question are passed\
+        to the view selector, which keeps the view selection prompt short in collections with many views.\
+        If no view matches the keywords, all views are passed.
+        cache: Cache storing the views selected for the questions, keyed by the normalized question and\
+        the registered views, so that repeated questions skip the view selection.
+        cache_ttl: Time to live of the cached view selections in seconds. If None, the default TTL of the cache\
+        is used.
+        min_score: If set, view selections are cached only if the score of the best view reaches it. Selections\
+        of selectors that do not score views are always cached.
+    """
+
+    prefilter_views: Optional[int] = None
+    cache: Optional[Cache] = None
+    cache_ttl: Optional[float] = None
+    min_score: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if self.prefilter_views is not None and self.prefilter_views < 1:
+            raise ValueError("prefilter_views must be a positive integer")
+
+
+@dataclass
+class CollectionConfig:
+    """
+    Optional features of a collection, which reduce the latency and the cost of the requests at the expense\
+    of memory or extra work. All of them are disabled by default.
+
+    Args:
+        speculative_views: Number of the most relevant views asked concurrently for each question. The answer\
+        of the highest-ranked view that succeeds is returned and the remaining ones are cancelled. The default\
+        value of 1 asks only the selected view.
+        coalesce_requests: If True, concurrent identical questions are answered by a single run of the pipeline,\
+        and all callers receive the same result. Streamed questions are never coalesced.
+        pool_views: If True, view instances are reused between the requests instead of being built for each\
+        of them. Views are reset with `BaseView.reset` before being reused, and views not supporting it are\
+        built for each request anyway.
+        answer_cache: Settings of the answer cache. If None, the answers are not cached.
+        admission: Settings of the admission control. If None, the number of requests is not limited.
+        hedging: Settings of the hedged requests. If None, the fallback collection is started only after\
+        the collection fails.
+        negative_cache: Settings of the negative cache. If None, the failures are not remembered.
+        view_selection: Settings of the view selection. If None, all views are passed to the view selector\
+        and its choice is not cached.
+    """
+
+    speculative_views: int = 1
+    coalesce_requests: bool = False
+    pool_views: bool = False
+    answer_cache: Optional[AnswerCacheConfig] = None
+    admission: Optional[AdmissionConfig] = None
+    hedging: Optional[HedgingConfig] = None
+    negative_cache: Optional[NegativeCacheConfig] = None
+    view_selection: Optional[ViewSelectionConfig] = None
+
+    def __post_init__(self) -> None:
+        if self.speculative_views < 1:
+            raise ValueError("speculative_views must be a positive integer")
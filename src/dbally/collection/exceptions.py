@@ -40,3 +40,34 @@ class IndexUpdateError(DbAllyError):
         description = ", ".join(".".join(name for name in location) for location in failed_locations)
         super().__init__(f"Failed to update similarity indexes for {description}.")
         self.failed_indexes = failed_indexes
+
+
+class KnownFailureError(DbAllyError):
+    """
+    Error raised when all the views selected for the question recently failed on it, so that the question is passed\
+    straight to the fallback collection.
+    """
+
+    def __init__(self, view_name: str, failure: str) -> None:
+        """
+        Args:
+            view_name: Name of the most relevant of the selected views.
+            failure: Description of the recent failure of the view.
+        """
+        super().__init__(f"View '{view_name}' recently failed on the question: {failure}")
+        self.view_name = view_name
+        self.failure = failure
+
+
+class CollectionOverloadedError(DbAllyError):
+    """
+    Error raised when a collection rejects a request because all of its request slots and its wait queue are full.
+    """
+
+    def __init__(self, collection_name: str) -> None:
+        """
+        Args:
+            collection_name: Name of the overloaded collection.
+        """
+        super().__init__(f"Collection '{collection_name}' is overloaded, try again later.")
+        self.collection_name = collection_name
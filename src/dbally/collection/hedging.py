@@ -0,0 +1,105 @@
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional, Tuple, Type
+
+from dbally.collection.config import HedgingConfig
+from dbally.collection.results import ExecutionResult
+from dbally.collection.speculative import discard_tasks
+
+
+class HedgingController:
+    """
+    Tracks the failure rate of a collection and decides when to start its fallback collection in parallel.
+
+    The fallback collection is started when the views of the collection do not answer within the hedge delay,\
+    or right away once the collection failed on at least the configured fraction of the recent requests.\
+    The answer of the collection is preferred, and the fallback answer is used only if the collection fails.
+    """
+
+    FAILURE_RATE_WINDOW = 100
+    MIN_REQUESTS = 10
+
+    def __init__(self, config: Optional[HedgingConfig] = None) -> None:
+        """
+        Args:
+            config: Settings of the hedged requests. If None, the fallback collection is started only after\
+            the collection fails.
+        """
+        self.config = config or HedgingConfig()
+        self._outcomes: Deque[bool] = deque(maxlen=self.FAILURE_RATE_WINDOW)
+
+    def record(self, failed: bool) -> None:
+        """
+        Records the outcome of a request in the failure rate statistics.
+
+        Args:
+            failed: True if the views of the collection failed to answer the question.
+        """
+        self._outcomes.append(failed)
+
+    @property
+    def failure_rate(self) -> float:
+        """
+        Returns the fraction of the recent requests the views of the collection failed to answer.
+
+        Returns:
+            Failure rate of the last `FAILURE_RATE_WINDOW` requests, or 0 if there were no requests yet.
+        """
+        return sum(self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    def get_delay(self) -> Optional[float]:
+        """
+        Decides how long to wait for the views of the collection before starting the fallback collection in parallel.
+
+        Returns:
+            Delay in seconds, 0 to start the fallback immediately or None to start it only after a failure.
+        """
+        if (
+            self.config.failure_rate is not None
+            and len(self._outcomes) >= self.MIN_REQUESTS
+            and self.failure_rate >= self.config.failure_rate
+        ):
+            return 0.0
+        return self.config.delay
+
+    async def ask(
+        self,
+        primary: Awaitable[ExecutionResult],
+        ask_fallback: Callable[..., Awaitable[ExecutionResult]],
+        delay: float,
+        handled_exceptions: Tuple[Type[Exception], ...],
+        on_failure: Callable[[Exception], Awaitable[None]],
+    ) -> ExecutionResult:
+        """
+        Awaits the answer of the views of the collection and starts the fallback collection in parallel if they\
+        do not answer within `delay` seconds.
+
+        Args:
+            primary: The answer of the views of the collection.
+            ask_fallback: Function asking the fallback collection, given the error of the collection\
+            or None if the fallback is hedged.
+            delay: Time in seconds after which the fallback collection is started.
+            handled_exceptions: Errors of the collection answered by the fallback collection.
+            on_failure: Function called with the error of the collection before the fallback answer is used.
+
+        Returns:
+            ExecutionResult of the collection, or of the fallback collection if the collection failed.
+        """
+        primary_task = asyncio.ensure_future(primary)
+        fallback_task = None
+        result = None
+        try:
+            await asyncio.wait([primary_task], timeout=delay)
+            if not primary_task.done():
+                fallback_task = asyncio.ensure_future(ask_fallback(None, "Hedged request"))
+
+            try:
+                result = await primary_task
+            except handled_exceptions as caught_exception:
+                await on_failure(caught_exception)
+                result = await (fallback_task or ask_fallback(caught_exception))
+            else:
+                self.record(failed=False)
+            return result
+        finally:
+            await discard_tasks([primary_task, fallback_task], kept_result=result)
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+from typing import List, Optional
+
+from dbally.cache.base import make_cache_key, normalize_text
+from dbally.collection.config import NegativeCacheConfig
+from dbally.collection.exceptions import IndexUpdateError, KnownFailureError
+from dbally.exceptions import RequestTimeoutError
+from dbally.view_selection.catalog import ViewCatalog
+
+
+class NegativeCache:
+    """
+    Remembers the questions that the views of a collection recently failed to answer, so that they are not asked\
+    the same question again until the entry expires.
+
+    The entries are keyed by the fingerprint of the views registered in the collection, so they are invalidated\
+    when new views are registered. Failures of the cache backend are logged and treated as cache misses, so they\
+    never fail the question.
+    """
+
+    def __init__(self, collection_name: str, catalog: ViewCatalog, config: NegativeCacheConfig) -> None:
+        """
+        Args:
+            collection_name: Name of the collection.
+            catalog: Catalog of the views registered in the collection.
+            config: Settings of the negative cache.
+        """
+        self.collection_name = collection_name
+        self.catalog = catalog
+        self.config = config
+
+    def _key(self, question: str, view_name: str) -> str:
+        """
+        Computes the negative cache key of the question asked to the given view of the collection.
+
+        Args:
+            question: The question to be answered.
+            view_name: The name of the view, or an empty string for the whole collection.
+
+        Returns:
+            Key of the question in the negative cache.
+        """
+        return make_cache_key(
+            "failure", normalize_text(question), self.collection_name, self.catalog.fingerprint, view_name
+        )
+
+    async def get(self, question: str, view_name: str = "") -> Optional[str]:
+        """
+        Looks up a recent failure of the view or the whole collection on the question.
+
+        Args:
+            question: The question to be answered.
+            view_name: The name of the view, or an empty string for the whole collection.
+
+        Returns:
+            Description of the recent failure, or None if there was none.
+
+        Raises:
+            RequestTimeoutError: If the deadline of the request passed during the lookup.
+        """
+        try:
+            return await self.config.cache.get(self._key(question, view_name))
+        except RequestTimeoutError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.warning("Failed to look up the negative cache of collection %s: %s", self.collection_name, exc)
+            return None
+
+    async def remember(self, question: str, caught_exception: Exception, view_name: str = "") -> None:
+        """
+        Stores the failure of the view or the whole collection on the question.
+
+        Args:
+            question: The question that could not be answered.
+            caught_exception: The exception that was caught.
+            view_name: The name of the view, or an empty string for the whole collection.
+
+        Raises:
+            RequestTimeoutError: If the deadline of the request passed while storing the failure.
+        """
+        # index updates fail for reasons unrelated to the question, so they are worth retrying
+        if isinstance(caught_exception, IndexUpdateError):
+            return
+        try:
+            await self.config.cache.set(self._key(question, view_name), repr(caught_exception), ttl=self.config.ttl)
+        except RequestTimeoutError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.warning("Failed to update the negative cache of collection %s: %s", self.collection_name, exc)
+
+    async def skip_known_failures(self, question: str, view_names: List[str], has_fallback: bool) -> List[str]:
+        """
+        Removes the views that recently failed on the question from the candidates. If all of them failed,\
+        the question is passed to the fallback collection or, if there is none, asked to the same views again.
+
+        Args:
+            question: The question to be answered.
+            view_names: Names of the selected views, ordered from the most relevant one.
+            has_fallback: Whether the collection has a fallback collection.
+
+        Returns:
+            Names of the selected views without the recently failed ones.
+
+        Raises:
+            KnownFailureError: If all the selected views recently failed and there is a fallback collection.
+        """
+        known_failures = await asyncio.gather(*[self.get(question, view_name) for view_name in view_names])
+        remaining_view_names = [view_name for view_name, failure in zip(view_names, known_failures) if failure is None]
+        if not remaining_view_names and has_fallback:
+            raise KnownFailureError(view_names[0], known_failures[0])
+        return remaining_view_names or view_names
@@ -1,5 +1,178 @@
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine, Executable
+
+
+class RowStream:
+    """
+    Lazy cursor over the rows of a query result, fetching them from the data source in batches.
+
+    Rows can be iterated over only once, either with `for` or `async for`. The underlying resources,
+    like the database connection, are released when the stream is exhausted or closed.
+    """
+
+    def __init__(self, batches: Iterable[List[Dict[str, Any]]], on_close: Optional[Callable[[], None]] = None) -> None:
+        """
+        Args:
+            batches: Iterable yielding consecutive batches of rows, each row being a dictionary with column names\
+                as keys.
+            on_close: Optional function releasing the resources used by the stream.
+        """
+        self._batches = iter(batches)
+        self._on_close = on_close
+        self._closed = False
+
+    @classmethod
+    def from_sqlalchemy(
+        cls,
+        engine: "Engine",
+        statement: "Executable",
+        parameters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> "RowStream":
+        """
+        Executes the query with SQLAlchemy and returns a stream of the retrieved rows.
+
+        Args:
+            engine: SQLAlchemy engine used to execute the query.
+            statement: The query to execute.
+            parameters: Values of the bound parameters of the query.
+            batch_size: Number of rows fetched from the database at once.
+
+        Returns:
+            Stream of rows, owning the database connection until it is exhausted or closed.
+
+        Raises:
+            Exception: The error of the query execution, raised after the connection is closed.
+        """
+        connection = engine.connect()
+        try:
+            cursor = connection.execution_options(yield_per=batch_size).execute(statement, parameters)
+        except Exception:
+            connection.close()
+            raise
+
+        return cls(
+            batches=([dict(row) for row in partition] for partition in cursor.mappings().partitions()),
+            on_close=connection.close,
+        )
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        try:
+            for batch in self._batches:
+                yield from batch
+        finally:
+            self.close()
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        try:
+            for batch in self._batches:
+                for row in batch:
+                    yield row
+                # let other tasks run between the batches
+                await asyncio.sleep(0)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """
+        Releases the resources used by the stream. Rows that were not fetched yet are discarded.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        close_batches = getattr(self._batches, "close", None)
+        if close_batches:
+            close_batches()
+        if self._on_close:
+            self._on_close()
+
+
+@dataclass
+class StageTiming:
+    """
+    Represents a single timed step of the question answering pipeline.
+
+    Args:
+        stage: Name of the pipeline stage, e.g. `view_selection` or `execution`.
+        duration: Time taken by the step, in seconds.
+        attempt: Number of the attempt, 0 for the first one and greater for the retries.
+    """
+
+    stage: str
+    duration: float
+    attempt: int = 0
+
+
+@dataclass
+class TimingBreakdown:
+    """
+    Per-stage latency breakdown of the question answering pipeline.
+
+    The stages recorded by db-ally are `admission`, `view_selection`, `iql_assessment`, `iql_generation`,
+    `iql_parsing`, `similarity`, `sql_generation`, `query_building`, `execution`, `nl_response` and `fallback`.
+    Stages may be nested, e.g. `iql_parsing` includes the `similarity` lookups and `fallback` includes
+    all stages of the fallback collection.
+
+    Args:
+        stages: Timed steps in the order of their completion.
+    """
+
+    stages: List[StageTiming] = field(default_factory=list)
+
+    def record(self, stage: str, duration: float, attempt: int = 0) -> None:
+        """
+        Records a timed step of the pipeline.
+
+        Args:
+            stage: Name of the pipeline stage.
+            duration: Time taken by the step, in seconds.
+            attempt: Number of the attempt, 0 for the first one and greater for the retries.
+        """
+        self.stages.append(StageTiming(stage=stage, duration=duration, attempt=attempt))
+
+    def total(self, stage: str) -> float:
+        """
+        Computes the total time spent in the given stage.
+
+        Args:
+            stage: Name of the pipeline stage.
+
+        Returns:
+            Sum of the durations of all steps of the stage, in seconds.
+        """
+        return sum(timing.duration for timing in self.stages if timing.stage == stage)
+
+    def retries(self, stage: str) -> int:
+        """
+        Counts the retries of the given stage.
+
+        Args:
+            stage: Name of the pipeline stage.
+
+        Returns:
+            Number of steps of the stage that were retries.
+        """
+        return sum(1 for timing in self.stages if timing.stage == stage and timing.attempt > 0)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Aggregates the recorded steps by stage.
+
+        Returns:
+            Dictionary mapping stage names to their total `duration`, number of `calls` and number of `retries`.
+        """
+        summary: Dict[str, Dict[str, float]] = defaultdict(lambda: {"duration": 0.0, "calls": 0, "retries": 0})
+        for timing in self.stages:
+            summary[timing.stage]["duration"] += timing.duration
+            summary[timing.stage]["calls"] += 1
+            summary[timing.stage]["retries"] += timing.attempt > 0
+        return dict(summary)
 
 
 @dataclass
@@ -10,10 +183,11 @@ class ViewExecutionResult:
     Args:
         results: List of dictionaries containing the results of the query execution,
             each dictionary represents a row in the result set with column names as keys.
+            For streamed queries it is a `RowStream` yielding the rows lazily.
         context: Dictionary containing addtional metadata about the query execution.
     """
 
-    results: List[Dict[str, Any]]
+    results: Union[List[Dict[str, Any]], RowStream]
     context: Dict[str, Any]
 
 
@@ -27,6 +201,7 @@ class ExecutionResult:
             each dictionary represents a row in the result set with column names as keys.
             The exact structure of the result set depends on the view that was used to execute the query,
             which can be obtained from the `view_name` attribute.
+            For streamed queries it is a `RowStream` yielding the rows lazily.
         context: Dictionary containing addtional metadata about the query execution.
         execution_time: Time taken to execute the entire query, including view selection
             and all other operations, in seconds.
@@ -34,11 +209,32 @@ class ExecutionResult:
         view_name: Name of the view that was used to execute the query.
         textual_response: Optional text response that can be used to display the query results
             in a human-readable format.
+        timings: Per-stage latency breakdown of the request. It is None if the request was tracked
+            by an event tracker not recording the timings.
     """
 
-    results: List[Dict[str, Any]]
+    results: Union[List[Dict[str, Any]], RowStream]
     context: Dict[str, Any]
     execution_time: float
     execution_time_view: float
     view_name: str
     textual_response: Optional[str] = None
+    timings: Optional[TimingBreakdown] = None
+
+
+@dataclass
+class CachedExecutionResult:
+    """
+    Represents the answer to a question stored in the collection cache.
+
+    Args:
+        view_name: Name of the view that was used to answer the question.
+        context: Part of the context of the answer needed to replay the generated query.
+        results: Rows returned by the query or None if the rows are not cached and the query has to be executed again.
+        textual_response: Natural language response generated for the cached rows, if any.
+    """
+
+    view_name: str
+    context: Dict[str, Any]
+    results: Optional[List[Dict[str, Any]]] = None
+    textual_response: Optional[str] = None
@@ -0,0 +1,58 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Tuple, TypeVar
+
+from dbally.collection.results import RowStream
+
+T = TypeVar("T")
+
+
+async def discard_tasks(tasks: Iterable[Optional[asyncio.Future]], kept_result: Any = None) -> None:
+    """
+    Cancels the tasks whose answers are no longer needed and closes the streamed results of the ones that\
+    already finished, releasing the database connections they hold.
+
+    Args:
+        tasks: The tasks to discard. None entries are skipped.
+        kept_result: The result that is returned to the caller, so it is left open.
+    """
+    pending_tasks = [task for task in tasks if task is not None]
+    for task in pending_tasks:
+        task.cancel()
+    for outcome in await asyncio.gather(*pending_tasks, return_exceptions=True):
+        if outcome is not kept_result and isinstance(getattr(outcome, "results", None), RowStream):
+            outcome.results.close()
+
+
+async def ask_speculatively(view_names: List[str], ask_view: Callable[[str], Awaitable[T]]) -> Tuple[str, T]:
+    """
+    Asks the views concurrently and returns the answer of the highest-ranked view that succeeded.
+
+    Views ranked lower than the successful one are cancelled. An error of a higher-ranked view is raised\
+    only if none of the views succeeded.
+
+    Args:
+        view_names: Names of the views, ordered from the most relevant one.
+        ask_view: Function asking the view with the given name.
+
+    Returns:
+        Name of the view that answered the question and its result.
+
+    Raises:
+        Exception: the error raised by the highest-ranked view, if none of the views succeeded.
+    """
+    if len(view_names) == 1:
+        return view_names[0], await ask_view(view_names[0])
+
+    tasks = [asyncio.ensure_future(ask_view(view_name)) for view_name in view_names]
+    errors = []
+    view_result = None
+    try:
+        for view_name, task in zip(view_names, tasks):
+            try:
+                view_result = await task
+                return view_name, view_result
+            except Exception as exc:  # pylint: disable=broad-except
+                errors.append(exc)
+        raise errors[0]
+    finally:
+        await discard_tasks(tasks, kept_result=view_result)
@@ -0,0 +1,40 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List
+
+from dbally.views.base import BaseView
+
+
+class ViewPool:
+    """
+    Keeps the view instances used by the past requests of a collection, so that they are reused instead of being\
+    built for every request.
+
+    Views are restored to their initial state with `BaseView.reset` before being reused, and views not setting\
+    `supports_reset` are never pooled.
+    """
+
+    def __init__(self) -> None:
+        self._views: Dict[str, List[BaseView]] = defaultdict(list)
+
+    @contextmanager
+    def borrow(self, name: str, build: Callable[[], BaseView]) -> Iterator[BaseView]:
+        """
+        Context manager providing an instance of the view for a single request, taken from the pool if there is\
+        a free one. Once the request is done, the instance is reset and returned to the pool.
+
+        Args:
+            name: Name of the view.
+            build: Function building a new instance of the view if the pool is empty.
+
+        Yields:
+            View instance.
+        """
+        pool = self._views[name]
+        view = pool.pop() if pool else build()
+        try:
+            yield view
+        finally:
+            if view.supports_reset:
+                view.reset()
+                pool.append(view)
@@ -0,0 +1,118 @@
+import logging
+from typing import List, Optional
+
+from dbally.cache.base import Cache, make_cache_key, normalize_text
+from dbally.collection.config import ViewSelectionConfig
+from dbally.exceptions import RequestTimeoutError
+from dbally.llms.clients.base import LLMOptions
+from dbally.view_selection.base import RankedView
+from dbally.view_selection.catalog import ViewCatalog
+
+
+class ViewSelectionCache:
+    """
+    Caches the views selected for the questions asked to a collection, so that repeated questions skip the view\
+    selection.
+
+    The entries are keyed by the normalized question and the fingerprint of the views registered in the collection,\
+    so they are invalidated when new views are registered.
+
+    Failures of the cache backend are logged and treated as cache misses, so they never fail the question.
+    """
+
+    def __init__(self, collection_name: str, catalog: ViewCatalog, cache: Cache, config: ViewSelectionConfig) -> None:
+        """
+        Args:
+            collection_name: Name of the collection.
+            catalog: Catalog of the views registered in the collection.
+            cache: Cache storing the view selections.
+            config: Settings of the view selection.
+        """
+        self.collection_name = collection_name
+        self.catalog = catalog
+        self.cache = cache
+        self.config = config
+
+    def _key(self, question: str, top_k: int, llm_options: Optional[LLMOptions]) -> str:
+        """
+        Creates the key of the cached view selection for the question.
+
+        Args:
+            question: The question to be answered.
+            top_k: Number of the views selected for the question.
+            llm_options: Options for the LLM client.
+
+        Returns:
+            The cache key, changing whenever the views registered in the collection change.
+        """
+        return make_cache_key(
+            "view_selection",
+            normalize_text(question),
+            self.collection_name,
+            self.catalog.fingerprint,
+            top_k,
+            llm_options,
+        )
+
+    async def get(self, question: str, top_k: int, llm_options: Optional[LLMOptions]) -> Optional[List[RankedView]]:
+        """
+        Looks up the views selected for the question before.
+
+        Args:
+            question: The question to be answered.
+            top_k: Number of the views selected for the question.
+            llm_options: Options for the LLM client.
+
+        Returns:
+            The selected views, ordered from the most relevant one, or None if the question was not cached.
+
+        Raises:
+            RequestTimeoutError: If the deadline of the request passed during the lookup.
+        """
+        try:
+            return await self.cache.get(self._key(question, top_k, llm_options))
+        except RequestTimeoutError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.warning(
+                "Failed to look up the view selection cache of collection %s: %s", self.collection_name, exc
+            )
+            return None
+
+    async def set(
+        self, question: str, top_k: int, llm_options: Optional[LLMOptions], ranked_views: List[RankedView]
+    ) -> None:
+        """
+        Stores the views selected for the question, if the view selector is confident enough about them.
+
+        Args:
+            question: The question to be answered.
+            top_k: Number of the views selected for the question.
+            llm_options: Options for the LLM client.
+            ranked_views: The selected views, ordered from the most relevant one.
+
+        Raises:
+            RequestTimeoutError: If the deadline of the request passed while storing the selection.
+        """
+        if not ranked_views or not self._is_confident(ranked_views[0]):
+            return
+        try:
+            await self.cache.set(self._key(question, top_k, llm_options), ranked_views, ttl=self.config.cache_ttl)
+        except RequestTimeoutError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.warning("Failed to update the view selection cache of collection %s: %s", self.collection_name, exc)
+
+    def _is_confident(self, ranked_view: RankedView) -> bool:
+        """
+        Checks whether the view selection is confident enough to be cached.
+
+        Args:
+            ranked_view: The best view chosen by the view selector.
+
+        Returns:
+            True if the selector does not score views or the score reaches `min_score`.
+        """
+        if self.config.min_score is None or ranked_view.score is None:
+            return True
+        return ranked_view.score >= self.config.min_score
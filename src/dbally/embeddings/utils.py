@@ -0,0 +1,76 @@
+from typing import TYPE_CHECKING, Dict, Hashable, List, Mapping, Optional, Sequence, TypeVar
+
+import numpy as np
+
+from dbally.embeddings.base import EmbeddingClient
+
+if TYPE_CHECKING:
+    # the audit events refer to the prompt templates, so the tracker cannot be imported at runtime
+    from dbally.audit.event_tracker import EventTracker
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+
+
+def normalize_embedding(embedding: Sequence[float]) -> np.ndarray:
+    """
+    Scales the embedding to unit length, so that the dot product of two embeddings is their cosine similarity.
+
+    Args:
+        embedding: Embedding to normalize.
+
+    Returns:
+        Normalized embedding.
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+async def embed_with_memo(
+    embedding_client: EmbeddingClient,
+    question: str,
+    texts: Mapping[KeyT, str],
+    memo: Dict[KeyT, np.ndarray],
+    event_tracker: Optional["EventTracker"] = None,
+) -> np.ndarray:
+    """
+    Embeds the question along with the texts not embedded yet, in a single call of the embedding client.\
+    Normalized embeddings of the texts are stored in the memo, so each text is embedded only once.
+
+    Args:
+        embedding_client: Client used to embed the question and the texts.
+        question: Question asked in the natural language.
+        texts: Texts to embed, by the keys of their embeddings in the memo.
+        memo: Normalized embeddings of the texts embedded before, updated in place.
+        event_tracker: Event tracker bounding the embedding call by the request deadline.
+
+    Returns:
+        Normalized embedding of the question.
+
+    Raises:
+        EmbeddingError: If embedding the question or the texts fails.
+    """
+    missing = [key for key in texts if key not in memo]
+    embedding_call = embedding_client.get_embeddings([question, *[texts[key] for key in missing]])
+    embeddings = await (event_tracker.within_deadline(embedding_call) if event_tracker else embedding_call)
+
+    for key, embedding in zip(missing, embeddings[1:]):
+        memo[key] = normalize_embedding(embedding)
+    return normalize_embedding(embeddings[0])
+
+
+def top_k_by_similarity(query_embedding: np.ndarray, embeddings: Sequence[np.ndarray], top_k: int) -> List[int]:
+    """
+    Selects up to `top_k` embeddings with the highest cosine similarity to the query.
+
+    Args:
+        query_embedding: Normalized embedding of the query.
+        embeddings: Normalized embeddings to select from.
+        top_k: Maximum number of the selected embeddings.
+
+    Returns:
+        Indices of the selected embeddings, in the order they were listed.
+    """
+    similarities = np.stack(embeddings) @ query_embedding
+    selected = np.argsort(-similarities, kind="stable")[:top_k]
+    return sorted(selected.tolist())
@@ -2,3 +2,12 @@ class DbAllyError(Exception):
     """
     Base class for all exceptions raised by db-ally.
     """
+
+
+class RequestTimeoutError(DbAllyError):
+    """
+    Error raised when a request is not answered before its deadline.
+    """
+
+    def __init__(self, message: str = "Request deadline exceeded.") -> None:
+        super().__init__(message)
@@ -45,7 +45,7 @@ class IQLProcessor(Generic[RootT], ABC):
         Raises:
             IQLError: If parsing fails.
         """
-        self.source = self._to_lower_except_in_quotes(self.source, ["AND", "OR", "NOT"])
+        self.source = self.normalize_source(self.source)
 
         try:
             ast_tree = ast.parse(self.source)
@@ -113,6 +113,19 @@ class IQLProcessor(Generic[RootT], ABC):
             raise IQLArgumentParsingError(arg, self.source)
         return arg.value
 
+    @classmethod
+    def normalize_source(cls, source: str) -> str:
+        """
+        Lowers the logical operators of the IQL query, so that it can be parsed as Python code.
+
+        Args:
+            source: IQL query.
+
+        Returns:
+            IQL query with the logical operators in lowercase.
+        """
+        return cls._to_lower_except_in_quotes(source, ["AND", "OR", "NOT"])
+
     @staticmethod
     def _to_lower_except_in_quotes(text: str, keywords: List[str]) -> str:
         """
@@ -3,7 +3,9 @@ from typing import TYPE_CHECKING, Generic, List, Optional, Type
 
 from ..audit.event_tracker import EventTracker
 from . import syntax
+from ._exceptions import IQLArgumentValidationError, IQLError, IQLFunctionNotExists, IQLIncorrectNumberArgumentsError
 from ._processor import IQLAggregationProcessor, IQLFiltersProcessor, IQLProcessor, RootT
+from ._repair import repair_iql
 
 if TYPE_CHECKING:
     from dbally.views.structured import ExposedFunction
@@ -31,6 +33,7 @@ class IQLQuery(Generic[RootT], ABC):
         source: str,
         allowed_functions: List["ExposedFunction"],
         event_tracker: Optional[EventTracker] = None,
+        repair: bool = False,
     ) -> "IQLQuery[RootT]":
         """
         Parse IQL string to IQLQuery object.
@@ -39,14 +42,26 @@ class IQLQuery(Generic[RootT], ABC):
             source: IQL string that needs to be parsed.
             allowed_functions: List of IQL functions that are allowed for this query.
             event_tracker: EventTracker object to track events.
+            repair: If True, trivial mistakes like misspelled function names or values not matching the parameter\
+            types are fixed before failing, and the query keeps the repaired source.
 
         Returns:
             IQLQuery object.
 
         Raises:
-            IQLError: If parsing fails.
+            IQLError: If parsing fails. When the repair fails too, the error of the original source is raised.
         """
-        root = await cls._processor(source, allowed_functions, event_tracker=event_tracker).process()
+        try:
+            root = await cls._processor(source, allowed_functions, event_tracker=event_tracker).process()
+        except (IQLFunctionNotExists, IQLIncorrectNumberArgumentsError, IQLArgumentValidationError) as exc:
+            repaired_source = repair_iql(source, allowed_functions) if repair else None
+            if repaired_source is None:
+                raise
+            try:
+                root = await cls._processor(repaired_source, allowed_functions, event_tracker=event_tracker).process()
+            except IQLError:
+                raise exc from None
+            source = repaired_source
         return cls(root=root, source=source)
 
 
@@ -0,0 +1,301 @@
+import ast
+import difflib
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
+
+from dbally.iql._processor import IQLProcessor
+
+if TYPE_CHECKING:
+    from dbally.views.structured import ExposedFunction
+
+# Minimal similarity of a value to the closest `Literal` option, e.g. `seniors` and `senior`
+LITERAL_CUTOFF = 0.8
+
+# Minimal length of a token of the function name in which a single misplaced character is corrected, so that short\
+# tokens such as `lt` and `gt` are never swapped
+MIN_TYPO_TOKEN_LENGTH = 4
+
+_INT_PATTERN = re.compile(r"[+-]?\d+")
+_FLOAT_PATTERN = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)")
+_NUMBER_PATTERNS = {int: _INT_PATTERN, float: _FLOAT_PATTERN}
+_BOOL_VALUES = {"true": True, "yes": True, "false": False, "no": False}
+_PLURAL_SUFFIXES = (("s", ""), ("es", ""), ("ies", "y"))
+
+_NOT_REPAIRED = object()
+
+_Replacement = Tuple[ast.expr, ast.expr, str]
+
+
+def repair_iql(source: str, allowed_functions: List["ExposedFunction"]) -> Optional[str]:
+    """
+    Fixes the trivial mistakes of the LLM in the IQL query, so that it can be parsed without another round trip\
+    to the LLM. The repair is deterministic and conservative:
+
+    - misspelled function names are replaced with the allowed function, if it is the only one differing from the\
+    misspelled name by the case, the plural form of a single word (e.g. `filter_by_citys` becomes `filter_by_city`)\
+    or a single character slip in a long word (e.g. `filter_by_ctiy` becomes `filter_by_city`),
+    - values not matching the `Literal` options are snapped to the closest option, e.g. `'Senior'` becomes `'senior'`,
+    - numbers and booleans passed as strings are converted to the parameter type, and numbers passed to the string\
+    parameters are quoted,
+    - values passed to a list parameter are wrapped in a list.
+
+    Arguments of the parameters with a similarity index are left untouched, as they are matched by the index anyway.
+
+    Args:
+        source: IQL query that failed to parse.
+        allowed_functions: Functions allowed in the query.
+
+    Returns:
+        Repaired IQL query, or None if nothing could be repaired.
+    """
+    try:
+        tree = ast.parse(IQLProcessor.normalize_source(source))
+    except (SyntaxError, ValueError):
+        return None
+
+    functions = {function.name: function for function in allowed_functions}
+    replacements: List[_Replacement] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            replacements.extend(_repair_call(node, functions))
+
+    if not replacements:
+        return None
+
+    # the offsets of the nodes are counted in the bytes of the UTF-8 encoded source
+    encoded = source.encode()
+    line_offsets = [0]
+    for line in encoded.splitlines(keepends=True):
+        line_offsets.append(line_offsets[-1] + len(line))
+
+    spans = [
+        (
+            line_offsets[first.lineno - 1] + first.col_offset,
+            line_offsets[last.end_lineno - 1] + last.end_col_offset,  # type: ignore
+            replacement,
+        )
+        for first, last, replacement in replacements
+    ]
+    for start, end, replacement in sorted(spans, reverse=True):
+        encoded = encoded[:start] + replacement.encode() + encoded[end:]
+    return encoded.decode()
+
+
+def _repair_call(node: ast.Call, functions: Dict[str, "ExposedFunction"]) -> List[_Replacement]:
+    """
+    Fixes the name and the arguments of the function call.
+
+    Args:
+        node: Function call to repair.
+        functions: Allowed functions by their names.
+
+    Returns:
+        Replacements of the nodes of the call, as the first and the last replaced node and the replacing code.
+    """
+    name = node.func.id  # type: ignore
+    replacements: List[_Replacement] = []
+    if name not in functions:
+        name = _match_function_name(name, list(functions))  # type: ignore
+        if name is None:
+            return replacements
+        replacements.append((node.func, node.func, name))
+
+    parameters = functions[name].parameters
+    args = node.args
+    if len(args) > 1 and len(parameters) == 1 and _is_list(parameters[0].type) and not node.keywords:
+        value = _literal_value(ast.List(elts=args, ctx=ast.Load()))
+        repaired = _coerce(value, parameters[0].type) if value is not _NOT_REPAIRED else _NOT_REPAIRED
+        if repaired is not _NOT_REPAIRED:
+            replacements.append((args[0], args[-1], repr(repaired)))
+        return replacements
+
+    if len(args) != len(parameters):
+        return replacements
+
+    for arg, parameter in zip(args, parameters):
+        value = _literal_value(arg)
+        if parameter.similarity_index or value is _NOT_REPAIRED:
+            continue
+        repaired = _coerce(value, parameter.type)
+        if repaired is not _NOT_REPAIRED and (type(repaired), repaired) != (type(value), value):
+            replacements.append((arg, arg, repr(repaired)))
+    return replacements
+
+
+def _match_function_name(name: str, allowed_names: List[str]) -> Optional[str]:
+    """
+    Finds the allowed function name the misspelled name was meant to be.
+
+    Args:
+        name: Misspelled function name.
+        allowed_names: Names of the allowed functions.
+
+    Returns:
+        The allowed name, or None if no name or more than one name differ from the misspelled one by a typo.
+    """
+    matches = [allowed_name for allowed_name in allowed_names if _is_typo(name, allowed_name)]
+    return matches[0] if len(matches) == 1 else None
+
+
+def _is_typo(name: str, allowed_name: str) -> bool:
+    """
+    Checks whether the names differ only by the case, the plural form of a single word or a single character slip\
+    in a long word. Names differing by a whole word, such as `filter_by_min_salary` and `filter_by_max_salary`,\
+    are never considered a typo.
+
+    Args:
+        name: Misspelled function name.
+        allowed_name: Name of the allowed function.
+
+    Returns:
+        True if the misspelled name is a typo of the allowed name.
+    """
+    tokens = name.lower().split("_")
+    allowed_tokens = allowed_name.lower().split("_")
+    if len(tokens) != len(allowed_tokens):
+        return False
+
+    differences = [(token, allowed) for token, allowed in zip(tokens, allowed_tokens) if token != allowed]
+    if not differences:
+        return True
+    if len(differences) > 1:
+        return False
+
+    token, allowed = differences[0]
+    return _is_plural_form(token, allowed) or _is_plural_form(allowed, token) or _is_character_slip(token, allowed)
+
+
+def _is_plural_form(plural: str, singular: str) -> bool:
+    return any(
+        plural == singular[: len(singular) - len(singular_suffix)] + plural_suffix
+        for plural_suffix, singular_suffix in _PLURAL_SUFFIXES
+        if singular.endswith(singular_suffix)
+    )
+
+
+def _is_character_slip(token: str, allowed: str) -> bool:
+    """
+    Checks whether a single character of the long word was added, dropped, replaced or swapped with its neighbour.
+
+    Args:
+        token: Misspelled word.
+        allowed: Correct word.
+
+    Returns:
+        True if the words differ by a single character slip.
+    """
+    if max(len(token), len(allowed)) < MIN_TYPO_TOKEN_LENGTH:
+        return False
+
+    prefix = 0
+    while prefix < min(len(token), len(allowed)) and token[prefix] == allowed[prefix]:
+        prefix += 1
+    token_rest, allowed_rest = token[prefix:], allowed[prefix:]
+    return (
+        token_rest[1:] == allowed_rest
+        or token_rest == allowed_rest[1:]
+        or token_rest[1:] == allowed_rest[1:]
+        or (len(token_rest) > 1 and token_rest[1::-1] + token_rest[2:] == allowed_rest)
+    )
+
+
+def _literal_value(node: ast.expr) -> Any:
+    """
+    Evaluates the argument of the function call, as parsed by the IQL processors.
+
+    Args:
+        node: Argument of the function call.
+
+    Returns:
+        Value of the argument, or `_NOT_REPAIRED` if it is not a constant or a list of constants.
+    """
+    if isinstance(node, ast.List):
+        values = [_literal_value(element) for element in node.elts]
+        return _NOT_REPAIRED if any(value is _NOT_REPAIRED for value in values) else values
+    if isinstance(node, ast.Constant):
+        return node.value
+    return _NOT_REPAIRED
+
+
+def _is_list(required_type: Any) -> bool:
+    required_type = required_type.__origin__ if hasattr(required_type, "__metadata__") else required_type
+    return required_type is list or getattr(required_type, "__origin__", None) is list
+
+
+def _coerce(value: Any, required_type: Any) -> Any:
+    """
+    Converts the value to the required type.
+
+    Args:
+        value: Value of the argument.
+        required_type: Type of the parameter.
+
+    Returns:
+        Converted value, or `_NOT_REPAIRED` if the value cannot be converted.
+    """
+    if hasattr(required_type, "__metadata__"):
+        required_type = required_type.__origin__
+
+    origin = getattr(required_type, "__origin__", None)
+    if origin is Literal:
+        return _snap_to_literal(value, required_type.__args__)
+
+    if _is_list(required_type):
+        args = getattr(required_type, "__args__", None)
+        values = value if isinstance(value, list) else [value]
+        if not args:
+            return values
+        elements = [_coerce(element, args[0]) for element in values]
+        return _NOT_REPAIRED if any(element is _NOT_REPAIRED for element in elements) else elements
+
+    if isinstance(value, list):
+        return _NOT_REPAIRED
+    return _coerce_scalar(value, required_type)
+
+
+def _coerce_scalar(value: Any, required_type: Any) -> Any:
+    """
+    Converts the scalar value to the required scalar type.
+
+    Args:
+        value: Value of the argument.
+        required_type: Type of the parameter.
+
+    Returns:
+        Converted value, or `_NOT_REPAIRED` if the value cannot be converted.
+    """
+    if isinstance(value, str):
+        if required_type is bool:
+            return _BOOL_VALUES.get(value.strip().lower(), _NOT_REPAIRED)
+        pattern = _NUMBER_PATTERNS.get(required_type)
+        if pattern is not None and pattern.fullmatch(value.strip()):
+            return required_type(value)
+    elif required_type is str and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+
+def _snap_to_literal(value: Any, options: Tuple[Any, ...]) -> Any:
+    """
+    Finds the `Literal` option closest to the value, ignoring the case and the surrounding whitespaces.
+
+    Args:
+        value: Value of the argument.
+        options: Options of the `Literal` type.
+
+    Returns:
+        The closest option, or `_NOT_REPAIRED` if no option is close enough.
+    """
+    if value in options:
+        return value
+
+    normalized: Dict[str, Any] = {}
+    for option in options:
+        normalized.setdefault(str(option).strip().lower(), option)
+
+    text = str(value).strip().lower()
+    if text in normalized:
+        return normalized[text]
+
+    matches = difflib.get_close_matches(text, list(normalized), n=1, cutoff=LITERAL_CUTOFF)
+    return normalized[matches[0]] if matches else _NOT_REPAIRED
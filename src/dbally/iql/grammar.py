@@ -0,0 +1,346 @@
+from functools import cached_property
+from typing import Any, FrozenSet, Iterable, List, Literal, Optional, Tuple
+
+from dbally.prompt.grammar import Grammar
+from dbally.views.exposed_functions import ExposedFunction
+
+# A stack of grammar symbols still to be matched, with the next expected symbol first
+Stack = Tuple[tuple, ...]
+State = FrozenSet[Stack]
+
+UNSUPPORTED_QUERY = "UNSUPPORTED QUERY"
+
+_WS = ("ws",)
+_NON_TERMINALS = {"expr", "tail", "term", "call", "value", "items", "items_tail"}
+_NUMBER_END_PHASES = {"zero", "int", "frac"}
+
+
+def _lit(text: str) -> tuple:
+    return ("lit", text, 0)
+
+
+class IQLGrammar(Grammar):
+    """
+    Grammar of the IQL queries using only the given functions, with the exact number of arguments of each function\
+    and the argument values matching the parameter types, e.g. one of the `Literal` values. The response may also be\
+    `UNSUPPORTED QUERY`.
+
+    Responses following the grammar are always parsed by the IQL processors, apart from the arguments rejected\
+    by the similarity indexes, so LLM clients supporting constrained decoding do not need to retry the generation.
+    """
+
+    def __init__(self, functions: List[ExposedFunction], operators: bool = True) -> None:
+        """
+        Args:
+            functions: Functions allowed in the query.
+            operators: If True, the functions can be joined with the logic operators (AND, OR, NOT) and parentheses,\
+            as in the filters. Otherwise, the query is a single function call, as the aggregation.
+        """
+        self.functions = functions
+        self.operators = operators
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, IQLGrammar) and self._signature == other._signature
+
+    def __hash__(self) -> int:
+        return hash(self._signature)
+
+    @cached_property
+    def _signature(self) -> Tuple[Any, ...]:
+        # the grammar depends only on the names and parameter types of the functions
+        functions = tuple((function.name, tuple(map(str, function.parameters))) for function in self.functions)
+        return functions, self.operators
+
+    @cached_property
+    def _calls(self) -> Tuple[Stack, ...]:
+        return tuple(self._call_alternative(function) for function in self.functions)
+
+    @cached_property
+    def initial_state(self) -> State:
+        """
+        Returns the state of the grammar before any character is consumed. The grammar is built lazily,\
+        so creating it costs nothing for the LLM clients not supporting constrained decoding.
+
+        Returns:
+            Initial state of the grammar.
+        """
+        top = ("expr",) if self.operators else ("call",)
+        return self._closure([(top, _WS), (_lit(UNSUPPORTED_QUERY),)])
+
+    def step(self, state: State, char: str) -> Optional[State]:
+        """
+        Consumes a single character.
+
+        Args:
+            state: Current state of the grammar.
+            char: Character to consume.
+
+        Returns:
+            State after consuming the character, or None if the character cannot follow the consumed text.
+        """
+        stacks = [next_stack for stack in state if stack for next_stack in self._consume(stack, char)]
+        return self._closure(stacks) if stacks else None
+
+    def is_complete(self, state: State) -> bool:
+        """
+        Checks whether the text consumed so far is a complete IQL query.
+
+        Args:
+            state: Current state of the grammar.
+
+        Returns:
+            True if the query may end in this state.
+        """
+        return () in state
+
+    def _closure(self, stacks: Iterable[Stack]) -> State:
+        """
+        Expands the non-terminal symbols on top of the stacks, until each stack expects a character or is empty.
+
+        Args:
+            stacks: Stacks to expand.
+
+        Returns:
+            Expanded stacks.
+        """
+        pending = list(stacks)
+        seen = set()
+        result = set()
+        while pending:
+            stack = pending.pop()
+            if stack in seen:
+                continue
+            seen.add(stack)
+
+            if not stack:
+                result.add(stack)
+                continue
+
+            top, rest = stack[0], stack[1:]
+            if top[0] in _NON_TERMINALS:
+                pending.extend(alternative + rest for alternative in self._alternatives(top))
+                continue
+
+            result.add(stack)
+            if top[0] == "ws" or (top[0] == "num" and top[1] in _NUMBER_END_PHASES):
+                pending.append(rest)
+
+        return frozenset(result)
+
+    def _alternatives(self, symbol: tuple) -> List[Stack]:
+        """
+        Lists the sequences of symbols the non-terminal symbol can be replaced with.
+
+        Args:
+            symbol: Non-terminal symbol.
+
+        Returns:
+            Alternative sequences of symbols.
+        """
+        kind = symbol[0]
+        if kind == "expr":
+            return [(("term", False), ("tail",))]
+        if kind == "tail":
+            return [()] + [(_WS, _lit(keyword), ("term", True), ("tail",)) for keyword in ("and", "AND", "or", "OR")]
+        if kind == "term":
+            return self._term_alternatives(symbol[1])
+        if kind == "call":
+            return list(self._calls)
+        if kind == "value":
+            return self._value_alternatives(symbol[1])
+        return self._items_alternatives(symbol)
+
+    @staticmethod
+    def _term_alternatives(after_keyword: bool) -> List[Stack]:
+        """
+        Lists the sequences of symbols the term can be replaced with.
+
+        Args:
+            after_keyword: Whether the term follows a logical operator.
+
+        Returns:
+            Alternative sequences of symbols.
+        """
+        parenthesized = (_lit("("), _WS, ("expr",), _WS, _lit(")"))
+        if after_keyword:
+            # keywords have to be separated from the next term unless it is parenthesized
+            return [(_lit(" "), _WS, ("term", False)), (_WS, *parenthesized)]
+        return [(_lit("not"), ("term", True)), (_lit("NOT"), ("term", True)), parenthesized, (("call",),)]
+
+    @staticmethod
+    def _items_alternatives(symbol: tuple) -> List[Stack]:
+        """
+        Lists the sequences of symbols the rest of the list can be replaced with.
+
+        Args:
+            symbol: The `items` or `items_tail` non-terminal symbol.
+
+        Returns:
+            Alternative sequences of symbols.
+
+        Raises:
+            ValueError: If the symbol is not known.
+        """
+        kind = symbol[0]
+        if kind == "items":
+            return [(_lit("]"),), (("value", symbol[1]), _WS, ("items_tail", symbol[1]))]
+        if kind == "items_tail":
+            return [(_lit("]"),), (_lit(","), _WS, ("value", symbol[1]), _WS, ("items_tail", symbol[1]))]
+        raise ValueError(f"Unknown symbol: {symbol}")
+
+    @staticmethod
+    def _value_alternatives(value_type: tuple) -> List[Stack]:
+        """
+        Lists the sequences of symbols matching the literal values of the type.
+
+        Args:
+            value_type: Type of the value, as returned by `_value_type`.
+
+        Returns:
+            Alternative sequences of symbols.
+        """
+        kind = value_type[0]
+        if kind == "choice":
+            return [(_lit(literal),) for literal in value_type[1]]
+        if kind == "str":
+            return [(_lit(quote), ("str", quote, False)) for quote in ('"', "'")]
+        if kind == "num":
+            return [(("num", "start", value_type[1]),)]
+        if kind == "bool":
+            return [(_lit("True"),), (_lit("False"),)]
+        if kind == "list":
+            return [(_lit("["), _WS, ("items", value_type[1]))]
+        return [
+            *IQLGrammar._value_alternatives(("str",)),
+            *IQLGrammar._value_alternatives(("num", True)),
+            (_lit("True"),),
+            (_lit("False"),),
+            (_lit("None"),),
+            (_lit("["), _WS, ("items", value_type)),
+        ]
+
+    @staticmethod
+    def _consume(stack: Stack, char: str) -> List[Stack]:
+        """
+        Consumes the character with the terminal symbol on top of the stack.
+
+        Args:
+            stack: Stack with a terminal symbol on top.
+            char: Character to consume.
+
+        Returns:
+            Stacks after consuming the character, empty if the character is not accepted.
+        """
+        top, rest = stack[0], stack[1:]
+        kind = top[0]
+
+        if kind == "lit":
+            _, text, index = top
+            if text[index] != char:
+                return []
+            return [rest if index + 1 == len(text) else (("lit", text, index + 1), *rest)]
+
+        if kind == "ws":
+            return [stack] if char == " " else []
+
+        if kind == "str":
+            return IQLGrammar._consume_string(stack, char)
+        return IQLGrammar._consume_number(stack, char)
+
+    @staticmethod
+    def _consume_string(stack: Stack, char: str) -> List[Stack]:
+        """
+        Consumes the character of the quoted string on top of the stack.
+
+        Args:
+            stack: Stack with a string symbol on top.
+            char: Character to consume.
+
+        Returns:
+            Stacks after consuming the character, empty if the character is not accepted.
+        """
+        (_, quote, escaped), rest = stack[0], stack[1:]
+        if escaped:
+            return [(("str", quote, False), *rest)] if char in "\\\"'" else []
+        if char == "\\":
+            return [(("str", quote, True), *rest)]
+        if char == quote:
+            return [rest]
+        return [stack] if char != "\n" else []
+
+    @staticmethod
+    def _consume_number(stack: Stack, char: str) -> List[Stack]:
+        """
+        Consumes the character of the number on top of the stack.
+
+        Args:
+            stack: Stack with a number symbol on top.
+            char: Character to consume.
+
+        Returns:
+            Stacks after consuming the character, empty if the character is not accepted.
+        """
+        (_, phase, fractional), rest = stack[0], stack[1:]
+        next_phase = None
+        # negative numbers are not constants in the syntax tree, so they are not supported by the IQL processors
+        if char == "0" and phase == "start":
+            next_phase = "zero"
+        elif char.isdigit() and char.isascii():
+            next_phase = {"start": "int", "int": "int", "dot": "frac", "frac": "frac"}.get(phase)
+        elif char == "." and fractional and phase in ("zero", "int"):
+            next_phase = "dot"
+        return [(("num", next_phase, fractional), *rest)] if next_phase else []
+
+    @staticmethod
+    def _call_alternative(function: ExposedFunction) -> Stack:
+        """
+        Creates the sequence of symbols matching the call of the function.
+
+        Args:
+            function: Function to call.
+
+        Returns:
+            Sequence of symbols matching the function call.
+        """
+        symbols: List[tuple] = [_lit(f"{function.name}("), _WS]
+        for index, param in enumerate(function.parameters):
+            if index:
+                symbols.extend([_WS, _lit(","), _WS])
+            symbols.append(("value", IQLGrammar._value_type(param.type)))
+        symbols.extend([_WS, _lit(")")])
+        return tuple(symbols)
+
+    @staticmethod
+    def _value_type(param_type: Any) -> tuple:
+        """
+        Describes the literal values accepted for the parameter type in a hashable form.
+
+        Args:
+            param_type: Type of the parameter.
+
+        Returns:
+            Description of the accepted values.
+        """
+        if hasattr(param_type, "__metadata__"):
+            param_type = param_type.__origin__
+
+        origin = getattr(param_type, "__origin__", None)
+        if origin is Literal:
+            literals = [repr(value) for value in param_type.__args__]
+            # strings can be quoted either way
+            literals += [
+                f'"{value}"'
+                for value in param_type.__args__
+                if isinstance(value, str) and '"' not in value and repr(value) == f"'{value}'"
+            ]
+            return ("choice", tuple(dict.fromkeys(literals)))
+        if origin is list or param_type is list:
+            args = getattr(param_type, "__args__", None)
+            return ("list", IQLGrammar._value_type(args[0]) if args else ("any",))
+        if param_type is bool:
+            return ("bool",)
+        if param_type in (int, float):
+            return ("num", param_type is float)
+        if param_type is str:
+            return ("str",)
+        return ("any",)
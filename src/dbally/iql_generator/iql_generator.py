@@ -1,8 +1,12 @@
 import asyncio
+import logging
+from collections import deque
 from dataclasses import dataclass
-from typing import Generic, List, Optional, TypeVar, Union
+from typing import Awaitable, Deque, Dict, Generic, List, Optional, Type, TypeVar, Union
 
 from dbally.audit.event_tracker import EventTracker
+from dbally.cache.base import Cache, make_cache_key, normalize_text
+from dbally.exceptions import RequestTimeoutError
 from dbally.iql import IQLError, IQLQuery
 from dbally.iql._query import IQLAggregationQuery, IQLFiltersQuery
 from dbally.iql_generator.prompt import (
@@ -10,8 +14,11 @@ from dbally.iql_generator.prompt import (
     AGGREGATION_GENERATION_TEMPLATE,
     FILTERING_DECISION_TEMPLATE,
     FILTERS_GENERATION_TEMPLATE,
+    IQL_GENERATION_TEMPLATE,
     DecisionPromptFormat,
+    IQLCombinedPromptFormat,
     IQLGenerationPromptFormat,
+    UnsupportedQueryError,
 )
 from dbally.llms.base import LLM
 from dbally.llms.clients.base import LLMOptions
@@ -52,21 +59,46 @@ class IQLGenerator:
         self,
         filters_generation: Optional["IQLOperationGenerator"] = None,
         aggregation_generation: Optional["IQLOperationGenerator"] = None,
+        combined_generation: Optional["IQLCombinedGenerator"] = None,
+        single_call: bool = False,
+        speculation_threshold: Optional[float] = None,
+        cache: Optional[Cache] = None,
+        cache_ttl: Optional[float] = None,
     ) -> None:
         """
         Constructs a new IQLGenerator instance.
 
         Args:
-            decision_prompt: Prompt template for filtering decision making.
-            generation_prompt: Prompt template for IQL generation.
+            filters_generation: Generator of the filters IQL.
+            aggregation_generation: Generator of the aggregation IQL.
+            combined_generation: Generator of both filters and aggregation IQL in a single LLM call, used in\
+            the single call mode.
+            single_call: If True, the filtering and aggregation decisions and their IQL are generated in a single\
+            LLM call instead of up to four, which cuts the latency and the token usage at the cost of a more\
+            demanding prompt. Enabled as well when `combined_generation` is provided.
+            speculation_threshold: Speculation threshold of the default filters and aggregation generators,\
+            see `IQLOperationGenerator`.
+            cache: Cache storing the generated IQL, keyed by the normalized question, the view, its filters,\
+            aggregations and examples, and the LLM model. Cached IQL is parsed again on use, so the similarity\
+            indexes are consulted with their current content. Failures of the cache are logged and treated\
+            as cache misses.
+            cache_ttl: Time to live of the cached IQL in seconds. If None, the default TTL of the cache is used.
         """
+        self._cache = cache
+        self.cache_ttl = cache_ttl
+        if single_call and combined_generation is None:
+            combined_generation = IQLCombinedGenerator(IQL_GENERATION_TEMPLATE)
+
+        self._combined_generation = combined_generation
         self._filters_generation = filters_generation or IQLOperationGenerator[IQLFiltersQuery](
             FILTERING_DECISION_TEMPLATE,
             FILTERS_GENERATION_TEMPLATE,
+            speculation_threshold=speculation_threshold,
         )
         self._aggregation_generation = aggregation_generation or IQLOperationGenerator[IQLAggregationQuery](
             AGGREGATION_DECISION_TEMPLATE,
             AGGREGATION_GENERATION_TEMPLATE,
+            speculation_threshold=speculation_threshold,
         )
 
     # pylint: disable=too-many-arguments
@@ -81,6 +113,7 @@ class IQLGenerator:
         event_tracker: Optional[EventTracker] = None,
         llm_options: Optional[LLMOptions] = None,
         n_retries: int = 3,
+        view_name: str = "",
     ) -> IQLGeneratorState:
         """
         Generates IQL operations for the given question.
@@ -94,10 +127,201 @@ class IQLGenerator:
             event_tracker: Event store used to audit the generation process.
             llm_options: Options to use for the LLM client.
             n_retries: Number of retries to regenerate IQL in case of errors in parsing or LLM connection.
+            view_name: Name of the view the IQL is generated for, distinguishing its cached IQL.
 
         Returns:
             Generated IQL operations.
         """
+        if self._cache is None:
+            return await self._generate(
+                question=question,
+                filters=filters,
+                aggregations=aggregations,
+                examples=examples,
+                llm=llm,
+                event_tracker=event_tracker,
+                llm_options=llm_options,
+                n_retries=n_retries,
+            )
+
+        cache_key = self._cache_key(question, filters, aggregations, examples, llm, view_name)
+        cached_iql = await self._get_cached(cache_key)
+        if cached_iql is not None:
+            state = await self._parse_cached(cached_iql, filters, aggregations, event_tracker)
+            if state is not None:
+                return state
+
+        state = await self._generate(
+            question=question,
+            filters=filters,
+            aggregations=aggregations,
+            examples=examples,
+            llm=llm,
+            event_tracker=event_tracker,
+            llm_options=llm_options,
+            n_retries=n_retries,
+        )
+        if not state.failed:
+            await self._set_cached(cache_key, state)
+        return state
+
+    async def _get_cached(self, cache_key: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Looks up the cached IQL, treating a failure of the cache as a cache miss.
+
+        Args:
+            cache_key: Key of the cached IQL.
+
+        Returns:
+            Cached IQL sources of the filters and the aggregation, or None if there are none.
+
+        Raises:
+            RequestTimeoutError: If the deadline of the request passed during the lookup.
+        """
+        try:
+            return await self._cache.get(cache_key)
+        except RequestTimeoutError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.warning("Failed to look up the IQL cache: %s", exc)
+            return None
+
+    async def _set_cached(self, cache_key: str, state: IQLGeneratorState) -> None:
+        """
+        Stores the generated IQL in the cache, logging the failures of the cache.
+
+        Args:
+            cache_key: Key of the cached IQL.
+            state: Generated IQL operations.
+
+        Raises:
+            RequestTimeoutError: If the deadline of the request passed while storing the IQL.
+        """
+        try:
+            await self._cache.set(
+                cache_key,
+                {
+                    "filters": str(state.filters) if state.filters else None,
+                    "aggregation": str(state.aggregation) if state.aggregation else None,
+                },
+                ttl=self.cache_ttl,
+            )
+        except RequestTimeoutError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.warning("Failed to update the IQL cache: %s", exc)
+
+    @staticmethod
+    def _cache_key(
+        question: str,
+        filters: List[ExposedFunction],
+        aggregations: List[ExposedFunction],
+        examples: List[FewShotExample],
+        llm: LLM,
+        view_name: str,
+    ) -> str:
+        """
+        Creates the key of the cached IQL for the question. The signatures and docstrings of the filters and\
+        aggregations are a part of the key, so changing them invalidates the cached IQL of the view.
+
+        Args:
+            question: User question.
+            filters: List of filters exposed by the view.
+            aggregations: List of aggregations exposed by the view.
+            examples: List of examples injected during filters and aggregation generation.
+            llm: LLM used to generate IQL.
+            view_name: Name of the view the IQL is generated for.
+
+        Returns:
+            The cache key.
+        """
+        view_signature = make_cache_key(
+            [str(method) for method in filters],
+            [str(method) for method in aggregations],
+            [str(example) for example in examples],
+        )
+        return make_cache_key("iql", normalize_text(question), view_name, view_signature, llm.model_name)
+
+    @staticmethod
+    async def _parse_cached(
+        cached_iql: Dict[str, Optional[str]],
+        filters: List[ExposedFunction],
+        aggregations: List[ExposedFunction],
+        event_tracker: Optional[EventTracker],
+    ) -> Optional[IQLGeneratorState]:
+        """
+        Parses the cached IQL again, resolving the arguments with the current content of the similarity indexes.
+
+        Args:
+            cached_iql: Cached IQL sources of the filters and the aggregation.
+            filters: List of filters exposed by the view.
+            aggregations: List of aggregations exposed by the view.
+            event_tracker: Event store used to audit the parsing process.
+
+        Returns:
+            Parsed IQL operations or None if the cached IQL is no longer valid.
+        """
+        event_tracker = event_tracker or EventTracker()
+        try:
+            with event_tracker.measure("iql_parsing"):
+                return IQLGeneratorState(
+                    filters=await IQLFiltersQuery.parse(
+                        source=cached_iql["filters"],
+                        allowed_functions=filters,
+                        event_tracker=event_tracker,
+                    )
+                    if cached_iql["filters"]
+                    else None,
+                    aggregation=await IQLAggregationQuery.parse(
+                        source=cached_iql["aggregation"],
+                        allowed_functions=aggregations,
+                        event_tracker=event_tracker,
+                    )
+                    if cached_iql["aggregation"]
+                    else None,
+                )
+        except IQLError:
+            return None
+
+    async def _generate(
+        self,
+        *,
+        question: str,
+        filters: List[ExposedFunction],
+        aggregations: List[ExposedFunction],
+        examples: List[FewShotExample],
+        llm: LLM,
+        event_tracker: Optional[EventTracker] = None,
+        llm_options: Optional[LLMOptions] = None,
+        n_retries: int = 3,
+    ) -> IQLGeneratorState:
+        """
+        Generates IQL operations for the given question with the LLM.
+
+        Args:
+            question: User question.
+            filters: List of filters exposed by the view.
+            aggregations: List of aggregations exposed by the view.
+            examples: List of examples to be injected during filters and aggregation generation.
+            llm: LLM used to generate IQL.
+            event_tracker: Event store used to audit the generation process.
+            llm_options: Options to use for the LLM client.
+            n_retries: Number of retries to regenerate IQL in case of errors in parsing or LLM connection.
+
+        Returns:
+            Generated IQL operations.
+        """
+        if self._combined_generation is not None:
+            return await self._generate_combined(
+                question=question,
+                filters=filters,
+                aggregations=aggregations,
+                examples=examples,
+                llm=llm,
+                event_tracker=event_tracker,
+                llm_options=llm_options,
+                n_retries=n_retries,
+            )
 
         async def async_none():
             return None
@@ -132,16 +356,74 @@ class IQLGenerator:
             aggregation=aggregation,
         )
 
+    async def _generate_combined(
+        self,
+        *,
+        question: str,
+        filters: List[ExposedFunction],
+        aggregations: List[ExposedFunction],
+        examples: List[FewShotExample],
+        llm: LLM,
+        event_tracker: Optional[EventTracker] = None,
+        llm_options: Optional[LLMOptions] = None,
+        n_retries: int = 3,
+    ) -> IQLGeneratorState:
+        """
+        Generates IQL operations for the given question in a single LLM call.
+
+        Args:
+            question: User question.
+            filters: List of filters exposed by the view.
+            aggregations: List of aggregations exposed by the view.
+            examples: List of examples to be injected during filters and aggregation generation.
+            llm: LLM used to generate IQL.
+            event_tracker: Event store used to audit the generation process.
+            llm_options: Options to use for the LLM client.
+            n_retries: Number of retries to regenerate IQL in case of errors in parsing or LLM connection.
+
+        Returns:
+            Generated IQL operations, with the error in place of the operations that could not be generated.
+        """
+        if not filters and not aggregations:
+            return IQLGeneratorState()
+
+        try:
+            return await self._combined_generation(
+                question=question,
+                filters=filters,
+                aggregations=aggregations,
+                examples=examples,
+                llm=llm,
+                llm_options=llm_options,
+                event_tracker=event_tracker,
+                n_retries=n_retries,
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            # errors are reported in the state, as the separate generations do with `asyncio.gather`
+            return IQLGeneratorState(
+                filters=exc if filters else None,
+                aggregation=exc if aggregations else None,
+            )
+
 
 class IQLOperationGenerator(Generic[IQLQueryT]):
     """
     Generates IQL queries for the given question.
+
+    By default, the IQL is generated only after the assessor decides that the operation is needed. With\
+    `speculation_threshold` set, the IQL is generated concurrently with the decision, and discarded if the operation\
+    is not needed, whenever the assessor recently decided in favour of the operation often enough. This takes one LLM\
+    round trip off the critical path at the cost of the tokens spent on the discarded generations.
     """
 
+    DECISION_WINDOW = 100
+    SPECULATION_MIN_DECISIONS = 10
+
     def __init__(
         self,
         assessor_prompt: PromptTemplate[DecisionPromptFormat],
         generator_prompt: PromptTemplate[IQLGenerationPromptFormat],
+        speculation_threshold: Optional[float] = None,
     ) -> None:
         """
         Constructs a new IQLGenerator instance.
@@ -149,9 +431,37 @@ class IQLOperationGenerator(Generic[IQLQueryT]):
         Args:
             assessor_prompt: Prompt template for filtering decision making.
             generator_prompt: Prompt template for IQL generation.
+            speculation_threshold: if set, the IQL is generated speculatively when at least this fraction\
+            of the recent decisions were positive, see `positive_decision_rate`. If None, the IQL is never\
+            generated speculatively.
         """
         self.assessor = IQLQuestionAssessor(assessor_prompt)
         self.generator = IQLQueryGenerator[IQLQueryT](generator_prompt)
+        self.speculation_threshold = speculation_threshold
+        self._decisions: Deque[bool] = deque(maxlen=self.DECISION_WINDOW)
+
+    @property
+    def positive_decision_rate(self) -> float:
+        """
+        Returns the fraction of recent questions the assessor decided to apply the operation to.
+
+        Returns:
+            Positive decision rate of the last `DECISION_WINDOW` questions, or 0 if there were no questions yet.
+        """
+        return sum(self._decisions) / len(self._decisions) if self._decisions else 0.0
+
+    def _should_speculate(self) -> bool:
+        """
+        Decides whether to generate the IQL concurrently with the decision of the assessor.
+
+        Returns:
+            True if the assessor recently decided in favour of the operation often enough.
+        """
+        return (
+            self.speculation_threshold is not None
+            and len(self._decisions) >= self.SPECULATION_MIN_DECISIONS
+            and self.positive_decision_rate >= self.speculation_threshold
+        )
 
     async def __call__(
         self,
@@ -184,25 +494,42 @@ class IQLOperationGenerator(Generic[IQLQueryT]):
             IQLError: If IQL parsing fails after all retries.
             UnsupportedQueryError: If the question is not supported by the view.
         """
-        decision = await self.assessor(
-            question=question,
-            llm=llm,
-            llm_options=llm_options,
-            event_tracker=event_tracker,
-            n_retries=n_retries,
-        )
-        if not decision:
-            return None
 
-        return await self.generator(
-            question=question,
-            methods=methods,
-            examples=examples,
-            llm=llm,
-            llm_options=llm_options,
-            event_tracker=event_tracker,
-            n_retries=n_retries,
-        )
+        def generate() -> Awaitable[IQLQueryT]:
+            """
+            Starts the generation of the IQL query.
+
+            Returns:
+                Awaitable generated IQL query.
+            """
+            return self.generator(
+                question=question,
+                methods=methods,
+                examples=examples,
+                llm=llm,
+                llm_options=llm_options,
+                event_tracker=event_tracker,
+                n_retries=n_retries,
+            )
+
+        generation_task = asyncio.ensure_future(generate()) if self._should_speculate() else None
+        try:
+            decision = await self.assessor(
+                question=question,
+                llm=llm,
+                llm_options=llm_options,
+                event_tracker=event_tracker,
+                n_retries=n_retries,
+            )
+            self._decisions.append(decision)
+            if not decision:
+                return None
+            return await (generation_task or generate())
+        finally:
+            if generation_task:
+                # the speculative generation is discarded if the operation is not needed
+                generation_task.cancel()
+                await asyncio.gather(generation_task, return_exceptions=True)
 
 
 class IQLQuestionAssessor:
@@ -242,14 +569,16 @@ class IQLQuestionAssessor:
             question=question,
         )
         formatted_prompt = self.prompt.format_prompt(prompt_format)
+        event_tracker = event_tracker or EventTracker()
 
         for retry in range(n_retries + 1):
             try:
-                response = await llm.generate_text(
-                    prompt=formatted_prompt,
-                    event_tracker=event_tracker,
-                    options=llm_options,
-                )
+                with event_tracker.measure("iql_assessment", attempt=retry):
+                    response = await llm.generate_text(
+                        prompt=formatted_prompt,
+                        event_tracker=event_tracker,
+                        options=llm_options,
+                    )
                 # TODO: Move response parsing to llm generate_text method
                 return formatted_prompt.response_parser(response)
             except LLMError as exc:
@@ -305,20 +634,23 @@ class IQLQueryGenerator(Generic[IQLQueryT]):
             examples=examples,
         )
         formatted_prompt = self.prompt.format_prompt(prompt_format)
+        event_tracker = event_tracker or EventTracker()
 
         for retry in range(n_retries + 1):
             try:
-                response = await llm.generate_text(
-                    prompt=formatted_prompt,
-                    event_tracker=event_tracker,
-                    options=llm_options,
-                )
+                with event_tracker.measure("iql_generation", attempt=retry):
+                    response = await llm.generate_text(
+                        prompt=formatted_prompt,
+                        event_tracker=event_tracker,
+                        options=llm_options,
+                    )
                 # TODO: Move response parsing to llm generate_text method
-                return await formatted_prompt.response_parser(
-                    response=response,
-                    allowed_functions=methods,
-                    event_tracker=event_tracker,
-                )
+                with event_tracker.measure("iql_parsing", attempt=retry):
+                    return await formatted_prompt.response_parser(
+                        response=response,
+                        allowed_functions=methods,
+                        event_tracker=event_tracker,
+                    )
             except LLMError as exc:
                 if retry == n_retries:
                     raise exc
@@ -327,3 +659,124 @@ class IQLQueryGenerator(Generic[IQLQueryT]):
                     raise exc
                 formatted_prompt = formatted_prompt.add_assistant_message(response)
                 formatted_prompt = formatted_prompt.add_user_message(self.ERROR_MESSAGE.format(error=exc))
+
+
+class IQLCombinedGenerator:
+    """
+    Generates filters and aggregation IQL for the given question in a single LLM call, making the decisions\
+    whether they are needed at the same time.
+    """
+
+    ERROR_MESSAGE = IQLQueryGenerator.ERROR_MESSAGE
+
+    def __init__(self, prompt: PromptTemplate[IQLCombinedPromptFormat]) -> None:
+        self.prompt = prompt
+
+    # pylint: disable=too-many-arguments
+    async def __call__(
+        self,
+        *,
+        question: str,
+        filters: List[ExposedFunction],
+        aggregations: List[ExposedFunction],
+        examples: List[FewShotExample],
+        llm: LLM,
+        llm_options: Optional[LLMOptions] = None,
+        event_tracker: Optional[EventTracker] = None,
+        n_retries: int = 3,
+    ) -> IQLGeneratorState:
+        """
+        Generates IQL operations for the given question.
+
+        Args:
+            question: User question.
+            filters: List of filters exposed by the view.
+            aggregations: List of aggregations exposed by the view.
+            examples: List of examples to be injected into the conversation.
+            llm: LLM used to generate IQL.
+            llm_options: Options to use for the LLM client.
+            event_tracker: Event store used to audit the generation process.
+            n_retries: Number of retries to regenerate IQL in case of errors in parsing or LLM connection.
+
+        Returns:
+            Generated IQL operations, with the error in place of the operations that could not be parsed\
+            after all retries.
+
+        Raises:
+            LLMError: If LLM text generation fails after all retries.
+            IQLError: If the LLM response is not a valid JSON after all retries.
+        """
+        prompt_format = IQLCombinedPromptFormat(
+            question=question,
+            filters=filters,
+            aggregations=aggregations,
+            examples=examples,
+        )
+        formatted_prompt = self.prompt.format_prompt(prompt_format)
+        event_tracker = event_tracker or EventTracker()
+
+        for retry in range(n_retries + 1):
+            try:
+                with event_tracker.measure("iql_generation", attempt=retry):
+                    response = await llm.generate_text(
+                        prompt=formatted_prompt,
+                        event_tracker=event_tracker,
+                        options=llm_options,
+                    )
+                with event_tracker.measure("iql_parsing", attempt=retry):
+                    sources = formatted_prompt.response_parser(response)
+                    state = IQLGeneratorState(
+                        filters=await self._parse(IQLFiltersQuery, sources["filters"], filters, event_tracker),
+                        aggregation=await self._parse(
+                            IQLAggregationQuery, sources["aggregation"], aggregations, event_tracker
+                        ),
+                    )
+                errors = [
+                    operation for operation in (state.filters, state.aggregation) if isinstance(operation, IQLError)
+                ]
+                if not errors or retry == n_retries:
+                    return state
+                error = "\n".join(str(exc) for exc in errors)
+            except LLMError as exc:
+                if retry == n_retries:
+                    raise exc
+                continue
+            except IQLError as exc:
+                if retry == n_retries:
+                    raise exc
+                error = str(exc)
+            formatted_prompt = formatted_prompt.add_assistant_message(response)
+            formatted_prompt = formatted_prompt.add_user_message(self.ERROR_MESSAGE.format(error=error))
+
+    @staticmethod
+    async def _parse(
+        query_type: Type[IQLQueryT],
+        source: Optional[str],
+        methods: List[ExposedFunction],
+        event_tracker: EventTracker,
+    ) -> Optional[Union[IQLQueryT, Exception]]:
+        """
+        Parses the IQL source of a single operation.
+
+        Args:
+            query_type: Type of the IQL query to parse.
+            source: IQL source generated by the LLM, None if the operation is not needed.
+            methods: List of methods allowed in the operation.
+            event_tracker: Event store used to audit the parsing process.
+
+        Returns:
+            Parsed IQL query, None if the operation is not needed, or the error if parsing failed.
+        """
+        if not source or not methods:
+            return None
+        if "unsupported query" in source.lower():
+            return UnsupportedQueryError()
+        try:
+            return await query_type.parse(
+                source=source,
+                allowed_functions=methods,
+                event_tracker=event_tracker,
+                repair=True,
+            )
+        except IQLError as exc:
+            return exc
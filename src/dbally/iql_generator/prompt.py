@@ -1,10 +1,14 @@
 # pylint: disable=C0301
 
-from typing import List, Optional
+import json
+import re
+from typing import Dict, List, Optional
 
 from dbally.audit.event_tracker import EventTracker
 from dbally.exceptions import DbAllyError
+from dbally.iql import IQLError
 from dbally.iql._query import IQLAggregationQuery, IQLFiltersQuery
+from dbally.iql.grammar import IQLGrammar
 from dbally.prompt.elements import FewShotExample
 from dbally.prompt.template import PromptFormat, PromptTemplate
 from dbally.views.exposed_functions import ExposedFunction
@@ -43,6 +47,7 @@ async def _iql_filters_parser(
         source=response,
         allowed_functions=allowed_functions,
         event_tracker=event_tracker,
+        repair=True,
     )
 
 
@@ -72,9 +77,36 @@ async def _iql_aggregation_parser(
         source=response,
         allowed_functions=allowed_functions,
         event_tracker=event_tracker,
+        repair=True,
     )
 
 
+def _iql_filters_grammar(prompt_format: "IQLGenerationPromptFormat") -> IQLGrammar:
+    """
+    Creates the grammar of the filters using the methods of the prompt.
+
+    Args:
+        prompt_format: Format of the filters generation prompt.
+
+    Returns:
+        Grammar of the filters joined with the logic operators.
+    """
+    return IQLGrammar(prompt_format.functions, operators=True)
+
+
+def _iql_aggregation_grammar(prompt_format: "IQLGenerationPromptFormat") -> IQLGrammar:
+    """
+    Creates the grammar of the aggregation using the methods of the prompt.
+
+    Args:
+        prompt_format: Format of the aggregation generation prompt.
+
+    Returns:
+        Grammar of a single aggregation call.
+    """
+    return IQLGrammar(prompt_format.functions, operators=False)
+
+
 def _decision_parser(response: str) -> bool:
     """
     Parses the response from the decision prompt.
@@ -93,6 +125,30 @@ def _decision_parser(response: str) -> bool:
     return "true" in decision
 
 
+def _iql_combined_parser(response: str) -> Dict[str, Optional[str]]:
+    """
+    Parses the JSON response from the combined IQL generation prompt.
+
+    Args:
+        response: LLM response.
+
+    Returns:
+        IQL sources for the `filters` and the `aggregation`, None if the operation is not needed.
+
+    Raises:
+        IQLError: When the response is not a JSON object.
+    """
+    try:
+        data = json.loads(re.sub(r"^```(json)?|```$", "", response.strip()))
+    except json.JSONDecodeError as exc:
+        raise IQLError(f"Response is not a valid JSON: {exc}", response) from exc
+
+    if not isinstance(data, dict):
+        raise IQLError("Response is not a JSON object", response)
+
+    return {key: str(data[key]) if data.get(key) else None for key in ("filters", "aggregation")}
+
+
 class DecisionPromptFormat(PromptFormat):
     """
     IQL prompt format, providing a question and filters to be used in the conversation.
@@ -133,9 +189,39 @@ class IQLGenerationPromptFormat(PromptFormat):
         """
         super().__init__(examples)
         self.question = question
+        self.functions = methods
         self.methods = "\n".join(str(method) for method in methods)
 
 
+class IQLCombinedPromptFormat(PromptFormat):
+    """
+    IQL prompt format, providing a question with both filters and aggregations to be used in the conversation.
+    """
+
+    def __init__(
+        self,
+        *,
+        question: str,
+        filters: List[ExposedFunction],
+        aggregations: List[ExposedFunction],
+        examples: Optional[List[FewShotExample]] = None,
+    ) -> None:
+        """
+        Constructs a new IQLCombinedPromptFormat instance.
+
+        Args:
+            question: Question to be asked.
+            filters: List of filters exposed by the view.
+            aggregations: List of aggregations exposed by the view.
+            examples: List of filter examples, listed in the system message as the answers are not JSON.
+        """
+        super().__init__()
+        self.question = question
+        self.filters = "\n".join(str(method) for method in filters) or "None"
+        self.aggregations = "\n".join(str(method) for method in aggregations) or "None"
+        self.examples_list = "\n".join(str(example) for example in examples or []) or "None"
+
+
 FILTERING_DECISION_TEMPLATE = PromptTemplate[DecisionPromptFormat](
     [
         {
@@ -213,6 +299,7 @@ FILTERS_GENERATION_TEMPLATE = PromptTemplate[IQLGenerationPromptFormat](
         },
     ],
     response_parser=_iql_filters_parser,
+    grammar_factory=_iql_filters_grammar,
 )
 
 AGGREGATION_GENERATION_TEMPLATE = PromptTemplate[IQLGenerationPromptFormat](
@@ -239,4 +326,38 @@ AGGREGATION_GENERATION_TEMPLATE = PromptTemplate[IQLGenerationPromptFormat](
         },
     ],
     response_parser=_iql_aggregation_parser,
+    grammar_factory=_iql_aggregation_grammar,
+)
+
+IQL_GENERATION_TEMPLATE = PromptTemplate[IQLCombinedPromptFormat](
+    [
+        {
+            "role": "system",
+            "content": (
+                "You have access to an API that lets you query a database.\n"
+                "You can filter the data with the following methods:\n"
+                "\n{filters}\n\n"
+                "You can aggregate the data with the following methods:\n"
+                "\n{aggregations}\n\n"
+                "Examples of filters for other questions:\n"
+                "\n{examples_list}\n\n"
+                "Response with JSON containing following keys:\n\n"
+                "- filters: filter method calls joined with logic operators (AND, OR, NOT), for example "
+                'filter1("arg1") AND (NOT filter2(120) OR filter3(True)), or null if the answer does not require '
+                "data filtering.\n"
+                '- aggregation: a SINGLE aggregation method call, for example aggregation1("arg1", arg2), '
+                "or null if the answer does not require data aggregation.\n\n"
+                "DO NOT INCLUDE arguments names in the calls. Only the values.\n"
+                "You MUST use only the methods listed above. "
+                "If you DON'T KNOW HOW TO construct the filters or the aggregation, set its key to `UNSUPPORTED QUERY`.\n"
+                "Respond ONLY with the raw JSON response. Don't include any additional text or characters."
+            ),
+        },
+        {
+            "role": "user",
+            "content": "{question}",
+        },
+    ],
+    json_mode=True,
+    response_parser=_iql_combined_parser,
 )
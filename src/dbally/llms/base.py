@@ -72,17 +72,25 @@ class LLM(Generic[LLMClientOptions], ABC):
 
         Raises:
             LLMError: If LLM text generation fails.
+            RequestTimeoutError: If the deadline of the request passes before the response is received.
         """
         options = (self.default_options | options) if options else self.default_options
         event = LLMEvent(prompt=prompt.chat, type=type(prompt).__name__)
         event_tracker = event_tracker or EventTracker()
 
+        constraints = {}
+        if prompt.grammar is not None and self.client.supports_grammar:
+            constraints["grammar"] = prompt.grammar
+
         async with event_tracker.track_event(event) as span:
-            event.response = await self.client.call(
-                conversation=prompt.chat,
-                options=options,
-                event=event,
-                json_mode=prompt.json_mode,
+            event.response = await event_tracker.within_deadline(
+                self.client.call(
+                    conversation=prompt.chat,
+                    options=options,
+                    event=event,
+                    json_mode=prompt.json_mode,
+                    **constraints,
+                )
             )
             span(event)
 
@@ -55,6 +55,9 @@ class LLMClient(Generic[LLMClientOptions], ABC):
     Abstract client for a direct communication with LLM.
     """
 
+    # Clients supporting constrained decoding accept the `grammar` of the response in the `call` method
+    supports_grammar: ClassVar[bool] = False
+
     def __init__(self, model_name: str) -> None:
         """
         Constructs a new LLMClient instance.
@@ -1,11 +1,20 @@
-from dataclasses import dataclass
-from typing import List, Optional, Union
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Hashable, List, Optional, Tuple, Union
 
 import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer
+from transformers import (
+    AutoModelForCausalLM,
+    AutoTokenizer,
+    LogitsProcessor,
+    LogitsProcessorList,
+    PreTrainedTokenizerBase,
+)
 
 from dbally.audit.events import LLMEvent
 from dbally.llms.clients.base import LLMClient, LLMOptions
+from dbally.prompt.grammar import Grammar
 from dbally.prompt.template import ChatFormat
 
 from ..._types import NOT_GIVEN, NotGiven
@@ -30,12 +39,243 @@ class LocalLLMOptions(LLMOptions):
     temperature: Union[Optional[float], NotGiven] = NOT_GIVEN
 
 
+@dataclass
+class _TokenTrie:
+    """
+    Prefix tree of the decoded tokens of the vocabulary.
+    """
+
+    children: Dict[str, "_TokenTrie"] = field(default_factory=dict)
+    token_ids: List[int] = field(default_factory=list)
+
+    def add(self, text: str, token_id: int) -> None:
+        """
+        Adds the token to the prefix tree.
+
+        Args:
+            text: Decoded text of the token.
+            token_id: Id of the token.
+        """
+        node = self
+        for char in text:
+            node = node.children.setdefault(char, _TokenTrie())
+        node.token_ids.append(token_id)
+
+
+@dataclass
+class _Vocabulary:
+    """
+    Decoded tokens of the vocabulary of the tokenizer, skipping the special tokens.
+    """
+
+    texts: Dict[int, str]
+    trie: _TokenTrie
+    eos_token_id: int
+
+    @classmethod
+    def from_tokenizer(cls, tokenizer: PreTrainedTokenizerBase) -> "_Vocabulary":
+        """
+        Decodes the vocabulary of the tokenizer and builds its prefix tree.
+
+        Args:
+            tokenizer: Tokenizer of the model.
+
+        Returns:
+            Decoded vocabulary.
+        """
+        # tokens are decoded after an anchor token, so that their leading spaces are not stripped
+        anchor_ids = tokenizer.encode("a", add_special_tokens=False)
+        anchor = tokenizer.decode(anchor_ids)
+        special_ids = set(tokenizer.all_special_ids)
+
+        texts = {}
+        trie = _TokenTrie()
+        for token_id in range(len(tokenizer)):
+            if token_id in special_ids:
+                continue
+            text = tokenizer.decode(anchor_ids + [token_id])[len(anchor) :]
+            if not text:
+                continue
+            texts[token_id] = text
+            trie.add(text, token_id)
+        return cls(texts=texts, trie=trie, eos_token_id=tokenizer.eos_token_id)
+
+
+# State of the grammar after the generated text, and whether only whitespace has been generated so far
+_DecodingState = Tuple[Hashable, bool]
+
+
+class _GrammarDecoder:
+    """
+    Computes the tokens allowed by the grammar, memoizing the grammar steps and the allowed tokens of each state,\
+    so that they are computed once for all the generations following the same grammar.
+    """
+
+    def __init__(self, grammar: Grammar, vocabulary: _Vocabulary) -> None:
+        """
+        Args:
+            grammar: Grammar of the response.
+            vocabulary: Decoded vocabulary of the tokenizer.
+        """
+        self.grammar = grammar
+        self.vocabulary = vocabulary
+        self._steps: Dict[Tuple[Hashable, str], Optional[Hashable]] = {}
+        self._allowed_tokens: Dict[_DecodingState, List[int]] = {}
+
+    @property
+    def initial_state(self) -> _DecodingState:
+        """
+        Returns the decoding state before any token is generated.
+
+        Returns:
+            Initial state of the grammar, with only whitespace generated so far.
+        """
+        return self.grammar.initial_state, True
+
+    def advance(self, state: _DecodingState, token_id: int) -> Optional[_DecodingState]:
+        """
+        Consumes the generated token. Special tokens are skipped, and so is leading whitespace.
+
+        Args:
+            state: Decoding state before the token.
+            token_id: Id of the generated token.
+
+        Returns:
+            Decoding state after the token, or None if the token does not follow the grammar.
+        """
+        grammar_state, leading = state
+        for char in self.vocabulary.texts.get(token_id, ""):
+            if leading and char.isspace():
+                continue
+            grammar_state, leading = self._step(grammar_state, char), False
+            if grammar_state is None:
+                return None
+        return grammar_state, leading
+
+    def allowed(self, state: _DecodingState) -> List[int]:
+        """
+        Lists the tokens which can follow the text generated so far.
+
+        Args:
+            state: Decoding state after the generated text.
+
+        Returns:
+            Ids of the allowed tokens.
+        """
+        if state in self._allowed_tokens:
+            return self._allowed_tokens[state]
+
+        allowed = []
+        pending = [(self.vocabulary.trie, *state)]
+        while pending:
+            node, node_state, node_leading = pending.pop()
+            for char, child in node.children.items():
+                if node_leading and char.isspace():
+                    child_state, child_leading = node_state, True
+                else:
+                    child_state, child_leading = self._step(node_state, char), False
+                if child_state is None:
+                    continue
+                allowed.extend(child.token_ids)
+                pending.append((child, child_state, child_leading))
+
+        if self.grammar.is_complete(state[0]) or not allowed:
+            allowed.append(self.vocabulary.eos_token_id)
+
+        self._allowed_tokens[state] = allowed
+        return allowed
+
+    def _step(self, state: Hashable, char: str) -> Optional[Hashable]:
+        """
+        Consumes the character with the grammar, memoizing the result as the same states recur in the prefix tree.
+
+        Args:
+            state: Current state of the grammar.
+            char: Character to consume.
+
+        Returns:
+            State after consuming the character, or None if the character is not accepted.
+        """
+        key = (state, char)
+        if key not in self._steps:
+            self._steps[key] = self.grammar.step(state, char)
+        return self._steps[key]
+
+
+class GrammarLogitsProcessor(LogitsProcessor):
+    """
+    Logits processor allowing only the tokens which keep the generated text a valid prefix of the grammar.\
+    The end of sequence token is allowed once the text is a complete response. Leading whitespace is skipped.
+
+    The decoding state of each generated sequence is kept between the steps, so each step consumes only\
+    the newly generated token.
+    """
+
+    def __init__(self, decoder: _GrammarDecoder, prompt_length: int) -> None:
+        """
+        Args:
+            decoder: Decoder of the grammar of the response.
+            prompt_length: Number of the prompt tokens preceding the generated ones.
+        """
+        self.decoder = decoder
+        self.prompt_length = prompt_length
+        self._states: Dict[Tuple[int, ...], Optional[_DecodingState]] = {(): decoder.initial_state}
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor) -> torch.FloatTensor:
+        mask = torch.full_like(scores, float("-inf"))
+        states = {}
+        for row, token_ids in enumerate(input_ids):
+            generated = tuple(token_ids[self.prompt_length :].tolist())
+            state = states[generated] = self._state(generated)
+            if state is None:
+                # the text was generated before the grammar could constrain it, e.g. in a finished beam
+                mask[row] = 0
+                continue
+            mask[row, self.decoder.allowed(state)] = 0
+        self._states = states
+        return scores + mask
+
+    def _state(self, generated: Tuple[int, ...]) -> Optional[_DecodingState]:
+        """
+        Computes the decoding state after the generated tokens, starting from the state of the sequence\
+        they extend, if it was seen in the previous step.
+
+        Args:
+            generated: Ids of the generated tokens.
+
+        Returns:
+            Decoding state after the generated tokens, or None if they do not follow the grammar.
+        """
+        if generated in self._states:
+            return self._states[generated]
+
+        parent = generated[:-1]
+        state: Optional[_DecodingState]
+        if parent in self._states:
+            state, tokens = self._states[parent], generated[-1:]
+        else:
+            state, tokens = self.decoder.initial_state, generated
+
+        for token_id in tokens:
+            if state is None:
+                break
+            state = self.decoder.advance(state, token_id)
+        return state
+
+
 class LocalLLMClient(LLMClient[LocalLLMOptions]):
     """
     Client for the local LLM that supports Hugging Face models.
+
+    The client supports constrained decoding: when the prompt defines the grammar of the response, e.g. the IQL\
+    of the view, only the tokens following the grammar are generated, so the response does not need to be retried.
     """
 
     _options_cls = LocalLLMOptions
+    supports_grammar = True
+
+    # Number of the recently used grammars which memoized decoding steps are kept
+    MAX_CACHED_GRAMMARS = 64
 
     def __init__(
         self,
@@ -57,6 +297,34 @@ class LocalLLMClient(LLMClient[LocalLLMOptions]):
             model_name, device_map="auto", torch_dtype=torch.bfloat16, token=hf_api_key
         )
         self.tokenizer = AutoTokenizer.from_pretrained(model_name, token=hf_api_key)
+        self._decoders: "OrderedDict[Grammar, _GrammarDecoder]" = OrderedDict()
+
+    @cached_property
+    def _vocabulary(self) -> _Vocabulary:
+        """
+        Decoded vocabulary of the tokenizer, built on the first constrained generation.
+
+        Returns:
+            Decoded vocabulary.
+        """
+        return _Vocabulary.from_tokenizer(self.tokenizer)
+
+    def _get_decoder(self, grammar: Grammar) -> _GrammarDecoder:
+        """
+        Returns the decoder of the grammar, reusing the one of an equal grammar used recently, so that its memoized\
+        steps and allowed tokens are shared between the generations.
+
+        Args:
+            grammar: Grammar of the response.
+
+        Returns:
+            Decoder of the grammar.
+        """
+        decoder = self._decoders.pop(grammar, None) or _GrammarDecoder(grammar, self._vocabulary)
+        self._decoders[grammar] = decoder
+        while len(self._decoders) > self.MAX_CACHED_GRAMMARS:
+            self._decoders.popitem(last=False)
+        return decoder
 
     async def call(
         self,
@@ -64,6 +332,7 @@ class LocalLLMClient(LLMClient[LocalLLMOptions]):
         options: LocalLLMOptions,
         event: LLMEvent,
         json_mode: bool = False,
+        grammar: Optional[Grammar] = None,
     ) -> str:
         """
         Makes a call to the local LLM with the provided prompt and options.
@@ -73,6 +342,7 @@ class LocalLLMClient(LLMClient[LocalLLMOptions]):
             options: Additional settings used by the LLM.
             event: Container with the prompt, LLM response, and call metrics.
             json_mode: Force the response to be in JSON format.
+            grammar: Grammar the response has to follow. If None, the response is not constrained.
 
         Returns:
             Response string from LLM.
@@ -82,9 +352,16 @@ class LocalLLMClient(LLMClient[LocalLLMOptions]):
             conversation, add_generation_prompt=True, return_tensors="pt"
         ).to(self.model.device)
 
+        constraints = {}
+        if grammar is not None:
+            constraints["logits_processor"] = LogitsProcessorList(
+                [GrammarLogitsProcessor(self._get_decoder(grammar), input_ids.shape[-1])]
+            )
+
         outputs = self.model.generate(
             input_ids,
             eos_token_id=self.tokenizer.eos_token_id,
+            **constraints,
             **options.dict(),
         )
         response = outputs[0][input_ids.shape[-1] :]
@@ -92,4 +369,4 @@ class LocalLLMClient(LLMClient[LocalLLMOptions]):
         event.prompt_tokens = len(outputs[0][: input_ids.shape[-1]])
         event.total_tokens = input_ids.shape[-1]
         decoded_response = self.tokenizer.decode(response, skip_special_tokens=True)
-        return decoded_response
+        return decoded_response.strip() if grammar is not None else decoded_response
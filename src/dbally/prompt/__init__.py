@@ -1,3 +1,4 @@
+from .few_shot_selector import FewShotSelector
 from .template import ChatFormat, PromptTemplate, PromptTemplateError
 
-__all__ = ["PromptTemplate", "PromptTemplateError", "ChatFormat"]
+__all__ = ["PromptTemplate", "PromptTemplateError", "ChatFormat", "FewShotSelector"]
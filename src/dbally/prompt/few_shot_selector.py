@@ -0,0 +1,67 @@
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import numpy as np
+
+from dbally.embeddings.base import EmbeddingClient
+from dbally.embeddings.utils import embed_with_memo, top_k_by_similarity
+from dbally.prompt.elements import FewShotExample
+
+if TYPE_CHECKING:
+    # the audit events refer to the prompt templates, so the tracker cannot be imported at runtime
+    from dbally.audit.event_tracker import EventTracker
+
+
+class FewShotSelector:
+    """
+    Selects the few-shot examples most relevant to the question, so that the size of the prompt stays constant\
+    as the library of examples grows.
+
+    Questions of the examples are embedded once and reused for all the asked questions, so selecting the examples\
+    costs a single embedding of the question. The selected examples keep their original order.
+    """
+
+    def __init__(self, embedding_client: EmbeddingClient, top_k: int = 5) -> None:
+        """
+        Args:
+            embedding_client: Client used to embed the questions of the examples and the asked questions.
+            top_k: Maximum number of examples injected into the prompt.
+
+        Raises:
+            ValueError: If `top_k` is lower than 1.
+        """
+        if top_k < 1:
+            raise ValueError("top_k must be a positive integer")
+
+        self._embedding_client = embedding_client
+        self.top_k = top_k
+        self._embeddings: Dict[str, np.ndarray] = {}
+
+    async def select(
+        self,
+        question: str,
+        examples: List[FewShotExample],
+        event_tracker: Optional["EventTracker"] = None,
+    ) -> List[FewShotExample]:
+        """
+        Selects up to `top_k` examples which questions are the most similar to the asked one.
+
+        Args:
+            question: Question asked in the natural language.
+            examples: All the examples of the view.
+            event_tracker: Event tracker bounding the embedding call by the request deadline.
+
+        Returns:
+            The selected examples, in the order they were listed.
+
+        Raises:
+            EmbeddingError: If embedding the examples or the question fails.
+        """
+        if len(examples) <= self.top_k:
+            return list(examples)
+
+        questions = {example.question: example.question for example in examples}
+        question_embedding = await embed_with_memo(
+            self._embedding_client, question, questions, self._embeddings, event_tracker
+        )
+        embeddings = [self._embeddings[example.question] for example in examples]
+        return [examples[index] for index in top_k_by_similarity(question_embedding, embeddings, self.top_k)]
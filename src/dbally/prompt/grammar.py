@@ -0,0 +1,75 @@
+from abc import ABC, abstractmethod
+from typing import Hashable, Optional
+
+
+class Grammar(ABC):
+    """
+    Grammar the response of the LLM has to follow, recognized character by character, so that LLM clients\
+    supporting constrained decoding can reject the tokens leading to an invalid response while generating it.
+
+    States of the grammar are immutable and hashable, so they can be shared between the decoding steps\
+    and used as cache keys. Grammars comparing equal must accept the same characters in the same states, so that\
+    LLM clients can reuse the decoding work memoized for one of them; by default, a grammar is equal only to itself.
+    """
+
+    @property
+    @abstractmethod
+    def initial_state(self) -> Hashable:
+        """
+        Returns the state of the grammar before any character is consumed.
+        """
+
+    @abstractmethod
+    def step(self, state: Hashable, char: str) -> Optional[Hashable]:
+        """
+        Consumes a single character.
+
+        Args:
+            state: Current state of the grammar.
+            char: Character to consume.
+
+        Returns:
+            State after consuming the character, or None if the character cannot follow the consumed text.
+        """
+
+    @abstractmethod
+    def is_complete(self, state: Hashable) -> bool:
+        """
+        Checks whether the text consumed so far is a complete response.
+
+        Args:
+            state: Current state of the grammar.
+
+        Returns:
+            True if the response may end in this state.
+        """
+
+    def advance(self, state: Optional[Hashable], text: str) -> Optional[Hashable]:
+        """
+        Consumes the text character by character.
+
+        Args:
+            state: Current state of the grammar, or None if the consumed text is already invalid.
+            text: Text to consume.
+
+        Returns:
+            State after consuming the text, or None if the text cannot follow the consumed text.
+        """
+        for char in text:
+            if state is None:
+                return None
+            state = self.step(state, char)
+        return state
+
+    def accepts(self, text: str) -> bool:
+        """
+        Checks whether the text is a complete response.
+
+        Args:
+            text: Text to check.
+
+        Returns:
+            True if the text follows the grammar.
+        """
+        state = self.advance(self.initial_state, text)
+        return state is not None and self.is_complete(state)
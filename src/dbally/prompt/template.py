@@ -1,11 +1,14 @@
 import copy
 import re
-from typing import Callable, Dict, Generic, List, Optional, TypeVar
+from dataclasses import dataclass
+from string import Formatter
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
 
 from typing_extensions import Self
 
 from dbally.exceptions import DbAllyError
 from dbally.prompt.elements import FewShotExample
+from dbally.prompt.grammar import Grammar
 
 ChatFormat = List[Dict[str, str]]
 
@@ -68,6 +71,114 @@ class PromptFormat:
 PromptFormatT = TypeVar("PromptFormatT", bound=PromptFormat)
 
 
+@dataclass(frozen=True)
+class _CompiledMessage:
+    role: str
+    content: str
+    is_example: bool
+    # static contents have no replacement fields, so they are formatted once when the template is compiled
+    static: bool
+
+    @classmethod
+    def from_message(cls, message: Dict[str, Any]) -> "_CompiledMessage":
+        """
+        Compiles the message of the chat template.
+
+        Args:
+            message: Message to compile.
+
+        Returns:
+            Compiled message.
+        """
+        content = message.get("content")
+        try:
+            static = all(field is None for _, field, _, _ in Formatter().parse(content))
+        except ValueError:
+            # malformed contents are formatted on each call, so the error is raised when the prompt is formatted
+            static = False
+        return cls(
+            role=message.get("role"),
+            content=content.format() if static else content,
+            is_example=message.get("is_example", False),
+            static=static,
+        )
+
+    def format(self, formatting: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Formats the message.
+
+        Args:
+            formatting: Values of the replacement fields.
+
+        Returns:
+            Formatted message.
+        """
+        return {
+            "role": self.role,
+            "content": self.content if self.static else self.content.format(**formatting),
+            "is_example": self.is_example,
+        }
+
+
+@dataclass(frozen=True)
+class _CompiledChat:
+    """
+    Chat template split into the messages preceding and following the few-shot examples, with the static contents\
+    formatted in advance, so that formatting the prompt does not scan and copy the whole template on each call.
+    """
+
+    chat: ChatFormat
+    inline_examples: bool
+    head: Tuple[_CompiledMessage, ...]
+    tail: Tuple[_CompiledMessage, ...]
+
+    @classmethod
+    def from_chat(cls, chat: ChatFormat) -> "_CompiledChat":
+        """
+        Compiles the chat template.
+
+        Args:
+            chat: Chat-formatted conversation template.
+
+        Returns:
+            Compiled chat template.
+        """
+        inline_examples = any(re.match(r"{examples}", message["content"]) for message in chat)
+        if inline_examples:
+            return cls(chat, True, tuple(_CompiledMessage.from_message(message) for message in chat), ())
+
+        # few-shot messages are replaced with the examples of the prompt format, placed after the system message
+        messages = [_CompiledMessage.from_message(message) for message in chat if not message.get("is_example")]
+        few_shot_index = max((i for i, message in enumerate(messages) if message.role == "system"), default=0) + 1
+        return cls(chat, False, tuple(messages[:few_shot_index]), tuple(messages[few_shot_index:]))
+
+    def format(self, formatting: Dict[str, Any], examples: List[FewShotExample]) -> ChatFormat:
+        """
+        Formats the chat template.
+
+        Args:
+            formatting: Values of the replacement fields.
+            examples: Few-shot examples injected into the conversation, unless the template lists them inline.
+
+        Returns:
+            Formatted chat.
+
+        Raises:
+            PromptTemplateError: If the examples are injected into an empty template or replacing the examples\
+            breaks the order of the chat.
+        """
+        chat = [message.format(formatting) for message in self.head]
+        if not self.inline_examples and examples:
+            if not self.head:
+                raise PromptTemplateError("Cannot add few-shot messages to an empty template.")
+            for example in examples:
+                chat.append({"role": "user", "content": example.question.format(**formatting), "is_example": True})
+                chat.append({"role": "assistant", "content": example.answer.format(**formatting), "is_example": True})
+        chat.extend(message.format(formatting) for message in self.tail)
+        # the order of the template itself is checked on construction, but replacing its examples may break it
+        return chat if self.inline_examples else _check_chat_order(chat)
+
+
 class PromptTemplate(Generic[PromptFormatT]):
     """
     Class for prompt templates.
@@ -79,6 +190,8 @@ class PromptTemplate(Generic[PromptFormatT]):
         *,
         json_mode: bool = False,
         response_parser: Callable = lambda x: x,
+        grammar_factory: Optional[Callable[[PromptFormatT], Grammar]] = None,
+        grammar: Optional[Grammar] = None,
     ) -> None:
         """
         Constructs a new PromptTemplate instance.
@@ -87,28 +200,31 @@ class PromptTemplate(Generic[PromptFormatT]):
             chat: Chat-formatted conversation template.
             json_mode: Whether to enforce JSON response from LLM.
             response_parser: Function parsing the LLM response into the desired format.
+            grammar_factory: Function creating the grammar of the response from the prompt format. The grammar\
+            is enforced by the LLM clients supporting constrained decoding.
+            grammar: Grammar of the response, set when the prompt is formatted.
         """
         self.chat: ChatFormat = _check_chat_order(chat)
         self.json_mode = json_mode
         self.response_parser = response_parser
+        self.grammar_factory = grammar_factory
+        self.grammar = grammar
+        self._compiled: Optional[_CompiledChat] = None
 
     def __eq__(self, other: "PromptTemplate") -> bool:
         return isinstance(other, PromptTemplate) and self.chat == other.chat
 
-    def _has_variable(self, variable: str) -> bool:
+    def _compile(self) -> _CompiledChat:
         """
-        Validates a given chat to make sure it contains variables required.
-
-        Args:
-            variable: Variable to check.
+        Compiles the chat template on the first use. The chat is never modified in place, as all the methods\
+        return new templates, so the compiled template is reused until another chat is assigned.
 
         Returns:
-            True if the variable is present in the chat.
+            Compiled chat template.
         """
-        for message in self.chat:
-            if re.match(rf"{{{variable}}}", message["content"]):
-                return True
-        return False
+        if self._compiled is None or self._compiled.chat is not self.chat:
+            self._compiled = _CompiledChat.from_chat(self.chat)
+        return self._compiled
 
     def format_prompt(self, prompt_format: PromptFormatT) -> Self:
         """
@@ -120,24 +236,18 @@ class PromptTemplate(Generic[PromptFormatT]):
         Returns:
             PromptTemplate with formatted chat contents.
         """
-        formatted_prompt = copy.deepcopy(self)
+        compiled = self._compile()
         formatting = dict(prompt_format.__dict__)
 
-        if self._has_variable("examples"):
+        if compiled.inline_examples:
             formatting["examples"] = "\n".join(prompt_format.examples)
-        else:
-            formatted_prompt = formatted_prompt.clear_few_shot_messages()
-            for example in prompt_format.examples:
-                formatted_prompt = formatted_prompt.add_few_shot_message(example)
-
-        formatted_prompt.chat = [
-            {
-                "role": message.get("role"),
-                "content": message.get("content").format(**formatting),
-                "is_example": message.get("is_example", False),
-            }
-            for message in formatted_prompt.chat
-        ]
+
+        formatted_prompt = copy.copy(self)
+        formatted_prompt.chat = compiled.format(formatting, prompt_format.examples)
+
+        if self.grammar_factory is not None:
+            formatted_prompt.grammar = self.grammar_factory(prompt_format)
+
         return formatted_prompt
 
     def set_system_message(self, content: str) -> Self:
@@ -154,6 +264,8 @@ class PromptTemplate(Generic[PromptFormatT]):
             chat=[{"role": "system", "content": content}, *self.chat],
             json_mode=self.json_mode,
             response_parser=self.response_parser,
+            grammar_factory=self.grammar_factory,
+            grammar=self.grammar,
         )
 
     def add_user_message(self, content: str) -> Self:
@@ -170,6 +282,8 @@ class PromptTemplate(Generic[PromptFormatT]):
             chat=[*self.chat, {"role": "user", "content": content}],
             json_mode=self.json_mode,
             response_parser=self.response_parser,
+            grammar_factory=self.grammar_factory,
+            grammar=self.grammar,
         )
 
     def add_assistant_message(self, content: str) -> Self:
@@ -186,6 +300,8 @@ class PromptTemplate(Generic[PromptFormatT]):
             chat=[*self.chat, {"role": "assistant", "content": content}],
             json_mode=self.json_mode,
             response_parser=self.response_parser,
+            grammar_factory=self.grammar_factory,
+            grammar=self.grammar,
         )
 
     def add_few_shot_message(self, example: FewShotExample) -> Self:
@@ -218,6 +334,8 @@ class PromptTemplate(Generic[PromptFormatT]):
             chat=chat,
             json_mode=self.json_mode,
             response_parser=self.response_parser,
+            grammar_factory=self.grammar_factory,
+            grammar=self.grammar,
         )
 
     def clear_few_shot_messages(self) -> Self:
@@ -231,4 +349,6 @@ class PromptTemplate(Generic[PromptFormatT]):
             chat=[message for message in self.chat if not message.get("is_example")],
             json_mode=self.json_mode,
             response_parser=self.response_parser,
+            grammar_factory=self.grammar_factory,
+            grammar=self.grammar,
         )
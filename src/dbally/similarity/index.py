@@ -86,13 +86,17 @@ class SimilarityIndex(AbstractSimilarityIndex):
 
         Returns:
             str: The most similar text or the original text if no similar text is found.
+
+        Raises:
+            RequestTimeoutError: If the deadline of the request passes before the search completes.
         """
 
         event_tracker = event_tracker or EventTracker()
         event = SimilarityEvent(input_value=text, store=repr(self.store), fetcher=repr(self.fetcher))
 
         async with event_tracker.track_event(event) as span:
-            found = await self.store.find_similar(text)
+            with event_tracker.measure("similarity"):
+                found = await event_tracker.within_deadline(self.store.find_similar(text))
             event.output_value = found
             span(event)
 
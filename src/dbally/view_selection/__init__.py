@@ -1,3 +1,5 @@
+from dbally.view_selection.base import RankedView, ViewSelector
+from dbally.view_selection.embedding_view_selector import EmbeddingViewSelector
 from dbally.view_selection.llm_view_selector import LLMViewSelector
 
-__all__ = ["LLMViewSelector"]
+__all__ = ["EmbeddingViewSelector", "LLMViewSelector", "RankedView", "ViewSelector"]
@@ -1,18 +1,56 @@
 import abc
-from typing import Dict, Optional
+from dataclasses import dataclass
+from typing import List, Mapping, Optional
 
 from dbally.audit.event_tracker import EventTracker
 from dbally.llms.clients.base import LLMOptions
 
 
+@dataclass
+class RankedView:
+    """
+    View chosen by a view selector, together with the confidence of the choice.
+
+    Args:
+        name: Name of the view.
+        score: Confidence of the selector that the view answers the question, higher is better. The scale depends\
+        on the selector, e.g. cosine similarity for the embedding-based one. None if the selector does not score views.
+    """
+
+    name: str
+    score: Optional[float] = None
+
+
 class ViewSelector(abc.ABC):
     """Base class for view selectors."""
 
     @abc.abstractmethod
+    async def rank_views(
+        self,
+        question: str,
+        views: Mapping[str, str],
+        event_tracker: EventTracker,
+        llm_options: Optional[LLMOptions] = None,
+        top_k: int = 1,
+    ) -> List[RankedView]:
+        """
+        Based on user question and list of available views select up to `top_k` most relevant ones with their scores.
+
+        Args:
+            question: user question asked in the natural language e.g "Do we have any data scientists?"
+            views: dictionary of available view names with corresponding descriptions.
+            event_tracker: event tracker used to audit the selection process.
+            llm_options: options to use for the LLM client.
+            top_k: maximum number of views to return.
+
+        Returns:
+            Selected views ordered from the most relevant one.
+        """
+
     async def select_view(
         self,
         question: str,
-        views: Dict[str, str],
+        views: Mapping[str, str],
         event_tracker: EventTracker,
         llm_options: Optional[LLMOptions] = None,
     ) -> str:
@@ -28,3 +66,5 @@ class ViewSelector(abc.ABC):
         Returns:
             The most relevant view name.
         """
+        ranked_views = await self.rank_views(question, views, event_tracker, llm_options, top_k=1)
+        return ranked_views[0].name
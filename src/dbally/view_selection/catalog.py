@@ -0,0 +1,91 @@
+import textwrap
+from typing import Dict, Iterator, List, Mapping, Optional
+
+from dbally.cache.base import make_cache_key
+
+
+class ViewCatalog(Mapping[str, str]):
+    """
+    Read-only mapping of view names to their descriptions, maintained by a collection as views are registered.
+
+    Descriptions are rendered once, when the view is added, together with the fragment of the view selection\
+    prompt listing the views, so that they are not recomputed for every request. Every change bumps the `version`\
+    and updates the `fingerprint`, which can be used as a part of cache keys.
+    """
+
+    def __init__(self) -> None:
+        self._descriptions: Dict[str, str] = {}
+        self._prompt_lines: List[str] = []
+        self._prompt_fragment: Optional[str] = ""
+        self.version = 0
+        self.fingerprint = ""
+
+    @staticmethod
+    def render_description(docstring: Optional[str]) -> str:
+        """
+        Renders the description of the view from its docstring.
+
+        Args:
+            docstring: Docstring of the view class.
+
+        Returns:
+            Dedented and stripped docstring or an empty string if the view has no docstring.
+        """
+        return textwrap.dedent(docstring).strip() if docstring else ""
+
+    def add(self, name: str, description: str, source: str = "") -> None:
+        """
+        Adds the view to the catalog.
+
+        Args:
+            name: Name of the view.
+            description: Rendered description of the view.
+            source: Identifier of the view implementation, e.g. its qualified class name, included in the fingerprint.
+
+        Raises:
+            ValueError: if the view with the given name is already in the catalog.
+        """
+        if name in self._descriptions:
+            raise ValueError(f"View with name {name} is already registered")
+
+        self._descriptions[name] = description
+        self._prompt_lines.append(f"{name}: {description}")
+        self._prompt_fragment = None
+        self.version += 1
+        self.fingerprint = make_cache_key(self.fingerprint, name, source, description)
+
+    @property
+    def prompt_fragment(self) -> str:
+        """
+        Returns the list of views in the form used by the view selection prompts, one `name: description` per line.
+
+        Returns:
+            Views formatted for the view selection prompt.
+        """
+        if self._prompt_fragment is None:
+            self._prompt_fragment = "\n".join(self._prompt_lines)
+        return self._prompt_fragment
+
+    def __getitem__(self, name: str) -> str:
+        return self._descriptions[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._descriptions)
+
+    def __len__(self) -> int:
+        return len(self._descriptions)
+
+
+def format_views(views: Mapping[str, str]) -> str:
+    """
+    Formats views for the view selection prompts, reusing the prompt fragment of the catalog if possible.
+
+    Args:
+        views: Mapping of view names to their descriptions.
+
+    Returns:
+        Views formatted as `name: description`, one per line.
+    """
+    if isinstance(views, ViewCatalog):
+        return views.prompt_fragment
+    return "\n".join(f"{name}: {description}" for name, description in views.items())
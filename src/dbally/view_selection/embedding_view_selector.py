@@ -0,0 +1,123 @@
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from dbally.audit.event_tracker import EventTracker
+from dbally.embeddings.base import EmbeddingClient
+from dbally.embeddings.utils import embed_with_memo
+from dbally.llms.clients.base import LLMOptions
+from dbally.view_selection.base import RankedView, ViewSelector
+
+
+class EmbeddingViewSelector(ViewSelector):
+    """
+    The `EmbeddingViewSelector` selects the view which description is the most similar to the user question.
+
+    Descriptions of the views are embedded once and reused for all the questions, so selecting a view costs a single\
+    embedding of the question instead of an LLM call. If the best candidates are too close to tell apart, the choice\
+    between them is delegated to the `fallback_selector`, e.g. [`LLMViewSelector`]\
+    [dbally.view_selection.llm_view_selector.LLMViewSelector].
+    """
+
+    def __init__(
+        self,
+        embedding_client: EmbeddingClient,
+        fallback_selector: Optional[ViewSelector] = None,
+        confidence_threshold: float = 0.05,
+    ) -> None:
+        """
+        Constructs a new EmbeddingViewSelector instance.
+
+        Args:
+            embedding_client: client used to embed the view descriptions and the questions
+            fallback_selector: selector choosing between the views which similarity to the question is within\
+            `confidence_threshold` of the best one. If None, the most similar view is always selected.
+            confidence_threshold: minimal difference between the cosine similarity of the best view and the other\
+            ones for the selection to be considered confident.
+        """
+        self._embedding_client = embedding_client
+        self._fallback_selector = fallback_selector
+        self.confidence_threshold = confidence_threshold
+        self._embeddings: Dict[Tuple[str, str], np.ndarray] = {}
+
+    async def rank_views(
+        self,
+        question: str,
+        views: Mapping[str, str],
+        event_tracker: EventTracker,
+        llm_options: Optional[LLMOptions] = None,
+        top_k: int = 1,
+    ) -> List[RankedView]:
+        """
+        Based on user question and list of available views select up to `top_k` most relevant ones, scored with\
+        the cosine similarity of their descriptions to the question.
+
+        Args:
+            question: user question asked in the natural language e.g "Do we have any data scientists?"
+            views: dictionary of available view names with corresponding descriptions.
+            event_tracker: event tracker used to audit the selection process.
+            llm_options: options to use for the LLM client of the fallback selector.
+            top_k: maximum number of views to return.
+
+        Returns:
+            Selected views ordered from the most relevant one.
+
+        Raises:
+            EmbeddingError: If embedding the views or the question fails.
+        """
+        ranking = await self._rank_views(question, views, event_tracker)
+        similarities = dict(ranking)
+        ranked_names = [name for name, _ in ranking]
+        candidates = self._close_candidates(ranking)
+
+        if len(candidates) > 1 and self._fallback_selector is not None:
+            reranked_views = await self._fallback_selector.rank_views(
+                question=question,
+                views={name: views[name] for name in candidates},
+                event_tracker=event_tracker,
+                llm_options=llm_options,
+                top_k=min(top_k, len(candidates)),
+            )
+            reranked_names = [view.name for view in reranked_views]
+            ranked_names = list(dict.fromkeys([*reranked_names, *ranked_names]))
+
+        return [RankedView(name=name, score=similarities.get(name)) for name in ranked_names[:top_k]]
+
+    async def _rank_views(
+        self,
+        question: str,
+        views: Mapping[str, str],
+        event_tracker: EventTracker,
+    ) -> List[Tuple[str, float]]:
+        """
+        Ranks the views by the cosine similarity of their descriptions to the question.
+
+        Args:
+            question: user question asked in the natural language.
+            views: dictionary of available view names with corresponding descriptions.
+            event_tracker: event tracker bounding the embedding calls by the request deadline.
+
+        Returns:
+            View names with their similarity to the question, ordered from the most similar one.
+        """
+        texts = {(name, description): description or name for name, description in views.items()}
+        question_embedding = await embed_with_memo(
+            self._embedding_client, question, texts, self._embeddings, event_tracker
+        )
+        names = list(views)
+        view_embeddings = np.stack([self._embeddings[(name, views[name])] for name in names])
+        similarities = view_embeddings @ question_embedding
+        return sorted(zip(names, similarities.tolist()), key=lambda item: item[1], reverse=True)
+
+    def _close_candidates(self, ranking: List[Tuple[str, float]]) -> List[str]:
+        """
+        Returns the views which similarity is within `confidence_threshold` of the best one.
+
+        Args:
+            ranking: View names with their similarity to the question, ordered from the most similar one.
+
+        Returns:
+            Names of the views that cannot be confidently told apart from the best one.
+        """
+        best_similarity = ranking[0][1]
+        return [name for name, similarity in ranking if best_similarity - similarity < self.confidence_threshold]
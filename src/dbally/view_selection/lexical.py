@@ -0,0 +1,99 @@
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Mapping
+
+_TOKEN_PATTERN = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits the text into lowercased words, breaking camel case identifiers like view names into separate words.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        List of lowercased words.
+    """
+    return [token.lower() for token in _TOKEN_PATTERN.findall(text)]
+
+
+class LexicalViewIndex:
+    """
+    BM25 index of view names and descriptions, used to shortlist the views matching the keywords of the question\
+    before the view selection prompt is built. The index is updated incrementally as the views are registered.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
+        """
+        Args:
+            k1: BM25 term frequency saturation parameter.
+            b: BM25 document length normalization parameter.
+        """
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._lengths: Dict[str, int] = {}
+        self._total_length = 0
+
+    def add(self, name: str, description: str) -> None:
+        """
+        Adds the view to the index.
+
+        Args:
+            name: Name of the view.
+            description: Description of the view.
+        """
+        tokens = tokenize(name) + tokenize(description)
+        for token, count in Counter(tokens).items():
+            self._postings[token][name] = count
+        self._lengths[name] = len(tokens)
+        self._total_length += len(tokens)
+
+    def rank(self, question: str, top_n: int) -> List[str]:
+        """
+        Ranks the views by the BM25 score of the question.
+
+        Args:
+            question: Question asked in the natural language.
+            top_n: Maximum number of views to return.
+
+        Returns:
+            Names of at most `top_n` views sharing any keywords with the question, ordered from the best match.
+        """
+        n_views = len(self._lengths)
+        if not n_views:
+            return []
+
+        average_length = self._total_length / n_views
+        scores: Dict[str, float] = defaultdict(float)
+        for token in set(tokenize(question)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + (n_views - len(postings) + 0.5) / (len(postings) + 0.5))
+            for name, count in postings.items():
+                length_norm = 1 - self.b + self.b * self._lengths[name] / average_length
+                scores[name] += idf * count * (self.k1 + 1) / (count + self.k1 * length_norm)
+
+        return sorted(scores, key=scores.__getitem__, reverse=True)[:top_n]
+
+    def shortlist(self, question: str, views: Mapping[str, str], top_n: int) -> Mapping[str, str]:
+        """
+        Shortlists the views best matching the keywords of the question.
+
+        Args:
+            question: Question asked in the natural language.
+            views: Views to shortlist, with their descriptions.
+            top_n: Maximum number of views to return.
+
+        Returns:
+            At most `top_n` views, or all the views if none of them shares any keywords with the question.
+        """
+        if len(views) <= top_n:
+            return views
+        view_names = self.rank(question, top_n)
+        if not view_names:
+            return views
+        return {name: views[name] for name in view_names}
@@ -1,11 +1,16 @@
-from typing import Dict, Optional
+from typing import List, Mapping, Optional
 
 from dbally.audit.event_tracker import EventTracker
 from dbally.llms.base import LLM
 from dbally.llms.clients.base import LLMOptions
 from dbally.prompt.template import PromptTemplate
-from dbally.view_selection.base import ViewSelector
-from dbally.view_selection.prompt import VIEW_SELECTION_TEMPLATE, ViewSelectionPromptFormat
+from dbally.view_selection.base import RankedView, ViewSelector
+from dbally.view_selection.prompt import (
+    VIEW_RANKING_TEMPLATE,
+    VIEW_SELECTION_TEMPLATE,
+    ViewRankingPromptFormat,
+    ViewSelectionPromptFormat,
+)
 
 
 class LLMViewSelector(ViewSelector):
@@ -14,51 +19,74 @@ class LLMViewSelector(ViewSelector):
 
     Its primary function is to determine the optimal view that can effectively be used to answer a user's question.
 
-    The method used to select the most relevant view is `self.select_view`.
+    The method used to select the most relevant views is `self.rank_views`.
     It formats views using view.name: view.description format and then calls LLM Client,
     ultimately returning the name of the most suitable view.
     """
 
-    def __init__(self, llm: LLM, prompt_template: Optional[PromptTemplate[ViewSelectionPromptFormat]] = None) -> None:
+    def __init__(
+        self,
+        llm: LLM,
+        prompt_template: Optional[PromptTemplate[ViewSelectionPromptFormat]] = None,
+        ranking_prompt_template: Optional[PromptTemplate[ViewRankingPromptFormat]] = None,
+    ) -> None:
         """
         Constructs a new LLMViewSelector instance.
 
         Args:
             llm: LLM used to generate IQL
             prompt_template: template for the prompt used for the view selection
+            ranking_prompt_template: template for the prompt used for selecting multiple views
         """
         self._llm = llm
         self._prompt_template = prompt_template or VIEW_SELECTION_TEMPLATE
+        self._ranking_prompt_template = ranking_prompt_template or VIEW_RANKING_TEMPLATE
 
-    async def select_view(
+    async def rank_views(
         self,
         question: str,
-        views: Dict[str, str],
+        views: Mapping[str, str],
         event_tracker: EventTracker,
         llm_options: Optional[LLMOptions] = None,
-    ) -> str:
+        top_k: int = 1,
+    ) -> List[RankedView]:
         """
-        Based on user question and list of available views select the most relevant one by prompting LLM.
+        Based on user question and list of available views select up to `top_k` most relevant ones by prompting LLM.\
+        The views are not scored.
 
         Args:
             question: user question asked in the natural language e.g "Do we have any data scientists?"
             views: dictionary of available view names with corresponding descriptions.
             event_tracker: event tracker used to audit the selection process.
             llm_options: options to use for the LLM client.
+            top_k: maximum number of views to return.
 
         Returns:
-            The most relevant view name.
+            Selected views ordered from the most relevant one. Names of views that are not available are skipped\
+            when selecting multiple views.
 
         Raises:
             LLMError: If LLM text generation fails.
         """
-        prompt_format = ViewSelectionPromptFormat(question=question, views=views)
-        formatted_prompt = self._prompt_template.format_prompt(prompt_format)
+        if top_k == 1:
+            prompt_format = ViewSelectionPromptFormat(question=question, views=views)
+            formatted_prompt = self._prompt_template.format_prompt(prompt_format)
+
+            llm_response = await self._llm.generate_text(
+                prompt=formatted_prompt,
+                event_tracker=event_tracker,
+                options=llm_options,
+            )
+            selected_view = self._prompt_template.response_parser(llm_response)
+            return [RankedView(name=selected_view)]
+
+        prompt_format = ViewRankingPromptFormat(question=question, views=views, top_k=top_k)
+        formatted_prompt = self._ranking_prompt_template.format_prompt(prompt_format)
 
         llm_response = await self._llm.generate_text(
             prompt=formatted_prompt,
             event_tracker=event_tracker,
             options=llm_options,
         )
-        selected_view = self._prompt_template.response_parser(llm_response)
-        return selected_view
+        selected_views = self._ranking_prompt_template.response_parser(llm_response)
+        return [RankedView(name=view_name) for view_name in selected_views if view_name in views][:top_k]
@@ -1,7 +1,9 @@
-from typing import Dict, List
+import re
+from typing import List, Mapping
 
 from dbally.prompt.elements import FewShotExample
 from dbally.prompt.template import PromptFormat, PromptTemplate
+from dbally.view_selection.catalog import format_views
 
 
 class ViewSelectionPromptFormat(PromptFormat):
@@ -13,7 +15,7 @@ class ViewSelectionPromptFormat(PromptFormat):
         self,
         *,
         question: str,
-        views: Dict[str, str],
+        views: Mapping[str, str],
         examples: List[FewShotExample] = None,
     ) -> None:
         """
@@ -26,7 +28,51 @@ class ViewSelectionPromptFormat(PromptFormat):
         """
         super().__init__(examples)
         self.question = question
-        self.views = "\n".join([f"{name}: {description}" for name, description in views.items()])
+        self.views = format_views(views)
+
+
+class ViewRankingPromptFormat(ViewSelectionPromptFormat):
+    """
+    Formats provided parameters to a form acceptable by default view ranking prompt.
+    """
+
+    def __init__(
+        self,
+        *,
+        question: str,
+        views: Mapping[str, str],
+        top_k: int,
+        examples: List[FewShotExample] = None,
+    ) -> None:
+        """
+        Constructs a new ViewRankingPromptFormat instance.
+
+        Args:
+            question: Question to be asked.
+            views: Dictionary of available view names with corresponding descriptions.
+            top_k: Maximum number of views to be returned.
+            examples: List of examples to be injected into the conversation.
+        """
+        super().__init__(question=question, views=views, examples=examples)
+        self.top_k = top_k
+
+
+# bullets and numbering of the list items, e.g. "- ", "1. " or "2) "
+_LIST_MARKER = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s*")
+
+
+def _view_ranking_parser(response: str) -> List[str]:
+    """
+    Parses the response from the view ranking prompt.
+
+    Args:
+        response: Response from the LLM.
+
+    Returns:
+        View names in the order returned by the LLM, without the list markers and duplicates.
+    """
+    view_names = [_LIST_MARKER.sub("", line).strip(" -*`'\"") for line in response.splitlines()]
+    return list(dict.fromkeys(name for name in view_names if name))
 
 
 VIEW_SELECTION_TEMPLATE = PromptTemplate[ViewSelectionPromptFormat](
@@ -50,3 +96,27 @@ VIEW_SELECTION_TEMPLATE = PromptTemplate[ViewSelectionPromptFormat](
         },
     ],
 )
+
+VIEW_RANKING_TEMPLATE = PromptTemplate[ViewRankingPromptFormat](
+    [
+        {
+            "role": "system",
+            "content": (
+                "You are a very smart database programmer. "
+                "You have access to an API that lets you query a database:\n"
+                "First you need to select classes to query, based on their descriptions and the user question. "
+                "You have the following classes to choose from:\n"
+                "{views}\n"
+                "Return names of at most {top_k} classes that are the most likely to answer the user question, "
+                "one name per line, starting from the best one. Don't give any comments.\n"
+                "You can only use the classes that were listed. "
+                "If none of the classes listed can be used to answer the user question, say `NoViewFoundError`"
+            ),
+        },
+        {
+            "role": "user",
+            "content": "{question}",
+        },
+    ],
+    response_parser=_view_ranking_parser,
+)
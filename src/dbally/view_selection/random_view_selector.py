@@ -1,9 +1,9 @@
 import random
-from typing import Dict, Optional
+from typing import List, Mapping, Optional
 
 from dbally.audit.event_tracker import EventTracker
 from dbally.llms.clients.base import LLMOptions
-from dbally.view_selection.base import ViewSelector
+from dbally.view_selection.base import RankedView, ViewSelector
 
 
 class RandomViewSelector(ViewSelector):
@@ -12,25 +12,27 @@ class RandomViewSelector(ViewSelector):
     """
 
     # pylint: disable=unused-argument
-    async def select_view(
+    async def rank_views(
         self,
         question: str,
-        views: Dict[str, str],
+        views: Mapping[str, str],
         event_tracker: EventTracker,
         llm_options: Optional[LLMOptions] = None,
-    ) -> str:
+        top_k: int = 1,
+    ) -> List[RankedView]:
         """
-        Dummy implementation returning random view.
+        Dummy implementation returning random views.
 
         Args:
             question: user question.
             views: dictionary of available view names with corresponding descriptions.
             event_tracker: event store used to audit the selection process.
             llm_options: options to use for the LLM client.
+            top_k: maximum number of views to return.
 
         Returns:
-            random view name.
+            random views.
         """
-        selected = random.choice(list(views.keys()))  # nosec
-        print(f"For question: {question} I've randomly selected view: {selected}")
-        return selected
+        selected = random.sample(list(views.keys()), min(top_k, len(views)))  # nosec
+        print(f"For question: {question} I've randomly selected views: {selected}")
+        return [RankedView(name=name) for name in selected]
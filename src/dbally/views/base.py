@@ -1,11 +1,12 @@
 import abc
-from typing import Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 from dbally.audit.event_tracker import EventTracker
 from dbally.collection.results import ViewExecutionResult
 from dbally.llms.base import LLM
 from dbally.llms.clients.base import LLMOptions
 from dbally.prompt.elements import FewShotExample
+from dbally.prompt.few_shot_selector import FewShotSelector
 from dbally.similarity import AbstractSimilarityIndex
 
 IndexLocation = Tuple[str, str, str]
@@ -15,8 +16,19 @@ class BaseView(metaclass=abc.ABCMeta):
     """
     Base class for all [Views](../../concepts/views.md), which are the main building blocks of db-ally. All classes\
     implementing this interface have to be able to execute queries and return the result.
+
+    Set `few_shot_selector` to inject only the examples most relevant to the question into the prompts, instead of\
+    all the examples listed by `list_few_shots`.
     """
 
+    few_shot_selector: ClassVar[Optional[FewShotSelector]] = None
+
+    # Views able to execute again the query of a previous result implement the `replay` method
+    supports_replay: ClassVar[bool] = False
+
+    # Views able to serve multiple requests with a single instance implement the `reset` method
+    supports_reset: ClassVar[bool] = False
+
     @abc.abstractmethod
     async def ask(
         self,
@@ -26,6 +38,7 @@ class BaseView(metaclass=abc.ABCMeta):
         n_retries: int = 3,
         dry_run: bool = False,
         llm_options: Optional[LLMOptions] = None,
+        stream: bool = False,
     ) -> ViewExecutionResult:
         """
         Executes the query and returns the result.
@@ -37,9 +50,43 @@ class BaseView(metaclass=abc.ABCMeta):
             n_retries: The number of retries to execute the query in case of errors.
             dry_run: If True, the query will not be used to fetch data from the datasource.
             llm_options: Options to use for the LLM.
+            stream: If True, the rows are fetched lazily and returned as a `RowStream`.
+
+        Returns:
+            The result of the query.
+        """
+
+    async def replay(
+        self,
+        context: Dict[str, Any],
+        event_tracker: Optional[EventTracker] = None,
+        dry_run: bool = False,
+        stream: bool = False,
+    ) -> ViewExecutionResult:
+        """
+        Executes again the query described by the context of a previous result of the view, without generating it.
+        Allows to reuse generated queries while still fetching fresh data from the datasource. Called only if\
+        `supports_replay` is set.
+
+        Args:
+            context: The context of the previous result of the view.
+            event_tracker: The event tracker used to audit the query execution.
+            dry_run: If True, the query will not be used to fetch data from the datasource.
+            stream: If True, the rows are fetched lazily and returned as a `RowStream`.
 
         Returns:
             The result of the query.
+
+        Raises:
+            NotImplementedError: If the view does not implement replaying queries.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support replaying queries")
+
+    def reset(self) -> None:
+        """
+        Restores the state of the view from right after its creation, so that the instance can be reused\
+        by the next request. Called only if `supports_reset` is set. Views keeping their own per-request state\
+        have to reset it as well. Does nothing by default.
         """
 
     def list_similarity_indexes(self) -> Dict[AbstractSimilarityIndex, List[IndexLocation]]:
@@ -51,6 +98,18 @@ class BaseView(metaclass=abc.ABCMeta):
         """
         return {}
 
+    @classmethod
+    def list_class_similarity_indexes(  # pylint: disable=redundant-returns-doc
+        cls,
+    ) -> Optional[Dict[AbstractSimilarityIndex, List[IndexLocation]]]:
+        """
+        Lists all the similarity indexes used by the view, without creating its instance.
+
+        Returns:
+            Mapping of similarity indexes to their locations, or None if they can be listed only by the instance.
+        """
+        return None
+
     def list_few_shots(self) -> List[FewShotExample]:
         """
         List all examples to be injected into few-shot prompt.
@@ -59,3 +118,23 @@ class BaseView(metaclass=abc.ABCMeta):
             List of few-shot examples
         """
         return []
+
+    async def select_few_shots(
+        self,
+        question: str,
+        event_tracker: Optional[EventTracker] = None,
+    ) -> List[FewShotExample]:
+        """
+        Selects the examples to be injected into the few-shot prompt for the question.
+
+        Args:
+            question: The natural language query to execute.
+            event_tracker: The event tracker bounding the selection by the request deadline.
+
+        Returns:
+            Examples most relevant to the question if `few_shot_selector` is set, all the examples otherwise.
+        """
+        examples = self.list_few_shots()
+        if self.few_shot_selector is None:
+            return examples
+        return await self.few_shot_selector.select(question, examples, event_tracker)
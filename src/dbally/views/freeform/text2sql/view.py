@@ -1,13 +1,14 @@
 import json
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from sqlalchemy import ColumnClause, Engine, MetaData, Table, text
 
 from dbally.audit.event_tracker import EventTracker
-from dbally.collection.results import ViewExecutionResult
+from dbally.collection.results import RowStream, ViewExecutionResult
+from dbally.exceptions import RequestTimeoutError
 from dbally.llms.base import LLM
 from dbally.llms.clients.base import LLMOptions
 from dbally.prompt.template import PromptTemplate
@@ -78,6 +79,12 @@ class BaseText2SQLView(BaseView, ABC):
     Text2SQLFreeformView is a class designed to interact with the database using text2sql queries.
     """
 
+    # Number of rows fetched from the database at once when the results are streamed
+    STREAM_BATCH_SIZE = 1000
+
+    supports_replay = True
+    supports_reset = True
+
     def __init__(
         self,
         engine: Engine,
@@ -95,6 +102,11 @@ class BaseText2SQLView(BaseView, ABC):
             The list of tables used by the view.
         """
 
+    def reset(self) -> None:
+        """
+        Text2SQL views keep no per-request state, so there is nothing to reset.
+        """
+
     async def ask(
         self,
         query: str,
@@ -103,6 +115,7 @@ class BaseText2SQLView(BaseView, ABC):
         n_retries: int = 3,
         dry_run: bool = False,
         llm_options: Optional[LLMOptions] = None,
+        stream: bool = False,
     ) -> ViewExecutionResult:
         """
         Executes the query and returns the result. It generates the SQL query from the natural language query and
@@ -115,18 +128,22 @@ class BaseText2SQLView(BaseView, ABC):
             n_retries: The number of retries to execute the query in case of errors.
             dry_run: If True, the query will not be used to fetch data from the datasource.
             llm_options: Options to use for the LLM.
+            stream: If True, the rows are fetched lazily in batches of `STREAM_BATCH_SIZE` rows and returned\
+                as a `RowStream`.
 
         Returns:
             The result of the query.
 
         Raises:
             Text2SQLError: If the text2sql query generation fails after n_retries.
+            RequestTimeoutError: If the deadline of the request passes.
         """
-        sql, rows = None, None
+        sql, parameters, rows = None, [], None
         exceptions = []
 
+        event_tracker = event_tracker or EventTracker()
         tables = self.get_tables()
-        examples = self.list_few_shots()
+        examples = await self.select_few_shots(query, event_tracker)
 
         prompt_format = SQLGenerationPromptFormat(
             question=query,
@@ -136,22 +153,28 @@ class BaseText2SQLView(BaseView, ABC):
         )
         formatted_prompt = SQL_GENERATION_TEMPLATE.format_prompt(prompt_format)
 
-        for _ in range(n_retries + 1):
+        for retry in range(n_retries + 1):
             # We want to catch all exceptions to retry the process.
             # pylint: disable=broad-except
             try:
-                sql, parameters, formatted_prompt = await self._generate_sql(
-                    conversation=formatted_prompt,
-                    llm=llm,
-                    event_tracker=event_tracker,
-                    llm_options=llm_options,
-                )
+                with event_tracker.measure("sql_generation", attempt=retry):
+                    sql, parameters, formatted_prompt = await self._generate_sql(
+                        conversation=formatted_prompt,
+                        llm=llm,
+                        event_tracker=event_tracker,
+                        llm_options=llm_options,
+                    )
 
                 if dry_run:
-                    return ViewExecutionResult(results=[], context={"sql": sql})
+                    return ViewExecutionResult(
+                        results=[],
+                        context={"sql": sql, "parameters": [asdict(param) for param in parameters]},
+                    )
 
-                rows = await self._execute_sql(sql, parameters, event_tracker=event_tracker)
+                rows = await self._execute_sql(sql, parameters, event_tracker=event_tracker, stream=stream)
                 break
+            except RequestTimeoutError:
+                raise
             except Exception as e:
                 formatted_prompt = formatted_prompt.add_user_message(f"Response is invalid! Error: {e}")
                 exceptions.append(e)
@@ -163,12 +186,50 @@ class BaseText2SQLView(BaseView, ABC):
         # The underscore is used by sqlalchemy to avoid conflicts with column names
         # pylint: disable=protected-access
         return ViewExecutionResult(
-            results=[dict(row._mapping) for row in rows],
+            results=rows if isinstance(rows, RowStream) else [dict(row._mapping) for row in rows],
             context={
                 "sql": sql,
+                "parameters": [asdict(param) for param in parameters],
             },
         )
 
+    async def replay(
+        self,
+        context: Dict[str, Any],
+        event_tracker: Optional[EventTracker] = None,
+        dry_run: bool = False,
+        stream: bool = False,
+    ) -> ViewExecutionResult:
+        """
+        Executes again the SQL stored in the context of a previous result of the view. The parameters are passed\
+        through the similarity indexes again, so their current content is used.
+
+        Args:
+            context: The context of the previous result of the view.
+            event_tracker: The event tracker used to audit the query execution.
+            dry_run: If True, the query will not be used to fetch data from the datasource.
+            stream: If True, the rows are fetched lazily in batches of `STREAM_BATCH_SIZE` rows and returned\
+                as a `RowStream`.
+
+        Returns:
+            The result of the query.
+        """
+        sql = context["sql"]
+        parameters = [SQLParameterOption.from_dict(param) for param in context.get("parameters", [])]
+        context = {"sql": sql, "parameters": [asdict(param) for param in parameters]}
+
+        if dry_run:
+            return ViewExecutionResult(results=[], context=context)
+
+        rows = await self._execute_sql(sql, parameters, event_tracker=event_tracker, stream=stream)
+
+        # The underscore is used by sqlalchemy to avoid conflicts with column names
+        # pylint: disable=protected-access
+        return ViewExecutionResult(
+            results=rows if isinstance(rows, RowStream) else [dict(row._mapping) for row in rows],
+            context=context,
+        )
+
     async def _generate_sql(
         self,
         conversation: PromptTemplate,
@@ -198,8 +259,10 @@ class BaseText2SQLView(BaseView, ABC):
         sql: str,
         parameters: List[SQLParameterOption],
         event_tracker: Optional[EventTracker] = None,
-    ) -> Iterable:
+        stream: bool = False,
+    ) -> Union[Iterable, RowStream]:
         param_values = {}
+        event_tracker = event_tracker or EventTracker()
 
         for param in parameters:
             if param.table in self._table_index and self._table_index[param.table][param.column].similarity_index:
@@ -208,8 +271,16 @@ class BaseText2SQLView(BaseView, ABC):
             else:
                 param_values[param.name] = param.value
 
-        with self._engine.connect() as conn:
-            return conn.execute(text(sql), param_values).fetchall()
+        # the query is executed synchronously, so it is not started once the deadline has passed
+        event_tracker.check_deadline()
+        with event_tracker.measure("execution"):
+            if stream:
+                return RowStream.from_sqlalchemy(
+                    self._engine, text(sql), param_values, batch_size=self.STREAM_BATCH_SIZE
+                )
+
+            with self._engine.connect() as conn:
+                return conn.execute(text(sql), param_values).fetchall()
 
     def _create_default_fetcher(self, table: str, column: str) -> SimpleSqlAlchemyFetcher:
         return SimpleSqlAlchemyFetcher(
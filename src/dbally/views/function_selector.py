@@ -0,0 +1,83 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from dbally.audit.event_tracker import EventTracker
+from dbally.embeddings.base import EmbeddingClient
+from dbally.embeddings.utils import embed_with_memo, top_k_by_similarity
+from dbally.views.exposed_functions import ExposedFunction
+
+
+class FunctionSelector:
+    """
+    Selects the filters and aggregations of the view most relevant to the question, so that views exposing\
+    hundreds of them do not list all of them in each IQL generation prompt.
+
+    Functions are embedded by their name, parameters and description once and reused for all the questions,\
+    so selecting them costs a single embedding of the question. The selected functions keep their original order.
+    """
+
+    def __init__(self, embedding_client: EmbeddingClient, top_k: int = 20) -> None:
+        """
+        Args:
+            embedding_client: Client used to embed the functions and the questions.
+            top_k: Maximum number of filters and of aggregations listed in the prompt.
+
+        Raises:
+            ValueError: If `top_k` is lower than 1.
+        """
+        if top_k < 1:
+            raise ValueError("top_k must be a positive integer")
+
+        self._embedding_client = embedding_client
+        self.top_k = top_k
+        self._embeddings: Dict[str, np.ndarray] = {}
+
+    async def select(
+        self,
+        question: str,
+        filters: List[ExposedFunction],
+        aggregations: List[ExposedFunction],
+        event_tracker: Optional[EventTracker] = None,
+    ) -> Tuple[List[ExposedFunction], List[ExposedFunction]]:
+        """
+        Selects up to `top_k` filters and up to `top_k` aggregations which descriptions are the most similar\
+        to the question.
+
+        Args:
+            question: Question asked in the natural language.
+            filters: All the filters of the view.
+            aggregations: All the aggregations of the view.
+            event_tracker: Event tracker bounding the embedding call by the request deadline.
+
+        Returns:
+            The selected filters and aggregations, in the order they were listed.
+
+        Raises:
+            EmbeddingError: If embedding the functions or the question fails.
+        """
+        if len(filters) <= self.top_k and len(aggregations) <= self.top_k:
+            return list(filters), list(aggregations)
+
+        descriptions = {str(function): str(function) for function in [*filters, *aggregations]}
+        question_embedding = await embed_with_memo(
+            self._embedding_client, question, descriptions, self._embeddings, event_tracker or EventTracker()
+        )
+        return self._top_k(question_embedding, filters), self._top_k(question_embedding, aggregations)
+
+    def _top_k(self, question_embedding: np.ndarray, functions: List[ExposedFunction]) -> List[ExposedFunction]:
+        """
+        Selects up to `top_k` functions most similar to the question.
+
+        Args:
+            question_embedding: Normalized embedding of the question.
+            functions: Functions to select from.
+
+        Returns:
+            The selected functions, in the order they were listed.
+        """
+        if len(functions) <= self.top_k:
+            return list(functions)
+
+        embeddings = [self._embeddings[str(function)] for function in functions]
+        return [functions[index] for index in top_k_by_similarity(question_embedding, embeddings, self.top_k)]
@@ -1,10 +1,12 @@
 import inspect
 import textwrap
 from abc import ABC
-from typing import Any, Callable, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from dbally.iql import syntax
+from dbally.similarity import AbstractSimilarityIndex
 from dbally.views import decorators
+from dbally.views.base import IndexLocation
 from dbally.views.exposed_functions import ExposedFunction, MethodParamWithTyping
 from dbally.views.structured import BaseStructuredView
 
@@ -65,6 +67,22 @@ class MethodsBaseView(BaseStructuredView, ABC):
         """
         return self.list_methods_by_decorator(decorators.view_aggregation)
 
+    @classmethod
+    def list_class_similarity_indexes(cls) -> Optional[Dict[AbstractSimilarityIndex, List[IndexLocation]]]:
+        """
+        Lists all the similarity indexes used by the filters of the view, without creating its instance.
+
+        Returns:
+            Mapping of similarity indexes to their locations in the (view_name, filter_name, argument_name) format,\
+            or None if the view lists its filters or indexes in a custom way.
+        """
+        if (
+            cls.list_filters is not MethodsBaseView.list_filters
+            or cls.list_similarity_indexes is not BaseStructuredView.list_similarity_indexes
+        ):
+            return None
+        return cls._collect_similarity_indexes(cls.__name__, cls.list_methods_by_decorator(decorators.view_filter))
+
     def _method_with_args_from_call(
         self, func: syntax.FunctionCall, method_decorator: Callable
     ) -> Tuple[Callable, List]:
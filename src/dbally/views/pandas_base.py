@@ -5,7 +5,7 @@ from typing import List, Optional, Union
 
 import pandas as pd
 
-from dbally.collection.results import ViewExecutionResult
+from dbally.collection.results import RowStream, ViewExecutionResult
 from dbally.iql import syntax
 from dbally.iql._query import IQLAggregationQuery, IQLFiltersQuery
 from dbally.views.methods_base import MethodsBaseView
@@ -39,6 +39,11 @@ class DataFrameBaseView(MethodsBaseView):
     that return a Pandas Series representing a boolean mask to be applied to the DataFrame.
     """
 
+    # Number of rows converted to dictionaries at once when the results are streamed
+    STREAM_BATCH_SIZE = 1000
+
+    supports_reset = True
+
     def __init__(self, df: pd.DataFrame) -> None:
         """
         Creates a new instance of the DataFrame view.
@@ -51,6 +56,13 @@ class DataFrameBaseView(MethodsBaseView):
         self._filter_mask: Optional[pd.Series] = None
         self._aggregation_group: AggregationGroup = AggregationGroup()
 
+    def reset(self) -> None:
+        """
+        Discards the filters and the aggregation applied by the previous request.
+        """
+        self._filter_mask = None
+        self._aggregation_group = AggregationGroup()
+
     async def apply_filters(self, filters: IQLFiltersQuery) -> None:
         """
         Applies the chosen filters to the view.
@@ -96,13 +108,14 @@ class DataFrameBaseView(MethodsBaseView):
             return ~child
         raise ValueError(f"Unsupported grammar: {node}")
 
-    def execute(self, dry_run: bool = False) -> ViewExecutionResult:
+    def execute(self, dry_run: bool = False, stream: bool = False) -> ViewExecutionResult:
         """
         Executes the view and returns the results. The results are filtered based on the applied filters.
 
         Args:
             dry_run: If True, the method will only add `context` field to the `ExecutionResult` with the\
                 mask that would be applied to the dataframe.
+            stream: If True, the rows are converted to dictionaries lazily, in batches of `STREAM_BATCH_SIZE`.
 
         Returns:
             ExecutionResult object with the results and the context information with the binary mask.
@@ -127,7 +140,14 @@ class DataFrameBaseView(MethodsBaseView):
                 results = results.reset_index()
 
         return ViewExecutionResult(
-            results=results.to_dict(orient="records"),
+            results=(
+                RowStream(
+                    results.iloc[start : start + self.STREAM_BATCH_SIZE].to_dict(orient="records")
+                    for start in range(0, len(results), self.STREAM_BATCH_SIZE)
+                )
+                if stream and not dry_run
+                else results.to_dict(orient="records")
+            ),
             context={
                 "filter_mask": self._filter_mask,
                 "groupbys": self._aggregation_group.groupbys,
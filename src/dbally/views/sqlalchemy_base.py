@@ -3,7 +3,7 @@ import asyncio
 
 import sqlalchemy
 
-from dbally.collection.results import ViewExecutionResult
+from dbally.collection.results import RowStream, ViewExecutionResult
 from dbally.iql import syntax
 from dbally.iql._query import IQLAggregationQuery, IQLFiltersQuery
 from dbally.views.methods_base import MethodsBaseView
@@ -14,6 +14,11 @@ class SqlAlchemyBaseView(MethodsBaseView):
     Base class for views that use SQLAlchemy to generate SQL queries.
     """
 
+    # Number of rows fetched from the database at once when the results are streamed
+    STREAM_BATCH_SIZE = 1000
+
+    supports_reset = True
+
     def __init__(self, sqlalchemy_engine: sqlalchemy.Engine) -> None:
         """
         Creates a new instance of the SQL view.
@@ -25,6 +30,12 @@ class SqlAlchemyBaseView(MethodsBaseView):
         self.select = self.get_select()
         self._sqlalchemy_engine = sqlalchemy_engine
 
+    def reset(self) -> None:
+        """
+        Restores the initial select object, discarding the filters and the aggregation of the previous request.
+        """
+        self.select = self.get_select()
+
     @abc.abstractmethod
     def get_select(self) -> sqlalchemy.Select:
         """
@@ -81,12 +92,14 @@ class SqlAlchemyBaseView(MethodsBaseView):
 
         raise ValueError(f"BoolOp {bool_op} has no children")
 
-    def execute(self, dry_run: bool = False) -> ViewExecutionResult:
+    def execute(self, dry_run: bool = False, stream: bool = False) -> ViewExecutionResult:
         """
         Executes the generated SQL query and returns the results.
 
         Args:
             dry_run: If True, only adds the SQL query to the context field without executing the query.
+            stream: If True, the rows are fetched lazily in batches of `STREAM_BATCH_SIZE` rows, keeping\
+                the connection open until the returned `RowStream` is exhausted or closed.
 
         Returns:
             Results of the query where `results` will be a list of dictionaries representing retrieved rows or an empty\
@@ -95,7 +108,9 @@ class SqlAlchemyBaseView(MethodsBaseView):
         results = []
         sql = str(self.select.compile(bind=self._sqlalchemy_engine, compile_kwargs={"literal_binds": True}))
 
-        if not dry_run:
+        if not dry_run and stream:
+            results = RowStream.from_sqlalchemy(self._sqlalchemy_engine, self.select, batch_size=self.STREAM_BATCH_SIZE)
+        elif not dry_run:
             with self._sqlalchemy_engine.connect() as connection:
                 rows = connection.execute(self.select).fetchall()
                 # The underscore is used by sqlalchemy to avoid conflicts with column names
@@ -1,15 +1,19 @@
 import abc
+import asyncio
 from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type
 
 from dbally.audit.event_tracker import EventTracker
+from dbally.cache.base import Cache
 from dbally.collection.results import ViewExecutionResult
+from dbally.exceptions import RequestTimeoutError
 from dbally.iql._query import IQLAggregationQuery, IQLFiltersQuery
 from dbally.iql_generator.iql_generator import IQLGenerator
 from dbally.llms.base import LLM
 from dbally.llms.clients.base import LLMOptions
 from dbally.views.exceptions import ViewExecutionError
 from dbally.views.exposed_functions import ExposedFunction
+from dbally.views.function_selector import FunctionSelector
 
 from ..similarity import AbstractSimilarityIndex
 from .base import BaseView, IndexLocation
@@ -19,16 +23,49 @@ class BaseStructuredView(BaseView):
     """
     Base class for all structured [Views](../../concepts/views.md). All classes implementing this interface has\
     to be able to list all available filters, apply them and execute queries.
+
+    Set `iql_single_call` to make the filtering and aggregation decisions and generate their IQL in a single LLM\
+    call instead of up to four.
+
+    Set `iql_speculation_threshold` to generate the IQL concurrently with the decision whether the filters or\
+    the aggregation are needed, once at least this fraction of the recent questions asked to the view needed them.
+
+    Set `iql_cache` to reuse the IQL generated for repeated questions. The cached IQL is invalidated automatically\
+    when the filters, aggregations or examples of the view change.
+
+    Set `function_selector` to list only the filters and aggregations most relevant to the question in the IQL\
+    generation prompt, which keeps the prompt short for views exposing many of them.
     """
 
+    iql_single_call: ClassVar[bool] = False
+    iql_speculation_threshold: ClassVar[Optional[float]] = None
+    iql_cache: ClassVar[Optional[Cache]] = None
+    iql_cache_ttl: ClassVar[Optional[float]] = None
+    function_selector: ClassVar[Optional[FunctionSelector]] = None
+    _speculative_iql_generators: ClassVar[Dict[Type["BaseStructuredView"], IQLGenerator]] = {}
+
+    supports_replay = True
+
     def get_iql_generator(self) -> IQLGenerator:
         """
-        Returns the IQL generator for the view.
+        Returns the IQL generator for the view. With IQL speculation enabled, the generator is shared by all\
+        instances of the view class, so that it learns from the decisions made for all the questions.
 
         Returns:
             IQL generator for the view.
         """
-        return IQLGenerator()
+        if self.iql_speculation_threshold is None:
+            return IQLGenerator(single_call=self.iql_single_call, cache=self.iql_cache, cache_ttl=self.iql_cache_ttl)
+
+        view_class = type(self)
+        if view_class not in self._speculative_iql_generators:
+            self._speculative_iql_generators[view_class] = IQLGenerator(
+                single_call=self.iql_single_call,
+                speculation_threshold=self.iql_speculation_threshold,
+                cache=self.iql_cache,
+                cache_ttl=self.iql_cache_ttl,
+            )
+        return self._speculative_iql_generators[view_class]
 
     async def ask(
         self,
@@ -38,6 +75,7 @@ class BaseStructuredView(BaseView):
         n_retries: int = 3,
         dry_run: bool = False,
         llm_options: Optional[LLMOptions] = None,
+        stream: bool = False,
     ) -> ViewExecutionResult:
         """
         Executes the query and returns the result. It generates the IQL query from the natural language query\
@@ -50,16 +88,19 @@ class BaseStructuredView(BaseView):
             n_retries: The number of retries to execute the query in case of errors.
             dry_run: If True, the query will not be used to fetch data from the datasource.
             llm_options: Options to use for the LLM.
+            stream: If True, the rows are fetched lazily and returned as a `RowStream`.
 
         Returns:
             The result of the query.
 
         Raises:
             ViewExecutionError: When an error occurs while executing the view.
+            RequestTimeoutError: When the deadline of the request passes.
         """
-        filters = self.list_filters()
-        examples = self.list_few_shots()
-        aggregations = self.list_aggregations()
+        (filters, aggregations), examples = await asyncio.gather(
+            self.select_functions(query, event_tracker),
+            self.select_few_shots(query, event_tracker),
+        )
 
         iql_generator = self.get_iql_generator()
         iql = await iql_generator(
@@ -71,24 +112,137 @@ class BaseStructuredView(BaseView):
             event_tracker=event_tracker,
             llm_options=llm_options,
             n_retries=n_retries,
+            view_name=f"{type(self).__module__}.{type(self).__qualname__}",
         )
 
+        for operation in (iql.filters, iql.aggregation):
+            if isinstance(operation, RequestTimeoutError):
+                raise operation
+
         if iql.failed:
             raise ViewExecutionError(
                 view_name=self.__class__.__name__,
                 iql=iql,
             )
 
-        if iql.filters:
-            await self.apply_filters(iql.filters)
+        return await self._apply_and_execute(
+            filters=iql.filters,
+            aggregation=iql.aggregation,
+            event_tracker=event_tracker,
+            dry_run=dry_run,
+            stream=stream,
+        )
+
+    async def select_functions(
+        self,
+        question: str,
+        event_tracker: Optional[EventTracker] = None,
+    ) -> Tuple[List[ExposedFunction], List[ExposedFunction]]:
+        """
+        Selects the filters and aggregations to be listed in the IQL generation prompt for the question.
+
+        Args:
+            question: The natural language query to execute.
+            event_tracker: The event tracker bounding the selection by the request deadline.
+
+        Returns:
+            Filters and aggregations most relevant to the question if `function_selector` is set,\
+            all of them otherwise.
+        """
+        filters = self.list_filters()
+        aggregations = self.list_aggregations()
+        if self.function_selector is None:
+            return filters, aggregations
+        return await self.function_selector.select(question, filters, aggregations, event_tracker)
+
+    async def replay(
+        self,
+        context: Dict[str, Any],
+        event_tracker: Optional[EventTracker] = None,
+        dry_run: bool = False,
+        stream: bool = False,
+    ) -> ViewExecutionResult:
+        """
+        Executes again the IQL stored in the context of a previous result of the view. The IQL is parsed again,\
+        so the similarity indexes are consulted with their current content.
+
+        Args:
+            context: The context of the previous result of the view.
+            event_tracker: The event tracker used to audit the query execution.
+            dry_run: If True, the query will not be used to fetch data from the datasource.
+            stream: If True, the rows are fetched lazily and returned as a `RowStream`.
+
+        Returns:
+            The result of the query.
+        """
+        iql = context.get("iql") or {}
+        filters = (
+            await IQLFiltersQuery.parse(
+                source=iql["filters"],
+                allowed_functions=self.list_filters(),
+                event_tracker=event_tracker,
+            )
+            if iql.get("filters")
+            else None
+        )
+        aggregation = (
+            await IQLAggregationQuery.parse(
+                source=iql["aggregation"],
+                allowed_functions=self.list_aggregations(),
+                event_tracker=event_tracker,
+            )
+            if iql.get("aggregation")
+            else None
+        )
+        return await self._apply_and_execute(
+            filters=filters,
+            aggregation=aggregation,
+            event_tracker=event_tracker,
+            dry_run=dry_run,
+            stream=stream,
+        )
+
+    async def _apply_and_execute(
+        self,
+        filters: Optional[IQLFiltersQuery],
+        aggregation: Optional[IQLAggregationQuery],
+        event_tracker: Optional[EventTracker],
+        dry_run: bool,
+        stream: bool,
+    ) -> ViewExecutionResult:
+        """
+        Applies the IQL operations to the view and executes the resulting query.
 
-        if iql.aggregation:
-            await self.apply_aggregation(iql.aggregation)
+        Args:
+            filters: IQLQuery object representing the filters to apply.
+            aggregation: IQLQuery object representing the aggregation to apply.
+            event_tracker: The event tracker timing the query building and execution.
+            dry_run: If True, the query will not be used to fetch data from the datasource.
+            stream: If True, the rows are fetched lazily and returned as a `RowStream`.
+
+        Returns:
+            The result of the query with the applied IQL stored in the context.
 
-        result = self.execute(dry_run=dry_run)
+        Raises:
+            RequestTimeoutError: When the deadline of the request passed before the query execution.
+        """
+        event_tracker = event_tracker or EventTracker()
+
+        with event_tracker.measure("query_building"):
+            if filters:
+                await self.apply_filters(filters)
+
+            if aggregation:
+                await self.apply_aggregation(aggregation)
+
+        # the query is executed synchronously, so it is not started once the deadline has passed
+        event_tracker.check_deadline()
+        with event_tracker.measure("execution"):
+            # views implementing `execute` without streaming support are still usable without `stream`
+            result = self.execute(dry_run=dry_run, stream=True) if stream else self.execute(dry_run=dry_run)
         result.context["iql"] = {
-            "filters": str(iql.filters) if iql.filters else None,
-            "aggregation": str(iql.aggregation) if iql.aggregation else None,
+            "filters": str(filters) if filters else None,
+            "aggregation": str(aggregation) if aggregation else None,
         }
         return result
 
@@ -129,12 +283,13 @@ class BaseStructuredView(BaseView):
         """
 
     @abc.abstractmethod
-    def execute(self, dry_run: bool = False) -> ViewExecutionResult:
+    def execute(self, dry_run: bool = False, stream: bool = False) -> ViewExecutionResult:
         """
         Executes the query and returns the result.
 
         Args:
             dry_run: if True, should only generate the query without executing it.
+            stream: if True, should fetch the rows lazily and return them as a `RowStream`.
 
         Returns:
             The view execution result.
@@ -144,13 +299,28 @@ class BaseStructuredView(BaseView):
         """
         Lists all the similarity indexes used by the view.
 
+        Returns:
+            Mapping of similarity indexes to their locations in the (view_name, filter_name, argument_name) format.
+        """
+        return self._collect_similarity_indexes(self.__class__.__name__, self.list_filters())
+
+    @staticmethod
+    def _collect_similarity_indexes(
+        view_name: str, filters: List[ExposedFunction]
+    ) -> Dict[AbstractSimilarityIndex, List[IndexLocation]]:
+        """
+        Collects the similarity indexes used by the parameters of the filters.
+
+        Args:
+            view_name: Name of the view the filters belong to.
+            filters: Filters exposed by the view.
+
         Returns:
             Mapping of similarity indexes to their locations in the (view_name, filter_name, argument_name) format.
         """
         indexes = defaultdict(list)
-        filters = self.list_filters()
         for filter_ in filters:
             for param in filter_.parameters:
                 if param.similarity_index:
-                    indexes[param.similarity_index].append((self.__class__.__name__, filter_.name, param.name))
+                    indexes[param.similarity_index].append((view_name, filter_.name, param.name))
         return indexes
@@ -0,0 +1,126 @@
+# pylint: disable=missing-docstring, missing-return-doc, missing-param-doc, disallowed-name
+
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from dbally.cache import Cache, InMemoryCache, SemanticCache, SQLiteCache
+from dbally.cache.base import make_cache_key, normalize_text
+from dbally.cache.semantic import extract_literals
+from dbally.embeddings.base import EmbeddingClient
+from dbally.embeddings.exceptions import EmbeddingConnectionError
+
+
+class MockEmbeddingClient(EmbeddingClient):
+    """Embeds texts by the presence of the words related to developers and their location."""
+
+    async def get_embeddings(self, data: List[str]) -> List[List[float]]:
+        return [[float("dev" in text.lower()), float(" in " in text or "located" in text)] for text in data]
+
+
+class FailingEmbeddingClient(EmbeddingClient):
+    """Fails to embed any text."""
+
+    async def get_embeddings(self, data: List[str]) -> List[List[float]]:
+        raise EmbeddingConnectionError()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request: pytest.FixtureRequest, tmp_path: Path) -> Cache:
+    if request.param == "memory":
+        return InMemoryCache(ttl=10)
+    return SQLiteCache(tmp_path / "cache.db", ttl=10)
+
+
+async def test_set_and_get(cache: Cache) -> None:
+    await cache.set("foo", {"bar": [1, 2, 3]})
+    assert await cache.get("foo") == {"bar": [1, 2, 3]}
+    assert await cache.get("baz") is None
+
+
+async def test_delete_and_clear(cache: Cache) -> None:
+    await cache.set("foo", 1)
+    await cache.set("bar", 2)
+    await cache.delete("foo")
+    assert await cache.get("foo") is None
+    assert await cache.get("bar") == 2
+
+    await cache.clear()
+    assert await cache.get("bar") is None
+
+
+async def test_ttl(cache: Cache) -> None:
+    await cache.set("foo", 1)
+    await cache.set("bar", 2, ttl=-1)
+    assert await cache.get("foo") == 1
+    assert await cache.get("bar") is None
+
+    with patch("time.monotonic", return_value=1e12), patch("time.time", return_value=1e12):
+        assert await cache.get("foo") is None
+
+
+async def test_in_memory_cache_lru_eviction() -> None:
+    cache = InMemoryCache(max_size=2)
+    await cache.set("foo", 1)
+    await cache.set("bar", 2)
+    await cache.get("foo")
+    await cache.set("baz", 3)
+
+    assert len(cache) == 2
+    assert await cache.get("bar") is None
+    assert await cache.get("foo") == 1
+    assert await cache.get("baz") == 3
+
+
+async def test_sqlite_cache_persistence(tmp_path: Path) -> None:
+    await SQLiteCache(tmp_path / "cache.db").set("foo", [1, 2])
+    assert await SQLiteCache(tmp_path / "cache.db").get("foo") == [1, 2]
+
+
+def test_cache_key() -> None:
+    assert normalize_text("  Show   ME\tdevelopers ") == "show me developers"
+    assert make_cache_key("foo", ["bar"]) == make_cache_key("foo", ["bar"])
+    assert make_cache_key("foo", ["bar"]) != make_cache_key("foo", ["baz"])
+
+
+def test_extract_literals() -> None:
+    assert extract_literals("Show devs in Berlin with 5 years") == {"berlin", "5"}
+    assert extract_literals("Developers located in 'New York'") == {"new york"}
+    assert extract_literals("2023 hires") == {"2023"}
+
+
+async def test_semantic_cache() -> None:
+    cache = SemanticCache(MockEmbeddingClient(), threshold=0.9)
+    await cache.set("Show devs in Berlin", "foo", namespace="views")
+
+    assert await cache.get("Developers located in Berlin", namespace="views") == "foo"
+    assert await cache.get("Developers located in Paris", namespace="views") is None
+    assert await cache.get("Developers located in Berlin", namespace="other") is None
+    assert await cache.get("List all cities in Berlin", namespace="views") is None
+
+    await cache.delete("Show devs in Berlin", namespace="views")
+    assert await cache.get("Show devs in Berlin", namespace="views") is None
+    assert "show devs in berlin" not in cache._embeddings  # pylint: disable=protected-access
+
+
+async def test_semantic_cache_eviction_and_ttl() -> None:
+    cache = SemanticCache(MockEmbeddingClient(), max_size=1, ttl=10)
+    await cache.set("devs in Berlin", "foo")
+    await cache.set("devs in Paris", "bar")
+    assert len(cache) == 1
+    assert await cache.get("devs in Berlin") is None
+
+    with patch("time.monotonic", return_value=1e12):
+        assert await cache.get("devs in Paris") is None
+
+
+async def test_semantic_cache_embedding_error() -> None:
+    cache = SemanticCache(MockEmbeddingClient())
+    await cache.set("devs in Berlin", "foo")
+    cache.embedding_client = FailingEmbeddingClient()
+
+    assert await cache.get("devs located in Berlin") is None
+    await cache.set("devs in Paris", "bar")
+    assert len(cache) == 1
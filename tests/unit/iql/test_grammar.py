@@ -0,0 +1,89 @@
+from typing import List, Literal
+
+import pytest
+from typing_extensions import Annotated
+
+from dbally.iql import IQLFiltersQuery
+from dbally.iql.grammar import IQLGrammar
+from dbally.iql_generator.prompt import FILTERS_GENERATION_TEMPLATE, IQLGenerationPromptFormat
+from dbally.views.exposed_functions import ExposedFunction, MethodParamWithTyping
+
+FUNCTIONS = [
+    ExposedFunction("filter_by_city", "", [MethodParamWithTyping("city", Annotated[str, "city name"])]),
+    ExposedFunction("older_than", "", [MethodParamWithTyping("age", int)]),
+    ExposedFunction("has_seniority", "", [MethodParamWithTyping("seniority", Literal["junior", "senior"])]),
+    ExposedFunction("in_cities", "", [MethodParamWithTyping("cities", List[str])]),
+    ExposedFunction("salary_between", "", [MethodParamWithTyping("low", float), MethodParamWithTyping("high", float)]),
+    ExposedFunction("notable", "", []),
+]
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        'filter_by_city("Berlin")',
+        "older_than(30) AND has_seniority('senior')",
+        'has_seniority("junior") or (not notable() AND in_cities(["Paris", "Rome"]))',
+        "NOT(notable())",
+        "salary_between(1000, 2500.5)",
+        "in_cities([])",
+        "UNSUPPORTED QUERY",
+    ],
+)
+async def test_grammar_accepts_valid_iql(source: str) -> None:
+    assert IQLGrammar(FUNCTIONS).accepts(source)
+    if source != "UNSUPPORTED QUERY":
+        await IQLFiltersQuery.parse(source, allowed_functions=FUNCTIONS)
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "filter_by_city(Berlin)",
+        "older_than(3.5)",
+        "older_than(030)",
+        "older_than(-5)",
+        'has_seniority("mid")',
+        "notnotable()",
+        "unknown_filter()",
+        "older_than(1) andnotable()",
+        "older_than(1) AND",
+        "salary_between(1000)",
+        "in_cities([1])",
+        " notable()",
+    ],
+)
+def test_grammar_rejects_invalid_iql(source: str) -> None:
+    assert not IQLGrammar(FUNCTIONS).accepts(source)
+
+
+def test_grammar_without_operators() -> None:
+    grammar = IQLGrammar(FUNCTIONS, operators=False)
+    assert grammar.accepts("older_than(5)")
+    assert not grammar.accepts("older_than(5) AND notable()")
+    assert not grammar.accepts("NOT notable()")
+
+
+def test_grammar_prefixes() -> None:
+    grammar = IQLGrammar(FUNCTIONS)
+    state = grammar.advance(grammar.initial_state, "older_than(3")
+    assert state is not None
+    assert not grammar.is_complete(state)
+    assert grammar.step(state, '"') is None
+    assert grammar.is_complete(grammar.advance(state, ")"))
+
+
+def test_grammar_equality() -> None:
+    assert IQLGrammar(FUNCTIONS) == IQLGrammar(list(FUNCTIONS))
+    assert hash(IQLGrammar(FUNCTIONS)) == hash(IQLGrammar(list(FUNCTIONS)))
+    assert IQLGrammar(FUNCTIONS) != IQLGrammar(FUNCTIONS, operators=False)
+    assert IQLGrammar(FUNCTIONS) != IQLGrammar(FUNCTIONS[:-1])
+
+
+def test_generation_prompt_grammar() -> None:
+    prompt_format = IQLGenerationPromptFormat(question="Who is older than 30?", methods=FUNCTIONS)
+    formatted_prompt = FILTERS_GENERATION_TEMPLATE.format_prompt(prompt_format)
+    assert FILTERS_GENERATION_TEMPLATE.grammar is None
+    assert formatted_prompt.grammar.accepts("older_than(30)")
+    retry_prompt = formatted_prompt.add_assistant_message("older_than(thirty)").add_user_message("Try again")
+    assert retry_prompt.grammar is formatted_prompt.grammar
@@ -1,5 +1,5 @@
 import re
-from typing import List
+from typing import List, Literal
 
 import pytest
 
@@ -15,6 +15,7 @@ from dbally.iql._exceptions import (
 )
 from dbally.iql._processor import IQLProcessor
 from dbally.iql._query import IQLAggregationQuery, IQLFiltersQuery
+from dbally.iql._repair import repair_iql
 from dbally.views.exposed_functions import ExposedFunction, MethodParamWithTyping
 
 
@@ -417,3 +418,92 @@ def test_keywords_lowercase():
         """NOT NOT NOT 'NOT' "NOT" AND AND "ORNOTAND" """, keywords=["NOT", "OR", "AND"]
     )
     assert rv == """not not not 'NOT' "NOT" and and "ORNOTAND" """
+
+
+REPAIR_FUNCTIONS = [
+    ExposedFunction(name="filter_by_city", description="", parameters=[MethodParamWithTyping(name="city", type=str)]),
+    ExposedFunction(
+        name="filter_by_seniority",
+        description="",
+        parameters=[MethodParamWithTyping(name="seniority", type=Literal["junior", "senior"])],
+    ),
+    ExposedFunction(name="older_than", description="", parameters=[MethodParamWithTyping(name="age", type=int)]),
+    ExposedFunction(
+        name="filter_by_names", description="", parameters=[MethodParamWithTyping(name="names", type=List[str])]
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "iql, repaired",
+    [
+        ("filter_by_citys('Kraków')", "filter_by_city('Kraków')"),
+        ("filter_by_seniority('Senior') AND older_than('30')", "filter_by_seniority('senior') AND older_than(30)"),
+        ("NOT filter_by_seniority('seniors')", "NOT filter_by_seniority('senior')"),
+        ("filter_by_names('John', 'Anne')", "filter_by_names(['John', 'Anne'])"),
+        ("filter_by_names('John') or filter_by_city(12)", "filter_by_names(['John']) or filter_by_city('12')"),
+        ("filter_by_seniority('mid')", None),
+        ("filter_by_country('Poland')", None),
+        ("filter_by_city('Kraków'", None),
+    ],
+)
+def test_repair_iql(iql: str, repaired: str):
+    assert repair_iql(iql, REPAIR_FUNCTIONS) == repaired
+
+
+SALARY_FUNCTIONS = [
+    ExposedFunction(name=name, description="", parameters=[MethodParamWithTyping(name="salary", type=int)])
+    for name in ["filter_by_min_salary", "filter_by_max_salary", "filter_by_salary_lt", "filter_by_salary_gt"]
+]
+
+
+@pytest.mark.parametrize(
+    "iql, repaired",
+    [
+        ("Filter_By_Min_Salary(100)", "filter_by_min_salary(100)"),
+        ("filter_by_min_salaries(100)", "filter_by_min_salary(100)"),
+        ("filter_by_max_slary(100)", "filter_by_max_salary(100)"),
+        ("filter_by_max_saalry(100)", "filter_by_max_salary(100)"),
+        ("filter_by_mid_salary(100)", None),
+        ("filter_by_maximum_salary(100)", None),
+        ("filter_by_salary_le(100)", None),
+        ("filter_by_salary_gte(100)", None),
+        ("filter_by_salary(100)", None),
+        ("filter_by_min_max_salary(100)", None),
+    ],
+)
+def test_repair_iql_function_name(iql: str, repaired: str):
+    assert repair_iql(iql, SALARY_FUNCTIONS) == repaired
+
+
+@pytest.mark.parametrize(
+    "iql",
+    ["filter_by_max_salary(100)", "filter_by_min_salary(100)", "filter_by_salary_gt(100)", "filter_by_salary_lt(100)"],
+)
+def test_repair_iql_does_not_swap_functions(iql: str):
+    other_functions = [function for function in SALARY_FUNCTIONS if not iql.startswith(f"{function.name}(")]
+    assert repair_iql(iql, other_functions) is None
+
+
+async def test_iql_parser_repair():
+    parsed = await IQLFiltersQuery.parse(
+        "filter_by_citys('Kraków') and filter_by_seniority('Senior')",
+        allowed_functions=REPAIR_FUNCTIONS,
+        repair=True,
+    )
+
+    assert parsed.source == "filter_by_city('Kraków') and filter_by_seniority('senior')"
+    assert parsed.root == syntax.And(
+        [syntax.FunctionCall("filter_by_city", ["Kraków"]), syntax.FunctionCall("filter_by_seniority", ["senior"])]
+    )
+
+
+async def test_iql_parser_repair_fail():
+    with pytest.raises(IQLArgumentValidationError) as exc_info:
+        await IQLFiltersQuery.parse(
+            "filter_by_seniority('mid')",
+            allowed_functions=REPAIR_FUNCTIONS,
+            repair=True,
+        )
+
+    assert exc_info.match(re.escape("mid must be one of ['junior', 'senior']: 'mid'"))
@@ -14,7 +14,7 @@ from dbally.iql_generator.iql_generator import IQLGenerator, IQLGeneratorState
 from dbally.llms.base import LLM
 from dbally.llms.clients.base import LLMClient, LLMOptions
 from dbally.similarity.index import AbstractSimilarityIndex
-from dbally.view_selection.base import ViewSelector
+from dbally.view_selection.base import RankedView, ViewSelector
 from dbally.views.structured import BaseStructuredView, ExposedFunction, ViewExecutionResult
 
 
@@ -52,8 +52,8 @@ class MockViewSelector(ViewSelector):
     def __init__(self, name: str) -> None:
         self.name = name
 
-    async def select_view(self, *_, **__) -> str:
-        return self.name
+    async def rank_views(self, *_, **__) -> List[RankedView]:
+        return [RankedView(self.name)]
 
 
 class MockSimilarityIndex(AbstractSimilarityIndex):
@@ -0,0 +1,110 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from dbally.collection.admission import AdmissionController
+from dbally.collection.exceptions import CollectionOverloadedError
+
+
+async def run_requests(controller: AdmissionController, priorities: List[int]) -> List[int]:
+    order = []
+    release = asyncio.Event()
+
+    async def blocking_request() -> None:
+        async with controller.admit():
+            await release.wait()
+
+    async def request(priority: int) -> None:
+        async with controller.admit(priority):
+            order.append(priority)
+
+    blocker = asyncio.create_task(blocking_request())
+    await asyncio.sleep(0)
+    tasks = []
+    for priority in priorities:
+        tasks.append(asyncio.create_task(request(priority)))
+        await asyncio.sleep(0.01)
+
+    release.set()
+    await asyncio.gather(blocker, *tasks)
+    return order
+
+
+async def test_admission_priority() -> None:
+    controller = AdmissionController("foo", max_concurrency=1, max_queue_size=3, priority_aging=100)
+
+    order = await run_requests(controller, [-1, 1, 0])
+
+    assert order == [1, 0, -1]
+    assert controller.stats.admitted == 4
+    assert controller.stats.in_flight == controller.stats.queue_depth == 0
+
+
+async def test_admission_priority_aging() -> None:
+    controller = AdmissionController("foo", max_concurrency=1, max_queue_size=3, priority_aging=0.001)
+
+    order = await run_requests(controller, [-1, 0, 1])
+
+    assert order == [-1, 0, 1]
+
+
+async def test_admission_cancelled_waiter() -> None:
+    controller = AdmissionController("foo", max_concurrency=1, max_queue_size=1)
+
+    async with controller.admit():
+        waiter = asyncio.create_task(controller.admit().__aenter__())
+        await asyncio.sleep(0)
+        with pytest.raises(CollectionOverloadedError):
+            async with controller.admit():
+                pass
+        waiter.cancel()
+        await asyncio.sleep(0)
+
+    assert controller.stats.in_flight == controller.stats.queue_depth == 0
+    async with controller.admit():
+        assert controller.stats.in_flight == 1
+
+
+async def test_admission_waiter_cancelled_during_handoff() -> None:
+    controller = AdmissionController("foo", max_concurrency=1, max_queue_size=2)
+    release = asyncio.Event()
+
+    async def blocking_request() -> None:
+        async with controller.admit():
+            await release.wait()
+
+    blocker = asyncio.create_task(blocking_request())
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(controller.admit().__aenter__())
+    await asyncio.sleep(0)
+    granted = asyncio.create_task(controller.admit().__aenter__())
+    await asyncio.sleep(0)
+
+    # the first waiter is cancelled in the same tick in which the blocker hands its slot over
+    release.set()
+    cancelled.cancel()
+    await blocker
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    await granted
+
+    assert controller.stats.in_flight == 1
+    assert controller.stats.queue_depth == 0
+
+
+async def test_admission_waiter_cancelled_after_handoff() -> None:
+    controller = AdmissionController("foo", max_concurrency=1, max_queue_size=1)
+
+    blocker = controller.admit()
+    await blocker.__aenter__()
+    waiter = asyncio.create_task(controller.admit().__aenter__())
+    await asyncio.sleep(0)
+
+    await blocker.__aexit__(None, None, None)
+    # the slot is already handed over, but the waiter has not resumed yet
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert controller.stats.in_flight == controller.stats.queue_depth == 0
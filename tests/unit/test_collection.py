@@ -1,5 +1,6 @@
 # pylint: disable=missing-docstring, missing-return-doc, missing-param-doc, disallowed-name, missing-return-type-doc
 
+import asyncio
 from typing import List, Tuple, Type
 from unittest.mock import AsyncMock, Mock
 
@@ -7,12 +8,26 @@ import pytest
 from typing_extensions import Annotated
 
 import dbally
-from dbally.collection import Collection
-from dbally.collection.exceptions import IndexUpdateError, NoViewFoundError
-from dbally.collection.results import ViewExecutionResult
+from dbally.audit.event_tracker import EventTracker
+from dbally.cache import InMemoryCache, SemanticCache
+from dbally.collection import (
+    AdmissionConfig,
+    AnswerCacheConfig,
+    Collection,
+    CollectionConfig,
+    NegativeCacheConfig,
+    ViewSelectionConfig,
+)
+from dbally.collection.answer_cache import AnswerCache
+from dbally.collection.exceptions import CollectionOverloadedError, IndexUpdateError, NoViewFoundError
+from dbally.collection.results import ExecutionResult, ViewExecutionResult
+from dbally.exceptions import RequestTimeoutError
 from dbally.iql._query import IQLAggregationQuery, IQLFiltersQuery
 from dbally.iql.syntax import FunctionCall
 from dbally.iql_generator.iql_generator import IQLGeneratorState
+from dbally.iql_generator.prompt import UnsupportedQueryError
+from dbally.view_selection.base import RankedView
+from dbally.views.exceptions import ViewExecutionError
 from dbally.views.exposed_functions import ExposedFunction, MethodParamWithTyping
 from tests.unit.mocks import MockIQLGenerator, MockLLM, MockSimilarityIndex, MockViewBase, MockViewSelector
 
@@ -158,6 +173,22 @@ def test_list(collection: Collection) -> None:
     assert views["MockView2"] == "Mock view 2"
 
 
+def test_catalog(collection: Collection) -> None:
+    """
+    Tests that the catalog is versioned and its prompt fragment is updated as views are registered
+    """
+    catalog = collection.catalog
+    version, fingerprint = catalog.version, catalog.fingerprint
+    assert catalog.prompt_fragment == "MockView1: Mock view 1\nMockView2: Mock view 2"
+
+    collection.add(MockView3)
+
+    assert catalog.version == version + 1
+    assert catalog.fingerprint != fingerprint
+    assert catalog.prompt_fragment.endswith("\nMockView3: Mock view 3, a view with default arguments only")
+    assert collection.list() == dict(catalog)
+
+
 def test_get(collection: Collection) -> None:
     """
     Tests that the get method works correctly
@@ -324,6 +355,83 @@ async def test_ask_view_selection_multiple_views() -> None:
     assert result.context == {"baz": "qux", "iql": {"aggregation": "test_aggregation()", "filters": "test_filter()"}}
 
 
+async def test_ask_view_selection_prefilter() -> None:
+    """
+    Tests that only the views matching the keywords of the question are passed to the view selector
+    """
+    view_selector = MockViewSelector("MockViewWithResults")
+    view_selector.rank_views = AsyncMock(return_value=[RankedView("MockViewWithResults")])
+    collection = Collection(
+        "foo",
+        view_selector=view_selector,
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+        config=CollectionConfig(view_selection=ViewSelectionConfig(prefilter_views=2)),
+    )
+    collection.add(MockView1)
+    collection.add(MockViewWithResults)
+    collection.add(MockView2)
+
+    result = await collection.ask("Mock view with results")
+    assert result.view_name == "MockViewWithResults"
+    assert list(view_selector.rank_views.call_args.kwargs["views"]) == ["MockViewWithResults", "MockView1"]
+
+    await collection.ask("Unrelated question")
+    assert len(view_selector.rank_views.call_args.kwargs["views"]) == 3
+
+
+async def test_ask_view_selection_cache() -> None:
+    """
+    Tests that the view selection is cached for repeated questions, unless its score is too low
+    """
+    view_selector = MockViewSelector("MockViewWithResults")
+    view_selector.rank_views = AsyncMock(return_value=[RankedView("MockViewWithResults", score=0.9)])
+    collection = Collection(
+        "foo",
+        view_selector=view_selector,
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+        config=CollectionConfig(view_selection=ViewSelectionConfig(cache=InMemoryCache(), min_score=0.5)),
+    )
+    collection.add(MockView1)
+    collection.add(MockViewWithResults)
+
+    await collection.ask("Mock question")
+    result = await collection.ask("mock  QUESTION")
+    assert result.view_name == "MockViewWithResults"
+    assert view_selector.rank_views.call_count == 1
+
+    view_selector.rank_views.return_value = [RankedView("MockViewWithResults", score=0.1)]
+    await collection.ask("Other question")
+    await collection.ask("Other question")
+    assert view_selector.rank_views.call_count == 3
+
+
+async def test_ask_view_selection_cache_error() -> None:
+    """
+    Tests that the ask method answers the question when the view selection cache fails
+    """
+    cache = AsyncMock()
+    cache.get.side_effect = OSError("disk is full")
+    cache.set.side_effect = OSError("disk is full")
+    collection = Collection(
+        "foo",
+        view_selector=MockViewSelector("MockViewWithResults"),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+        config=CollectionConfig(view_selection=ViewSelectionConfig(cache=cache)),
+    )
+    collection.add(MockView1)
+    collection.add(MockViewWithResults)
+
+    result = await collection.ask("Mock question")
+    assert result.view_name == "MockViewWithResults"
+    assert cache.set.call_count == 1
+
+
 async def test_ask_view_selection_no_views() -> None:
     """
     Tests that the ask method raises an exception when there are no views
@@ -418,3 +526,650 @@ async def test_update_similarity_indexes_error(
         foo_index: foo_exception,
     }
     assert bar_index.update_count == 1
+
+
+async def test_ask_many_preserves_order_and_reports_errors() -> None:
+    """
+    Tests that the ask_many method returns results in the order of questions and reports errors per question
+    """
+
+    class MockViewSelectorByQuestion(MockViewSelector):
+        async def rank_views(self, question: str, *_, **__) -> List[RankedView]:
+            return [RankedView(question)]
+
+    collection = Collection(
+        "foo",
+        view_selector=MockViewSelectorByQuestion(""),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+    )
+    collection.add(MockView1)
+    collection.add(MockViewWithResults)
+
+    results = await collection.ask_many(["MockViewWithResults", "UnknownView", "MockView1"])
+
+    assert len(results) == 3
+    assert results[0].view_name == "MockViewWithResults"
+    assert results[0].results == [{"foo": "bar"}]
+    assert isinstance(results[1], NoViewFoundError)
+    assert results[2].view_name == "MockView1"
+
+
+async def test_ask_many_max_concurrency() -> None:
+    """
+    Tests that the ask_many method does not run more than `max_concurrency` questions at the same time
+    """
+    running = 0
+    max_running = 0
+
+    class MockSlowView(MockViewBase):
+        async def apply_filters(self, filters: IQLFiltersQuery) -> None:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        def get_iql_generator(self) -> MockIQLGenerator:
+            return MockIQLGenerator(
+                IQLGeneratorState(filters=IQLFiltersQuery(FunctionCall("test_filter", []), "test_filter()")),
+            )
+
+    collection = Collection(
+        "foo",
+        view_selector=MockViewSelector(""),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+    )
+    collection.add(MockSlowView)
+
+    results = await collection.ask_many([f"Question {i}" for i in range(10)], max_concurrency=3)
+
+    assert len(results) == 10
+    assert all(result.view_name == "MockSlowView" for result in results)
+    assert max_running == 3
+
+
+async def test_ask_many_invalid_concurrency(collection: Collection) -> None:
+    """
+    Tests that the ask_many method raises an exception when `max_concurrency` is not positive
+    """
+    with pytest.raises(ValueError):
+        await collection.ask_many(["Mock question"], max_concurrency=0)
+
+
+class MockRankingViewSelector(MockViewSelector):
+    def __init__(self, names: List[str]) -> None:
+        super().__init__(names[0])
+        self.names = names
+
+    async def rank_views(self, *_, top_k: int = 1, **__) -> List[RankedView]:
+        return [RankedView(name) for name in self.names[:top_k]]
+
+
+class MockUnsupportedView(MockViewBase):
+    """
+    Mock view unable to answer any question
+    """
+
+    def get_iql_generator(self) -> MockIQLGenerator:
+        raise UnsupportedQueryError
+
+
+async def test_ask_speculative_views_skips_failed_view() -> None:
+    """
+    Tests that the ask method returns the answer of the next candidate view when the best one fails
+    """
+    collection = Collection(
+        "foo",
+        view_selector=MockRankingViewSelector(["MockUnsupportedView", "MockViewWithResults", "MockView1"]),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+        config=CollectionConfig(speculative_views=2),
+    )
+    collection.add(MockUnsupportedView)
+    collection.add(MockViewWithResults)
+    collection.add(MockView1)
+
+    result = await collection.ask("Mock question")
+    assert result.view_name == "MockViewWithResults"
+    assert result.results == [{"foo": "bar"}]
+
+
+async def test_ask_speculative_views_prefers_highest_ranked_view() -> None:
+    """
+    Tests that the ask method returns the answer of the highest-ranked view when multiple views succeed
+    """
+
+    class MockSlowViewWithResults(MockViewWithResults):
+        async def apply_filters(self, filters: IQLFiltersQuery) -> None:
+            await asyncio.sleep(0.01)
+
+    collection = Collection(
+        "foo",
+        view_selector=MockRankingViewSelector(["MockSlowViewWithResults", "MockView1"]),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+        config=CollectionConfig(speculative_views=2),
+    )
+    collection.add(MockSlowViewWithResults)
+    collection.add(MockView1)
+
+    result = await collection.ask("Mock question")
+    assert result.view_name == "MockSlowViewWithResults"
+
+
+async def test_ask_speculative_views_skips_broken_view() -> None:
+    """
+    Tests that the ask method returns the answer of a lower-ranked view when the best one raises an unexpected error
+    """
+
+    class MockBrokenView(MockViewBase):
+        def get_iql_generator(self) -> MockIQLGenerator:
+            raise RuntimeError("broken view")
+
+    collection = Collection(
+        "foo",
+        view_selector=MockRankingViewSelector(["MockBrokenView", "MockViewWithResults"]),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+        config=CollectionConfig(speculative_views=2),
+    )
+    collection.add(MockBrokenView)
+    collection.add(MockViewWithResults)
+
+    result = await collection.ask("Mock question")
+    assert result.view_name == "MockViewWithResults"
+
+
+async def test_ask_speculative_views_all_failed() -> None:
+    """
+    Tests that the ask method raises the error of the highest-ranked view when all candidate views fail
+    """
+    collection = Collection(
+        "foo",
+        view_selector=MockRankingViewSelector(["MockUnsupportedView", "UnknownView"]),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+        config=CollectionConfig(speculative_views=2),
+    )
+    collection.add(MockUnsupportedView)
+    collection.add(MockView1)
+
+    with pytest.raises(UnsupportedQueryError):
+        await collection.ask("Mock question")
+
+
+async def test_ask_stream_with_natural_response(collection: Collection) -> None:
+    """
+    Tests that the ask method raises an exception when natural response is requested for streamed results
+    """
+    with pytest.raises(ValueError):
+        await collection.ask("Mock question", stream=True, return_natural_response=True)
+
+
+class MockCountingIQLGenerator(MockIQLGenerator):
+    def __init__(self, state: IQLGeneratorState) -> None:
+        super().__init__(state)
+        self.call_count = 0
+
+    async def __call__(self, *_, **__) -> IQLGeneratorState:
+        self.call_count += 1
+        return self.state
+
+
+@pytest.fixture(name="cached_collection_generator")
+def mock_cached_collection_generator() -> MockCountingIQLGenerator:
+    return MockCountingIQLGenerator(
+        IQLGeneratorState(filters=IQLFiltersQuery(FunctionCall("test_filter", []), "test_filter()")),
+    )
+
+
+def create_cached_collection(iql_generator: MockIQLGenerator, answer_cache: AnswerCacheConfig) -> Collection:
+    rows = [[{"foo": "bar"}], [{"foo": "baz"}]]
+
+    class MockViewWithChangingResults(MockViewWithResults):
+        def execute(self, dry_run=False) -> ViewExecutionResult:
+            return ViewExecutionResult(results=rows.pop(0), context={})
+
+        def get_iql_generator(self) -> MockIQLGenerator:
+            return iql_generator
+
+    collection = Collection(
+        "foo",
+        view_selector=MockViewSelector("MockViewWithChangingResults"),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+        config=CollectionConfig(answer_cache=answer_cache),
+    )
+    collection.add(MockViewWithChangingResults)
+    return collection
+
+
+async def test_ask_cached_results(cached_collection_generator: MockCountingIQLGenerator) -> None:
+    """
+    Tests that the ask method returns cached rows for repeated questions
+    """
+    collection = create_cached_collection(
+        cached_collection_generator, AnswerCacheConfig(InMemoryCache(), cache_results=True)
+    )
+
+    first_result = await collection.ask("Mock question")
+    second_result = await collection.ask("  mock QUESTION ")
+
+    assert first_result.results == second_result.results == [{"foo": "bar"}]
+    assert second_result.view_name == "MockViewWithChangingResults"
+    assert second_result.context["iql"] == {"filters": "test_filter()", "aggregation": None}
+    assert cached_collection_generator.call_count == 1
+
+
+async def test_ask_cached_query(cached_collection_generator: MockCountingIQLGenerator) -> None:
+    """
+    Tests that the ask method executes again the cached query when the rows are not cached
+    """
+    collection = create_cached_collection(cached_collection_generator, AnswerCacheConfig(InMemoryCache()))
+
+    first_result = await collection.ask("Mock question")
+    second_result = await collection.ask("Mock question")
+
+    assert first_result.results == [{"foo": "bar"}]
+    assert second_result.results == [{"foo": "baz"}]
+    assert second_result.context["iql"] == {"filters": "test_filter()", "aggregation": None}
+    assert cached_collection_generator.call_count == 1
+
+
+@pytest.mark.parametrize("semantic", [False, True])
+async def test_ask_cache_invalidation(cached_collection_generator: MockCountingIQLGenerator, semantic: bool) -> None:
+    """
+    Tests that the cached answers are invalidated explicitly and when the registered views change
+    """
+    if semantic:
+        embedding_client = AsyncMock()
+        embedding_client.get_embeddings.side_effect = lambda texts: [[1.0, 0.0] for _ in texts]
+        answer_cache = AnswerCacheConfig(semantic_cache=SemanticCache(embedding_client, threshold=0.9))
+    else:
+        answer_cache = AnswerCacheConfig(InMemoryCache())
+    collection = create_cached_collection(cached_collection_generator, answer_cache)
+
+    await collection.ask("Mock question")
+    await collection.invalidate_cache("Mock question")
+    await collection.ask("Mock question")
+    assert cached_collection_generator.call_count == 2
+
+    collection.add(MockView1)
+    with pytest.raises(IndexError):
+        await collection.ask("Mock question")
+    assert cached_collection_generator.call_count == 3
+
+
+async def test_ask_semantic_cache(cached_collection_generator: MockCountingIQLGenerator) -> None:
+    """
+    Tests that the query generated for a question is reused for similar questions mentioning the same literals
+    """
+    embedding_client = AsyncMock()
+    embedding_client.get_embeddings.side_effect = lambda texts: [[1.0, float("Paris" in text)] for text in texts]
+    collection = create_cached_collection(
+        cached_collection_generator, AnswerCacheConfig(semantic_cache=SemanticCache(embedding_client, threshold=0.9))
+    )
+
+    await collection.ask("Show devs in Berlin")
+    result = await collection.ask("Which developers live in Berlin?")
+    assert result.results == [{"foo": "baz"}]
+    assert result.context["iql"] == {"filters": "test_filter()", "aggregation": None}
+    assert cached_collection_generator.call_count == 1
+
+    with pytest.raises(IndexError):
+        await collection.ask("Which developers live in Paris?")
+    assert cached_collection_generator.call_count == 2
+
+
+async def test_ask_semantic_cache_embedding_error(cached_collection_generator: MockCountingIQLGenerator) -> None:
+    """
+    Tests that the ask method answers the question when the semantic cache fails to embed it
+    """
+    embedding_client = AsyncMock()
+    embedding_client.get_embeddings.side_effect = RuntimeError("embedding API is down")
+    collection = create_cached_collection(
+        cached_collection_generator, AnswerCacheConfig(semantic_cache=SemanticCache(embedding_client, threshold=0.9))
+    )
+
+    result = await collection.ask("Show devs in Berlin")
+    assert result.results == [{"foo": "bar"}]
+    result = await collection.ask("Show devs in Berlin")
+    assert result.results == [{"foo": "baz"}]
+    assert cached_collection_generator.call_count == 2
+
+
+async def test_ask_cache_error(cached_collection_generator: MockCountingIQLGenerator) -> None:
+    """
+    Tests that the ask method answers the question when the cache fails
+    """
+    cache = AsyncMock()
+    cache.get.side_effect = OSError("disk is full")
+    cache.set.side_effect = OSError("disk is full")
+    collection = create_cached_collection(cached_collection_generator, AnswerCacheConfig(cache, cache_results=True))
+
+    result = await collection.ask("Mock question")
+    assert result.results == [{"foo": "bar"}]
+    assert cache.set.call_count == 1
+
+
+async def test_answer_cache_stores_replay_context() -> None:
+    """
+    Tests that only the context needed to replay the query is cached
+    """
+    answer_cache = AnswerCache("foo", AnswerCacheConfig(InMemoryCache(), cache_results=True))
+    iql = {"filters": "test_filter()", "aggregation": None}
+    result = ExecutionResult(
+        results=[{"foo": "bar"}],
+        context={"iql": iql, "filter_mask": [True, False]},
+        execution_time=0.0,
+        execution_time_view=0.0,
+        view_name="MockView",
+    )
+
+    await answer_cache.set("Mock question", "", result, dry_run=False, event_tracker=EventTracker())
+    cached_result = await answer_cache.get("Mock question", "", EventTracker())
+    assert cached_result.context == {"iql": iql}
+    assert cached_result.results == [{"foo": "bar"}]
+
+
+class MockSlowIQLGenerator(MockCountingIQLGenerator):
+    async def __call__(self, *_, **__) -> IQLGeneratorState:
+        self.call_count += 1
+        await asyncio.sleep(0.01)
+        return self.state
+
+
+def create_slow_collection(iql_generator: MockIQLGenerator, **kwargs) -> Collection:
+    class MockViewWithSlowGenerator(MockViewWithResults):
+        def get_iql_generator(self) -> MockIQLGenerator:
+            return iql_generator
+
+    collection = Collection(
+        "foo",
+        view_selector=MockViewSelector("MockViewWithSlowGenerator"),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+        **kwargs,
+    )
+    collection.add(MockViewWithSlowGenerator)
+    return collection
+
+
+async def test_ask_coalesces_identical_questions() -> None:
+    """
+    Tests that concurrent identical questions are answered by a single run of the pipeline
+    """
+    iql_generator = MockSlowIQLGenerator(
+        IQLGeneratorState(filters=IQLFiltersQuery(FunctionCall("test_filter", []), "test_filter()")),
+    )
+    collection = create_slow_collection(iql_generator, config=CollectionConfig(coalesce_requests=True))
+
+    results = await asyncio.gather(
+        collection.ask("Mock question"),
+        collection.ask(" mock QUESTION"),
+        collection.ask("Mock question", dry_run=True),
+    )
+
+    assert results[0] is results[1]
+    assert results[0].results == [{"foo": "bar"}]
+    assert results[2] is not results[0]
+    assert iql_generator.call_count == 2
+    assert not collection._coalescer.in_flight  # pylint: disable=protected-access
+
+    await collection.ask("Mock question")
+    assert iql_generator.call_count == 3
+
+
+async def test_ask_coalesced_error() -> None:
+    """
+    Tests that all callers coalesced into a failed question receive its error
+    """
+    iql_generator = MockSlowIQLGenerator(IQLGeneratorState(filters=UnsupportedQueryError()))
+    collection = create_slow_collection(iql_generator, config=CollectionConfig(coalesce_requests=True))
+
+    results = await asyncio.gather(
+        collection.ask("Mock question"),
+        collection.ask("Mock question"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ViewExecutionError) for result in results)
+    assert iql_generator.call_count == 1
+
+
+async def test_ask_timings(collection: Collection) -> None:
+    """
+    Tests that the ask method reports the latency of the pipeline stages
+    """
+    collection.add(MockViewWithResults)
+
+    result = await collection.ask("Mock question")
+
+    assert {timing.stage for timing in result.timings.stages} == {"view_selection", "query_building", "execution"}
+    assert result.timings.total("execution") >= 0
+    assert result.timings.retries("view_selection") == 0
+
+
+async def test_ask_timeout() -> None:
+    """
+    Tests that the ask method cancels the request once its timeout is exceeded
+    """
+    iql_generator = MockSlowIQLGenerator(
+        IQLGeneratorState(filters=IQLFiltersQuery(FunctionCall("test_filter", []), "test_filter()")),
+    )
+    collection = create_slow_collection(iql_generator)
+
+    with pytest.raises(RequestTimeoutError):
+        await collection.ask("Mock question", timeout=0.001)
+
+    result = await collection.ask("Mock question", timeout=1)
+    assert result.results == [{"foo": "bar"}]
+
+
+async def test_ask_admission_control() -> None:
+    """
+    Tests that the requests exceeding the concurrency limit wait in the queue and the overflow is rejected
+    """
+    iql_generator = MockSlowIQLGenerator(
+        IQLGeneratorState(filters=IQLFiltersQuery(FunctionCall("test_filter", []), "test_filter()")),
+    )
+    collection = create_slow_collection(
+        iql_generator,
+        config=CollectionConfig(admission=AdmissionConfig(max_concurrent_requests=1, max_queued_requests=1)),
+    )
+
+    results = await asyncio.gather(
+        collection.ask("Mock question"),
+        collection.ask("Mock question"),
+        collection.ask("Mock question"),
+        return_exceptions=True,
+    )
+
+    assert [result.results for result in results[:2]] == [[{"foo": "bar"}], [{"foo": "bar"}]]
+    assert isinstance(results[2], CollectionOverloadedError)
+    assert results[1].timings.total("admission") > 0
+
+    stats = collection.admission_stats()
+    assert stats.in_flight == stats.queue_depth == 0
+    assert stats.admitted == 2
+    assert stats.rejected == 1
+    assert stats.max_queue_depth == 1
+    assert stats.max_wait_time > 0
+
+
+def test_admission_control_invalid_limits() -> None:
+    """
+    Tests that the collection rejects invalid admission limits
+    """
+    with pytest.raises(ValueError):
+        config = CollectionConfig(admission=AdmissionConfig(max_concurrent_requests=0))
+        Collection("foo", MockViewSelector(""), MockLLM(), AsyncMock(), config=config)
+
+    with pytest.raises(ValueError):
+        config = CollectionConfig(admission=AdmissionConfig(max_concurrent_requests=1, max_queued_requests=-1))
+        Collection("foo", MockViewSelector(""), MockLLM(), AsyncMock(), config=config)
+
+
+async def test_ask_negative_cache_skips_failed_view() -> None:
+    """
+    Tests that the views which recently failed on the question are not asked again
+    """
+    calls = []
+
+    class MockCountingUnsupportedView(MockUnsupportedView):
+        def get_iql_generator(self) -> MockIQLGenerator:
+            calls.append(self)
+            return super().get_iql_generator()
+
+    collection = Collection(
+        "foo",
+        view_selector=MockRankingViewSelector(["MockCountingUnsupportedView", "MockViewWithResults"]),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+        config=CollectionConfig(speculative_views=2, negative_cache=NegativeCacheConfig(InMemoryCache())),
+    )
+    collection.add(MockCountingUnsupportedView)
+    collection.add(MockViewWithResults)
+
+    for _ in range(2):
+        result = await collection.ask("Mock question")
+        assert result.view_name == "MockViewWithResults"
+    assert len(calls) == 1
+
+    await collection.ask("Another mock question")
+    assert len(calls) == 2
+
+
+async def test_ask_negative_cache_without_fallback() -> None:
+    """
+    Tests that the view which recently failed on the question is asked again when there is no other candidate\
+    view and no fallback collection
+    """
+    collection = Collection(
+        "foo",
+        view_selector=MockViewSelector("MockViewWithResults"),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+        config=CollectionConfig(negative_cache=NegativeCacheConfig(InMemoryCache())),
+    )
+    collection.add(MockViewWithResults)
+    # pylint: disable=protected-access
+    await collection._negative_cache.remember("Mock question", UnsupportedQueryError(), "MockViewWithResults")
+
+    result = await collection.ask("Mock question")
+    assert result.view_name == "MockViewWithResults"
+
+
+async def test_ask_negative_cache_error() -> None:
+    """
+    Tests that the ask method answers the question when the negative cache fails
+    """
+    cache = AsyncMock()
+    cache.get.side_effect = OSError("disk is full")
+    cache.set.side_effect = OSError("disk is full")
+    collection = Collection(
+        "foo",
+        view_selector=MockRankingViewSelector(["MockUnsupportedView", "MockViewWithResults"]),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+        config=CollectionConfig(speculative_views=2, negative_cache=NegativeCacheConfig(cache)),
+    )
+    collection.add(MockUnsupportedView)
+    collection.add(MockViewWithResults)
+
+    result = await collection.ask("Mock question")
+    assert result.view_name == "MockViewWithResults"
+    assert cache.set.call_count == 1
+
+
+def test_add_lazy(collection: Collection) -> None:
+    """
+    Tests that the builder of a lazily added view is not called until the view is needed
+    """
+    builds = []
+
+    def builder():
+        builds.append(1)
+        return MockView1()
+
+    collection.add(MockViewWithAttributes, builder=builder, lazy=True)
+    assert not builds
+
+    with pytest.raises(ValueError):
+        collection.get("MockViewWithAttributes")
+    assert len(builds) == 1
+
+
+async def test_ask_pooled_views() -> None:
+    """
+    Tests that the pooled view instances are reset and reused between the requests
+    """
+    builds = []
+    resets = []
+
+    class MockResettableView(MockViewWithResults):
+        supports_reset = True
+
+        def reset(self) -> None:
+            resets.append(self)
+
+    def builder():
+        builds.append(1)
+        return MockResettableView()
+
+    collection = Collection(
+        "foo",
+        view_selector=MockViewSelector("MockResettableView"),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+        config=CollectionConfig(pool_views=True),
+    )
+    collection.add(MockResettableView, builder=builder, lazy=True)
+
+    for _ in range(2):
+        result = await collection.ask("Mock question")
+        assert result.results == [{"foo": "bar"}]
+
+    assert len(builds) == 1
+    assert len(resets) == 2
+    assert resets[0] is resets[1]
+
+
+async def test_ask_pooled_views_without_reset() -> None:
+    """
+    Tests that the instances of the views not supporting reset are not reused between the requests
+    """
+    builds = []
+
+    def builder():
+        builds.append(1)
+        return MockViewWithResults()
+
+    collection = Collection(
+        "foo",
+        view_selector=MockViewSelector("MockViewWithResults"),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[],
+        config=CollectionConfig(pool_views=True),
+    )
+    collection.add(MockViewWithResults, builder=builder, lazy=True)
+
+    for _ in range(2):
+        await collection.ask("Mock question")
+
+    assert len(builds) == 2
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Optional
 from unittest.mock import AsyncMock, Mock
 
@@ -7,12 +8,16 @@ from sqlalchemy import create_engine
 import dbally
 from dbally.audit import CLIEventHandler, EventTracker, OtelEventHandler
 from dbally.audit.event_handlers.buffer_event_handler import BufferEventHandler
-from dbally.collection import Collection, ViewExecutionResult
+from dbally.cache import InMemoryCache
+from dbally.collection import Collection, CollectionConfig, HedgingConfig, NegativeCacheConfig, ViewExecutionResult
+from dbally.collection.hedging import HedgingController
+from dbally.iql_generator.iql_generator import IQLGeneratorState
 from dbally.iql_generator.prompt import UnsupportedQueryError
 from dbally.llms import LLM
 from dbally.llms.clients import LLMOptions
 from dbally.views.freeform.text2sql import BaseText2SQLView, ColumnConfig, TableConfig
 from tests.unit.mocks import MockIQLGenerator, MockLLM, MockViewBase, MockViewSelector
+from tests.unit.test_collection import MockRankingViewSelector
 
 engine = create_engine("sqlite://", echo=True)
 
@@ -170,3 +175,120 @@ def test_get_all_event_handlers_with_duplicates():
     result = collection.get_all_event_handlers()
 
     assert set(result) == {handler1, handler2}
+
+
+class MockSlowIQLGenerator(MockIQLGenerator):
+    async def __call__(self, *_, **__) -> IQLGeneratorState:
+        await asyncio.sleep(0.01)
+        return self.state
+
+
+class MockSlowView(MockViewBase):
+    """
+    Mock slow view
+    """
+
+    def execute(self, dry_run=False) -> ViewExecutionResult:
+        return ViewExecutionResult(results=[{"foo": "bar"}], context={})
+
+    def get_iql_generator(self, *_, **__) -> MockIQLGenerator:
+        return MockSlowIQLGenerator(IQLGeneratorState())
+
+
+async def test_hedged_fallback_prefers_collection(fallback_collection: Collection):
+    event_handler = BufferEventHandler()
+    collection = Collection(
+        "foo",
+        view_selector=MockViewSelector("MockSlowView"),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        event_handlers=[event_handler],
+        fallback_collection=fallback_collection,
+        config=CollectionConfig(hedging=HedgingConfig(delay=0)),
+    )
+    collection.add(MockSlowView)
+
+    result = await collection.ask("Mock question")
+
+    assert result.results == [{"foo": "bar"}]
+    assert result.view_name == "MockSlowView"
+    assert "Hedged request" in event_handler.buffer.getvalue()
+
+
+async def test_hedged_fallback_after_failures(base_collection: Collection, fallback_collection: Collection):
+    base_collection.set_fallback(fallback_collection)
+    hedging = HedgingController(HedgingConfig(failure_rate=0.5))
+    hedging.MIN_REQUESTS = 2
+    base_collection._hedging = hedging  # pylint: disable=protected-access
+
+    for _ in range(2):
+        assert hedging.get_delay() is None
+        result = await base_collection.ask("Mock fallback question")
+        assert result.results == [{"mock_result": "fallback_result"}]
+
+    assert base_collection.failure_rate == 1.0
+    assert hedging.get_delay() == 0.0
+
+    result = await base_collection.ask("Mock fallback question")
+    assert result.results == [{"mock_result": "fallback_result"}]
+
+
+async def test_negative_cache_skips_to_fallback(fallback_collection: Collection):
+    calls = []
+
+    class MockCountingView(MockView1):
+        def get_iql_generator(self, *_, **__) -> MockIQLGenerator:
+            calls.append(self)
+            return super().get_iql_generator()
+
+    collection = Collection(
+        "foo",
+        view_selector=MockViewSelector("MockCountingView"),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        fallback_collection=fallback_collection,
+        config=CollectionConfig(negative_cache=NegativeCacheConfig(InMemoryCache())),
+    )
+    collection.add(MockCountingView)
+
+    for _ in range(2):
+        result = await collection.ask("Mock fallback question")
+        assert result.results == [{"mock_result": "fallback_result"}]
+    assert len(calls) == 1
+
+    collection.add(MockView2)
+    await collection.ask("Mock fallback question")
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("speculative_views", [1, 2])
+async def test_negative_cache_known_failures_skip_to_fallback(fallback_collection: Collection, speculative_views: int):
+    calls = []
+
+    class MockCountingView(MockView1):
+        def get_iql_generator(self, *_, **__) -> MockIQLGenerator:
+            calls.append(self)
+            return super().get_iql_generator()
+
+    class MockCountingView2(MockCountingView):
+        pass
+
+    collection = Collection(
+        "foo",
+        view_selector=MockRankingViewSelector(["MockCountingView", "MockCountingView2"]),
+        llm=MockLLM(),
+        nl_responder=AsyncMock(),
+        fallback_collection=fallback_collection,
+        config=CollectionConfig(
+            speculative_views=speculative_views, negative_cache=NegativeCacheConfig(InMemoryCache())
+        ),
+    )
+    collection.add(MockCountingView)
+    collection.add(MockCountingView2)
+    for view_name in ["MockCountingView", "MockCountingView2"]:
+        # pylint: disable=protected-access
+        await collection._negative_cache.remember("Mock fallback question", UnsupportedQueryError(), view_name)
+
+    result = await collection.ask("Mock fallback question")
+    assert result.results == [{"mock_result": "fallback_result"}]
+    assert not calls
@@ -2,7 +2,21 @@ from typing import Callable, List, Tuple
 
 import pytest
 
+from dbally.embeddings.base import EmbeddingClient
 from dbally.prompt.elements import FewShotExample
+from dbally.prompt.few_shot_selector import FewShotSelector
+from tests.unit.mocks import MockViewBase
+
+
+class MockEmbeddingClient(EmbeddingClient):
+    """Embeds texts by the presence of the words related to salaries and cities, counting the embedded texts."""
+
+    def __init__(self) -> None:
+        self.embedded: List[str] = []
+
+    async def get_embeddings(self, data: List[str]) -> List[List[float]]:
+        self.embedded.extend(data)
+        return [[float("salary" in text), float("city" in text), 0.1] for text in data]
 
 
 class TestExamples:
@@ -71,3 +85,34 @@ def test_fewshot_string() -> None:
     result = FewShotExample("question", "answer")
     assert result.answer == "answer"
     assert str(result) == "question -> answer"
+
+
+EXAMPLES = [
+    FewShotExample("Which city has the most clients?", "most_clients_city()"),
+    FewShotExample("What is the average salary?", "average_salary()"),
+    FewShotExample("Who lives in a city by the sea?", "lives_by_the_sea()"),
+    FewShotExample("Who has the highest salary?", "highest_salary()"),
+]
+
+
+async def test_fewshot_selector() -> None:
+    embedding_client = MockEmbeddingClient()
+    selector = FewShotSelector(embedding_client, top_k=2)
+
+    assert await selector.select("Which salary is the lowest?", EXAMPLES) == [EXAMPLES[1], EXAMPLES[3]]
+    assert await selector.select("In which city is the office?", EXAMPLES) == [EXAMPLES[0], EXAMPLES[2]]
+    assert len(embedding_client.embedded) == len(EXAMPLES) + 2
+
+    assert await selector.select("Any question", EXAMPLES[:2]) == EXAMPLES[:2]
+    assert len(embedding_client.embedded) == len(EXAMPLES) + 2
+
+
+async def test_view_select_few_shots() -> None:
+    class MockViewWithFewShots(MockViewBase):
+        def list_few_shots(self) -> List[FewShotExample]:
+            return EXAMPLES
+
+    assert await MockViewWithFewShots().select_few_shots("Which salary is the lowest?") == EXAMPLES
+
+    MockViewWithFewShots.few_shot_selector = FewShotSelector(MockEmbeddingClient(), top_k=1)
+    assert await MockViewWithFewShots().select_few_shots("Which salary is the lowest?") == [EXAMPLES[1]]
@@ -1,5 +1,7 @@
 # mypy: disable-error-code="empty-body"
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -7,8 +9,12 @@ import sqlalchemy
 
 from dbally import decorators
 from dbally.audit.event_tracker import EventTracker
+from dbally.cache import InMemoryCache
+from dbally.collection.results import TimingBreakdown
+from dbally.exceptions import RequestTimeoutError
 from dbally.iql import IQLAggregationQuery, IQLError, IQLFiltersQuery
-from dbally.iql_generator.iql_generator import IQLGenerator, IQLGeneratorState
+from dbally.iql_generator.iql_generator import IQLGenerator, IQLGeneratorState, IQLOperationGenerator
+from dbally.iql_generator.prompt import FILTERING_DECISION_TEMPLATE, FILTERS_GENERATION_TEMPLATE
 from dbally.views.methods_base import MethodsBaseView
 from tests.unit.mocks import MockLLM
 
@@ -101,11 +107,13 @@ async def test_iql_generation(
             source=llm_responses[1],
             allowed_functions=filters,
             event_tracker=event_tracker,
+            repair=True,
         )
         mock_aggregation_parse.assert_called_once_with(
             source=llm_responses[3],
             allowed_functions=aggregations,
             event_tracker=event_tracker,
+            repair=True,
         )
 
 
@@ -228,3 +236,201 @@ async def test_iql_generation_response_after_max_retries(
             assert f"err{i}" in arg[1]["prompt"].chat[-1]["content"]
         for i, arg in enumerate(llm.generate_text.call_args_list[7:10], start=1):
             assert f"err{i}" in arg[1]["prompt"].chat[-1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_iql_generation_timings(
+    iql_generator: IQLGenerator,
+    llm: MockLLM,
+    view: MockView,
+) -> None:
+    event_tracker = EventTracker(TimingBreakdown())
+    llm.generate_text = AsyncMock(side_effect=["decision: true", "wrong_filter", "filter_by_id(1)"])
+
+    with patch("dbally.iql.IQLFiltersQuery.parse", AsyncMock(side_effect=[IQLError("err", "src"), "filter_by_id(1)"])):
+        await iql_generator(
+            question="Mock_question",
+            filters=view.list_filters(),
+            aggregations=[],
+            examples=view.list_few_shots(),
+            llm=llm,
+            event_tracker=event_tracker,
+            n_retries=3,
+        )
+
+    summary = event_tracker.timings.summary()
+    assert summary["iql_assessment"]["calls"] == 1
+    assert summary["iql_assessment"]["retries"] == 0
+    assert summary["iql_generation"]["calls"] == 2
+    assert summary["iql_generation"]["retries"] == 1
+    assert event_tracker.timings.retries("iql_parsing") == 1
+
+
+@pytest.mark.asyncio
+async def test_iql_generation_deadline(iql_generator: IQLGenerator, view: MockView) -> None:
+    llm = MockLLM()
+    call_count = 0
+
+    async def slow_call(*_, **__) -> str:
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(1)
+        return "decision: true"
+
+    event_tracker = EventTracker(deadline=time.monotonic() + 0.01)
+    with patch.object(llm.client, "call", slow_call):
+        iql = await iql_generator(
+            question="Mock_question",
+            filters=view.list_filters(),
+            aggregations=[],
+            examples=view.list_few_shots(),
+            llm=llm,
+            event_tracker=event_tracker,
+            n_retries=3,
+        )
+
+    assert isinstance(iql.filters, RequestTimeoutError)
+    assert call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_iql_generation_single_call(llm: MockLLM, event_tracker: EventTracker, view: MockView) -> None:
+    filters = view.list_filters()
+    aggregations = view.list_aggregations()
+
+    llm.generate_text = AsyncMock(return_value='{"filters": "filter_by_id(1)", "aggregation": null}')
+    with patch("dbally.iql.IQLFiltersQuery.parse", AsyncMock(return_value="filter_by_id(1)")) as mock_filters_parse:
+        iql = await IQLGenerator(single_call=True)(
+            question="Mock_question",
+            filters=filters,
+            aggregations=aggregations,
+            examples=view.list_few_shots(),
+            llm=llm,
+            event_tracker=event_tracker,
+        )
+
+    assert iql == IQLGeneratorState(filters="filter_by_id(1)", aggregation=None)
+    assert llm.generate_text.call_count == 1
+    mock_filters_parse.assert_called_once_with(
+        source="filter_by_id(1)",
+        allowed_functions=filters,
+        event_tracker=event_tracker,
+        repair=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_iql_generation_single_call_retries(llm: MockLLM, event_tracker: EventTracker, view: MockView) -> None:
+    llm.generate_text = AsyncMock(
+        side_effect=[
+            "not a json",
+            '{"filters": "wrong_filter", "aggregation": "aggregate_by_id()"}',
+            '{"filters": "filter_by_id(1)", "aggregation": "aggregate_by_id()"}',
+        ]
+    )
+    with patch(
+        "dbally.iql.IQLFiltersQuery.parse", AsyncMock(side_effect=[IQLError("err1", "src1"), "filter_by_id(1)"])
+    ), patch("dbally.iql.IQLAggregationQuery.parse", AsyncMock(return_value="aggregate_by_id()")):
+        iql = await IQLGenerator(single_call=True)(
+            question="Mock_question",
+            filters=view.list_filters(),
+            aggregations=view.list_aggregations(),
+            examples=view.list_few_shots(),
+            llm=llm,
+            event_tracker=event_tracker,
+        )
+
+    assert iql == IQLGeneratorState(filters="filter_by_id(1)", aggregation="aggregate_by_id()")
+    assert llm.generate_text.call_count == 3
+    assert "not a valid JSON" in llm.generate_text.call_args_list[1][1]["prompt"].chat[-1]["content"]
+    assert "err1" in llm.generate_text.call_args_list[2][1]["prompt"].chat[-1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_iql_operation_speculative_generation(llm: MockLLM, event_tracker: EventTracker, view: MockView) -> None:
+    operation_generation = IQLOperationGenerator[IQLFiltersQuery](
+        FILTERING_DECISION_TEMPLATE,
+        FILTERS_GENERATION_TEMPLATE,
+        speculation_threshold=0.5,
+    )
+    operation_generation.generator = AsyncMock(return_value="filter_by_id(1)")
+    generations_started = []
+    decision = True
+
+    async def assess(**_) -> bool:
+        await asyncio.sleep(0)
+        generations_started.append(operation_generation.generator.call_count)
+        return decision
+
+    operation_generation.assessor = AsyncMock(side_effect=assess)
+
+    async def generate() -> IQLFiltersQuery:
+        return await operation_generation(
+            question="Mock_question",
+            methods=view.list_filters(),
+            examples=[],
+            llm=llm,
+            event_tracker=event_tracker,
+        )
+
+    for _ in range(IQLOperationGenerator.SPECULATION_MIN_DECISIONS):
+        assert await generate() == "filter_by_id(1)"
+    assert generations_started == list(range(IQLOperationGenerator.SPECULATION_MIN_DECISIONS))
+
+    generations_started.clear()
+    assert await generate() == "filter_by_id(1)"
+    decision = False
+    assert await generate() is None
+    assert generations_started == [11, 12]
+    assert operation_generation.positive_decision_rate == pytest.approx(11 / 12)
+
+
+@pytest.mark.asyncio
+async def test_iql_generation_cache(llm: MockLLM, event_tracker: EventTracker, view: MockView) -> None:
+    iql_generator = IQLGenerator(cache=InMemoryCache())
+    filters = view.list_filters()
+    llm.generate_text = AsyncMock(side_effect=["decision: true", "filter_by_id(1)"] * 2)
+
+    async def generate(question: str) -> IQLGeneratorState:
+        return await iql_generator(
+            question=question,
+            filters=filters,
+            aggregations=[],
+            examples=[],
+            llm=llm,
+            event_tracker=event_tracker,
+            view_name="MockView",
+        )
+
+    with patch("dbally.iql.IQLFiltersQuery.parse", AsyncMock(return_value="filter_by_id(1)")) as mock_filters_parse:
+        assert await generate("Mock question") == IQLGeneratorState(filters="filter_by_id(1)")
+        assert await generate("mock  QUESTION") == IQLGeneratorState(filters="filter_by_id(1)")
+        assert llm.generate_text.call_count == 2
+        # similarity indexes are consulted again for the cached IQL
+        assert mock_filters_parse.call_count == 2
+
+        filters[0].description = "Changed docstring"
+        await generate("Mock question")
+        assert llm.generate_text.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_iql_generation_cache_error(llm: MockLLM, event_tracker: EventTracker, view: MockView) -> None:
+    cache = AsyncMock()
+    cache.get.side_effect = OSError("disk is full")
+    cache.set.side_effect = OSError("disk is full")
+    iql_generator = IQLGenerator(cache=cache)
+    llm.generate_text = AsyncMock(side_effect=["decision: true", "filter_by_id(1)"])
+
+    with patch("dbally.iql.IQLFiltersQuery.parse", AsyncMock(return_value="filter_by_id(1)")):
+        state = await iql_generator(
+            question="Mock question",
+            filters=view.list_filters(),
+            aggregations=[],
+            examples=[],
+            llm=llm,
+            event_tracker=event_tracker,
+            view_name="MockView",
+        )
+    assert state == IQLGeneratorState(filters="filter_by_id(1)")
+    assert cache.set.call_count == 1
@@ -73,6 +73,52 @@ def test_add_few_shots(template: PromptTemplate[QuestionPromptFormat]) -> None:
     ]
 
 
+def test_format_prompt_with_few_shots(template: PromptTemplate[QuestionPromptFormat]) -> None:
+    template = template.add_few_shot_message(FewShotExample(question="Stale question?", answer_expr="Stale"))
+    examples = [FewShotExample(question="What is the capital of France?", answer_expr="Paris")]
+
+    for question in ("Example user question?", "Another user question?"):
+        formatted_prompt = template.format_prompt(QuestionPromptFormat(question=question, examples=examples))
+        assert formatted_prompt.chat == [
+            {"content": "You are a helpful assistant.", "role": "system", "is_example": False},
+            {"content": "What is the capital of France?", "role": "user", "is_example": True},
+            {"content": "Paris", "role": "assistant", "is_example": True},
+            {"content": question, "role": "user", "is_example": False},
+        ]
+
+    reformatted_prompt = formatted_prompt.format_prompt(QuestionPromptFormat(question="Unused question?"))
+    assert reformatted_prompt.chat == [
+        {"content": "You are a helpful assistant.", "role": "system", "is_example": False},
+        {"content": "Another user question?", "role": "user", "is_example": False},
+    ]
+
+
+def test_format_prompt_with_few_shots_invalid_chat_order() -> None:
+    template = PromptTemplate[QuestionPromptFormat](
+        [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": "What is the capital of Germany?", "is_example": True},
+            {"role": "assistant", "content": "Berlin"},
+            {"role": "user", "content": "{question}"},
+        ]
+    )
+    examples = [FewShotExample(question="What is the capital of France?", answer_expr="Paris")]
+
+    with pytest.raises(PromptTemplateError):
+        template.format_prompt(QuestionPromptFormat(question="Example user question?", examples=examples))
+
+
+def test_format_prompt_escaped_braces() -> None:
+    template = PromptTemplate[QuestionPromptFormat](
+        [
+            {"role": "system", "content": "Respond with {{'answer': ...}}."},
+            {"role": "user", "content": "{question}"},
+        ]
+    )
+    formatted_prompt = template.format_prompt(QuestionPromptFormat(question="Example user question?"))
+    assert formatted_prompt.chat[0]["content"] == "Respond with {'answer': ...}."
+
+
 @pytest.mark.parametrize(
     "invalid_chat",
     [
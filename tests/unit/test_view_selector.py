@@ -1,18 +1,31 @@
 # mypy: disable-error-code="empty-body"
 # pylint: disable=missing-return-doc
-from typing import Dict
+from typing import Dict, List
 from unittest.mock import AsyncMock
 
 import pytest
 
 import dbally
 from dbally.audit.event_tracker import EventTracker
+from dbally.embeddings.base import EmbeddingClient
 from dbally.llms.base import LLM
+from dbally.view_selection.embedding_view_selector import EmbeddingViewSelector
 from dbally.view_selection.llm_view_selector import LLMViewSelector
 from tests.unit.mocks import MockLLM
 from tests.unit.test_collection import MockView1, MockView2
 
 
+class MockEmbeddingClient(EmbeddingClient):
+    """Embeds texts by the presence of the digits 1 and 2, counting the embedded texts."""
+
+    def __init__(self) -> None:
+        self.embedded: List[str] = []
+
+    async def get_embeddings(self, data: List[str]) -> List[List[float]]:
+        self.embedded.extend(data)
+        return [[float("1" in text), float("2" in text)] for text in data]
+
+
 @pytest.fixture
 def llm() -> LLM:
     """Return a mock LLM client."""
@@ -35,3 +48,49 @@ async def test_view_selection(llm: LLM, views: Dict[str, str]) -> None:
     view_selector = LLMViewSelector(llm)
     view = await view_selector.select_view("Mock question?", views, event_tracker=EventTracker())
     assert view == "MockView1"
+
+
+@pytest.mark.asyncio
+async def test_views_ranking(llm: LLM, views: Dict[str, str]) -> None:
+    llm.client.call = AsyncMock(return_value="MockView2\n- MockView1\nMockView2\n")
+    view_selector = LLMViewSelector(llm)
+    ranked_views = await view_selector.rank_views("Mock question?", views, event_tracker=EventTracker(), top_k=2)
+    assert [view.name for view in ranked_views] == ["MockView2", "MockView1"]
+
+
+@pytest.mark.asyncio
+async def test_views_ranking_numbered_list(llm: LLM, views: Dict[str, str]) -> None:
+    llm.client.call = AsyncMock(return_value="1. `MockView2`\n2) MockView3\n3. MockView1\n")
+    view_selector = LLMViewSelector(llm)
+    ranked_views = await view_selector.rank_views("Mock question?", views, event_tracker=EventTracker(), top_k=2)
+    assert [view.name for view in ranked_views] == ["MockView2", "MockView1"]
+
+
+@pytest.mark.asyncio
+async def test_embedding_view_selection(views: Dict[str, str]) -> None:
+    embedding_client = MockEmbeddingClient()
+    view_selector = EmbeddingViewSelector(embedding_client)
+
+    assert await view_selector.select_view("Question 2?", views, event_tracker=EventTracker()) == "MockView2"
+    assert await view_selector.select_view("Question 1?", views, event_tracker=EventTracker()) == "MockView1"
+    assert embedding_client.embedded == ["Question 2?", "Mock view 1", "Mock view 2", "Question 1?"]
+
+
+@pytest.mark.asyncio
+async def test_embedding_view_selection_fallback(llm: LLM, views: Dict[str, str]) -> None:
+    view_selector = EmbeddingViewSelector(MockEmbeddingClient(), fallback_selector=LLMViewSelector(llm))
+
+    assert await view_selector.select_view("Question 2?", views, event_tracker=EventTracker()) == "MockView2"
+    llm.client.call.assert_not_called()
+
+    assert await view_selector.select_view("Question 1 or 2?", views, event_tracker=EventTracker()) == "MockView1"
+    llm.client.call.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_embedding_views_ranking(views: Dict[str, str]) -> None:
+    view_selector = EmbeddingViewSelector(MockEmbeddingClient())
+    ranked_views = await view_selector.rank_views("Question 2?", views, event_tracker=EventTracker(), top_k=2)
+    assert [view.name for view in ranked_views] == ["MockView2", "MockView1"]
+    assert ranked_views[0].score == pytest.approx(1.0)
+    assert ranked_views[1].score == pytest.approx(0.0)
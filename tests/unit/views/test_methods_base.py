@@ -3,11 +3,17 @@
 
 from typing import List, Literal, Tuple
 
+from typing_extensions import Annotated
+
+from dbally.cache import InMemoryCache
 from dbally.collection.results import ViewExecutionResult
+from dbally.embeddings.base import EmbeddingClient
 from dbally.iql._query import IQLAggregationQuery, IQLFiltersQuery
 from dbally.views.decorators import view_aggregation, view_filter
-from dbally.views.exposed_functions import MethodParamWithTyping
+from dbally.views.exposed_functions import ExposedFunction, MethodParamWithTyping
+from dbally.views.function_selector import FunctionSelector
 from dbally.views.methods_base import MethodsBaseView
+from tests.unit.mocks import MockSimilarityIndex
 
 
 class MockMethodsBase(MethodsBaseView):
@@ -86,3 +92,81 @@ def test_list_aggregations() -> None:
         MethodParamWithTyping("names", List[str]),
     ]
     assert str(method_qux) == "method_qux(ages: List[int], names: List[str])"
+
+
+def test_list_class_similarity_indexes() -> None:
+    """
+    Tests that the similarity indexes are listed without creating the view instance
+    """
+    index = MockSimilarityIndex("foo")
+
+    class MockMethodsBaseWithIndex(MockMethodsBase):
+        @view_filter()
+        def method_with_index(self, city: Annotated[str, index]) -> None:
+            ...
+
+    assert MockMethodsBaseWithIndex.list_class_similarity_indexes() == {
+        index: [("MockMethodsBaseWithIndex", "method_with_index", "city")]
+    }
+    assert MockMethodsBaseWithIndex.list_class_similarity_indexes() == (
+        MockMethodsBaseWithIndex().list_similarity_indexes()
+    )
+
+
+def test_list_class_similarity_indexes_custom_filters() -> None:
+    """
+    Tests that the similarity indexes of views listing filters in a custom way are not listed from the class
+    """
+
+    class MockMethodsBaseWithCustomFilters(MockMethodsBase):
+        def list_filters(self) -> List[ExposedFunction]:
+            return []
+
+    assert MockMethodsBaseWithCustomFilters.list_class_similarity_indexes() is None
+
+
+class MockEmbeddingClient(EmbeddingClient):
+    """
+    Embeds texts by the presence of the words related to cities and ages, counting the embedded texts
+    """
+
+    def __init__(self) -> None:
+        self.embedded: List[str] = []
+
+    async def get_embeddings(self, data: List[str]) -> List[List[float]]:
+        self.embedded.extend(data)
+        return [[float("cit" in text), float("age" in text), 0.1] for text in data]
+
+
+async def test_select_functions() -> None:
+    """
+    Tests that only the filters and aggregations most relevant to the question are selected
+    """
+    embedding_client = MockEmbeddingClient()
+
+    class MockMethodsBaseWithSelector(MockMethodsBase):
+        function_selector = FunctionSelector(embedding_client, top_k=1)
+
+    filters, aggregations = await MockMethodsBaseWithSelector().select_functions("Which cities have the oldest ages?")
+    assert [f.name for f in filters] == ["method_bar"]
+    assert [f.name for f in aggregations] == ["method_qux"]
+
+    await MockMethodsBaseWithSelector().select_functions("Other question")
+    assert len(embedding_client.embedded) == 6
+
+    filters, aggregations = await MockMethodsBase().select_functions("Which cities have the oldest ages?")
+    assert len(filters) == len(aggregations) == 2
+
+
+def test_iql_single_call_generator() -> None:
+    class MockSingleCallMethodsBase(MockMethodsBase):
+        iql_single_call = True
+        iql_cache = InMemoryCache()
+        iql_cache_ttl = 60.0
+
+    iql_generator = MockSingleCallMethodsBase().get_iql_generator()
+    # pylint: disable=protected-access
+    assert iql_generator._combined_generation is not None
+    assert iql_generator._cache is MockSingleCallMethodsBase.iql_cache
+    assert iql_generator.cache_ttl == 60.0
+    assert MockMethodsBase().get_iql_generator()._combined_generation is None
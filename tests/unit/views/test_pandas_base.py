@@ -3,6 +3,7 @@
 
 import pandas as pd
 
+from dbally.collection.results import RowStream
 from dbally.iql import IQLFiltersQuery
 from dbally.iql._query import IQLAggregationQuery
 from dbally.views.decorators import view_aggregation, view_filter
@@ -184,3 +185,31 @@ async def test_filters_and_aggregtion() -> None:
     assert result.context["filter_mask"].tolist() == [False, True, False, True, False]
     assert result.context["groupbys"] == "city"
     assert result.context["aggregations"] == [Aggregation(column="age", function="mean")]
+
+
+async def test_streamed_execution() -> None:
+    """
+    Test that the filtered DataFrame rows are returned lazily when the results are streamed
+    """
+    mock_view = MockDataFrameView(pd.DataFrame.from_records(MOCK_DATA))
+    mock_view.STREAM_BATCH_SIZE = 2
+    query = await IQLFiltersQuery.parse(
+        "filter_city('Berlin') or filter_city('London')",
+        allowed_functions=mock_view.list_filters(),
+    )
+    await mock_view.apply_filters(query)
+    result = mock_view.execute(stream=True)
+    assert isinstance(result.results, RowStream)
+    assert [row async for row in result.results] == MOCK_DATA_BERLIN_OR_LONDON
+
+
+async def test_reset() -> None:
+    """
+    Test that resetting the view discards the applied filters
+    """
+    mock_view = MockDataFrameView(pd.DataFrame.from_records(MOCK_DATA))
+    query = await IQLFiltersQuery.parse("filter_city('Berlin')", allowed_functions=mock_view.list_filters())
+    await mock_view.apply_filters(query)
+    mock_view.reset()
+    result = mock_view.execute()
+    assert result.results == MOCK_DATA
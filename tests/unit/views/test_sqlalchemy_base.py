@@ -4,6 +4,7 @@ import re
 
 import sqlalchemy
 
+from dbally.collection.results import RowStream
 from dbally.iql import IQLFiltersQuery
 from dbally.iql._query import IQLAggregationQuery
 from dbally.views.decorators import view_aggregation, view_filter
@@ -95,3 +96,37 @@ async def test_filter_and_aggregation_sql_generation() -> None:
     await mock_view.apply_aggregation(query)
     sql = normalize_whitespace(mock_view.execute(dry_run=True).context["sql"])
     assert sql == "SELECT 'test' AS foo, 'baz' AS anon_1 WHERE 1 AND 'hello London in 2020' GROUP BY 'baz'"
+
+
+async def test_streamed_execution() -> None:
+    """
+    Tests that the rows are fetched lazily in batches when the results are streamed
+    """
+
+    class MockNumbersView(MockSqlAlchemyView):
+        STREAM_BATCH_SIZE = 2
+
+        def get_select(self) -> sqlalchemy.Select:
+            numbers = sqlalchemy.union_all(*[sqlalchemy.select(sqlalchemy.literal(i).label("foo")) for i in range(5)])
+            return sqlalchemy.select(numbers.subquery())
+
+    mock_view = MockNumbersView(sqlalchemy.create_engine("sqlite://"))
+    result = mock_view.execute(stream=True)
+
+    assert isinstance(result.results, RowStream)
+    assert [row async for row in result.results] == [{"foo": i} for i in range(5)]
+    assert list(result.results) == []
+
+
+async def test_reset() -> None:
+    """
+    Tests that resetting the view discards the applied filters
+    """
+
+    mock_connection = sqlalchemy.create_mock_engine("postgresql://", executor=None)
+    mock_view = MockSqlAlchemyView(mock_connection.engine)
+    query = await IQLFiltersQuery.parse("method_foo(1)", allowed_functions=mock_view.list_filters())
+    await mock_view.apply_filters(query)
+    mock_view.reset()
+    sql = normalize_whitespace(mock_view.execute(dry_run=True).context["sql"])
+    assert sql == "SELECT 'test' AS foo"
@@ -66,3 +66,39 @@ async def test_text2sql_view(sample_db: Engine):
         {"id": 1, "name": "Alice", "city": "New York"},
         {"id": 3, "name": "Charlie", "city": "New York"},
     ]
+
+
+async def test_text2sql_view_streamed(sample_db: Engine):
+    llm_response = {
+        "sql": "SELECT * FROM customers WHERE city = :city",
+        "parameters": [{"name": "city", "value": "New York"}],
+    }
+    llm = MockLLM()
+    llm.client.call = AsyncMock(return_value=json.dumps(llm_response))
+
+    collection = dbally.create_collection(name="test_collection", llm=llm)
+    collection.add(SampleText2SQLView, lambda: SampleText2SQLView(sample_db))
+
+    response = await collection.ask("Show me customers from New York", stream=True)
+
+    assert response.context["sql"] == llm_response["sql"]
+    assert [row async for row in response.results] == [
+        {"id": 1, "name": "Alice", "city": "New York"},
+        {"id": 3, "name": "Charlie", "city": "New York"},
+    ]
+
+
+async def test_text2sql_view_replay(sample_db: Engine):
+    view = SampleText2SQLView(sample_db)
+    context = {
+        "sql": "SELECT * FROM customers WHERE city = :city",
+        "parameters": [{"name": "city", "value": "Los Angeles", "table": None, "column": None}],
+    }
+
+    result = await view.replay(context)
+
+    assert result.context == context
+    assert result.results == [
+        {"id": 2, "name": "Bob", "city": "Los Angeles"},
+        {"id": 4, "name": "David", "city": "Los Angeles"},
+    ]